@@ -22,4 +22,6 @@ def run() -> int:
     window = MainWindow()
     window.show()
 
-    return app.exec()
+    exit_code = app.exec()
+    window.config.flush()
+    return exit_code
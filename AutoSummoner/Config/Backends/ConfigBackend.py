@@ -0,0 +1,83 @@
+"""Module containing the ConfigBackend class."""
+from abc import ABC, abstractmethod
+from configparser import ConfigParser
+from typing import Callable
+
+from AutoSummoner.Config.ConfigChange import ConfigChange
+
+
+class ConfigBackend(ABC):
+    """Base class of the storages the configuration is loaded from and saved to."""
+
+    def __init__(self):
+        """
+        Initializes the backend load and write statistics.
+        """
+        self._statistics = {"load_calls": 0, "load_parses": 0, "writes": 0, "written_bytes": 0}
+        self.__write_error_callback: Callable[[Exception | None], None] | None = None
+
+    def set_write_error_callback(self, callback: Callable[[Exception | None], None] | None) -> None:
+        """
+        :param callback: function called from the writer thread with the exception when the configuration could not be stored,
+        and with None once it is stored again, or None to print the failures.
+        """
+        self.__write_error_callback = callback
+
+    def _report_write_error(self, error: Exception | None) -> None:
+        """
+        Reports a failure to store the configuration, or that it is stored again after a failure.
+        :param error: the exception raised while storing the configuration, or None.
+        """
+        if self.__write_error_callback is not None:
+            self.__write_error_callback(error)
+        elif error is not None:
+            print("Failed to save configuration !\n", error)
+
+    @abstractmethod
+    def load(self, config_parser: ConfigParser) -> bool:
+        """
+        Loads the stored configuration into the configuration parser.
+        :param config_parser: the configuration parser.
+        :return: True if the configuration parser was modified, False otherwise.
+        """
+
+    @abstractmethod
+    def save(self, config_parser: ConfigParser, changes: list[ConfigChange]) -> None:
+        """
+        Saves the configuration in the background.
+        :param config_parser: the configuration parser.
+        :param changes: changes made to the configuration since the last save.
+        """
+
+    def notify_external_changes(self, changes: list[ConfigChange]) -> None:
+        """
+        Called when values modified outside AutoSummoner were applied to the configuration parser without being saved.
+        :param changes: changes applied to the configuration parser.
+        """
+
+    @abstractmethod
+    def flush(self) -> None:
+        """
+        Waits until all the saved configuration is stored.
+        """
+
+    @abstractmethod
+    def has_pending_write(self) -> bool:
+        """
+        :return: True if some saved configuration is not stored yet, False otherwise.
+        """
+
+    def get_load_statistics(self) -> dict[str, int]:
+        """
+        :return: number of loads, number of times the storage was actually read and number of skipped reads.
+        """
+        return {"calls": self._statistics["load_calls"],
+                "parses": self._statistics["load_parses"],
+                "skipped": self._statistics["load_calls"] - self._statistics["load_parses"]}
+
+    def get_write_statistics(self) -> dict[str, int]:
+        """
+        :return: number of writes to the storage and number of bytes written.
+        """
+        return {"writes": self._statistics["writes"],
+                "bytes": self._statistics["written_bytes"]}
@@ -0,0 +1,31 @@
+"""
+Imports an AutoSummoner INI configuration file into a SQLite configuration database.
+Values already stored in the database are replaced by the values of the INI file.
+
+AutoSummoner uses the SQLite backend as soon as the database (config.db) exists in its directory, or when the
+AUTOSUMMONER_CONFIG_BACKEND environment variable is set to "sqlite". On its first use, an empty database is filled
+with the content of config.ini automatically, this command is only needed to import an INI file again later.
+
+Usage, from the directory AutoSummoner runs in (the repository root) :
+    python -m AutoSummoner.Config.Backends.ImportIniConfig
+    python -m AutoSummoner.Config.Backends.ImportIniConfig config.ini config.db
+"""
+import argparse
+
+from AutoSummoner.Config.Backends.SqliteConfigBackend import SqliteConfigBackend
+from AutoSummoner.Config.Configuration import Configuration
+
+
+def main() -> None:
+    """
+    Imports the INI configuration file given on the command line.
+    """
+    argument_parser = argparse.ArgumentParser(description="Imports an AutoSummoner INI configuration file into a SQLite configuration database.")
+    argument_parser.add_argument("ini_path", nargs="?", default=Configuration.INI_PATH, help="path of the INI configuration file")
+    argument_parser.add_argument("database_path", nargs="?", default=Configuration.SQLITE_PATH, help="path of the SQLite configuration database")
+    arguments = argument_parser.parse_args()
+    SqliteConfigBackend(arguments.database_path).import_ini(arguments.ini_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""Module containing the IniConfigBackend class."""
+import hashlib
+import os
+import tempfile
+from collections import deque
+from configparser import ConfigParser
+
+from AutoSummoner.Config.Backends.ConfigBackend import ConfigBackend
+from AutoSummoner.Config.ConfigChange import ConfigChange
+from AutoSummoner.Config.ConfigWriter import ConfigWriter
+
+
+class IniConfigBackend(ConfigBackend):
+    """Backend storing the configuration in an INI file."""
+
+    WRITTEN_HASHES_KEPT = 16
+
+    def __init__(self, path: str):
+        """
+        Initializes the INI backend.
+        :param path: path of the INI file.
+        """
+        super().__init__()
+        self.__path = path
+        self.__writer = ConfigWriter(self.__write_file, error_function=self._report_write_error)
+        self.__file_signature: tuple[int, int, int] | None = None
+        self.__file_hash: bytes | None = None
+        self.__written_hashes: deque[bytes] = deque(maxlen=self.WRITTEN_HASHES_KEPT)
+        self.__rendered_sections: dict[str, str] = {}
+
+    def get_path(self) -> str:
+        """
+        :return: path of the INI file.
+        """
+        return self.__path
+
+    def is_own_content(self, content_hash: bytes) -> bool:
+        """
+        Several contents can be written before the file is read again, so the hashes of the last written contents are kept.
+        :param content_hash: SHA-256 hash of a content of the INI file.
+        :return: True if the content is one of the last contents written by AutoSummoner, False otherwise.
+        """
+        return content_hash in self.__written_hashes
+
+    def load(self, config_parser: ConfigParser) -> bool:
+        """
+        Loads the INI file into the configuration parser.
+        Does nothing while a save is still pending, as the configuration in memory is then newer than the file.
+        The file is only parsed when its stat signature and its content hash changed since it was last loaded or saved.
+        :param config_parser: the configuration parser.
+        :return: True if the configuration parser was modified, False otherwise.
+        """
+        self._statistics["load_calls"] += 1
+        if self.__writer.has_pending_write():
+            return False
+
+        try:
+            stat = os.stat(self.__path)
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            if signature == self.__file_signature:
+                return False
+            with open(self.__path, 'rb') as config_file:
+                content = config_file.read()
+        except OSError:
+            return False
+
+        self.__file_signature = signature
+        content_hash = hashlib.sha256(content).digest()
+        if content_hash == self.__file_hash or self.is_own_content(content_hash):
+            self.__file_hash = content_hash
+            return False
+
+        self.__file_hash = content_hash
+        config_parser.read_string(content.decode("utf-8"), source=self.__path)
+        self.__rendered_sections.clear()
+        self._statistics["load_parses"] += 1
+        return True
+
+    def save(self, config_parser: ConfigParser, changes: list[ConfigChange]) -> None:
+        """
+        Renders the changed sections and schedules the writing of the INI file.
+        The other sections are rendered once and then reused until they change, the default section is always rendered.
+        :param config_parser: the configuration parser.
+        :param changes: changes made to the configuration since the last save.
+        """
+        changed_sections = {change.section for change in changes}
+        rendered_sections = {}
+        for section in config_parser.sections():
+            rendered_section = self.__rendered_sections.get(section)
+            if rendered_section is None or section in changed_sections:
+                rendered_section = self.__render_section(section, self.__get_section_options(config_parser, section))
+            rendered_sections[section] = rendered_section
+        self.__rendered_sections = rendered_sections
+
+        default_options = config_parser.defaults()
+        rendered_default_section = [self.__render_section(config_parser.default_section, default_options)] if default_options else []
+        self.__writer.schedule(rendered_default_section + list(rendered_sections.values()))
+
+    def notify_external_changes(self, changes: list[ConfigChange]) -> None:
+        """
+        Forgets the rendering of the sections modified outside AutoSummoner.
+        :param changes: changes applied to the configuration parser.
+        """
+        for change in changes:
+            self.__rendered_sections.pop(change.section, None)
+
+    def flush(self) -> None:
+        """
+        Waits until the INI file is written.
+        """
+        self.__writer.flush()
+
+    def has_pending_write(self) -> bool:
+        """
+        :return: True if some saved configuration is not written to the INI file yet, False otherwise.
+        """
+        return self.__writer.has_pending_write()
+
+    @staticmethod
+    def __get_section_options(config_parser: ConfigParser, section: str) -> dict[str, str]:
+        """
+        :param config_parser: the configuration parser.
+        :param section: name of a section.
+        :return: the options defined in the section itself, without the options inherited from the default section.
+        """
+        # ConfigParser.items and SectionProxy also return the options of the default section, like ConfigParser.write
+        # the options of the section itself are read from the parser sections
+        return config_parser._sections[section]  # pylint: disable=protected-access
+
+    @staticmethod
+    def __render_section(section: str, options: dict[str, str]) -> str:
+        """
+        Renders a section the same way ConfigParser.write does.
+        :param section: name of the section.
+        :param options: raw values of the options of the section, by key.
+        :return: the text of the section in the INI file.
+        """
+        lines = [f"[{section}]\n"]
+        for key, value in options.items():
+            if value is None:
+                lines.append(f"{key}\n")
+            else:
+                value = str(value).replace("\n", "\n\t")
+                lines.append(f"{key} = {value}\n")
+        lines.append("\n")
+        return "".join(lines)
+
+    def __write_file(self, rendered_sections: list[str]) -> None:
+        """
+        Writes the sections to a temporary file and then replaces the INI file with it,
+        so that the INI file is never left half-written.
+        :param rendered_sections: text of all the sections of the INI file.
+        """
+        encoded_content = "".join(rendered_sections).encode("utf-8")
+        self.__written_hashes.append(hashlib.sha256(encoded_content).digest())
+        directory = os.path.dirname(os.path.abspath(self.__path))
+        file_descriptor, temporary_path = tempfile.mkstemp(prefix=".config-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(file_descriptor, "wb") as temporary_file:
+                temporary_file.write(encoded_content)
+                temporary_file.flush()
+                os.fsync(temporary_file.fileno())
+            os.replace(temporary_path, self.__path)
+            self._statistics["writes"] += 1
+            self._statistics["written_bytes"] += len(encoded_content)
+        except OSError:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
@@ -0,0 +1,336 @@
+"""Module containing the SqliteConfigBackend class."""
+import re
+import sqlite3
+import threading
+from configparser import ConfigParser
+
+from AutoSummoner.Config.Backends.ConfigBackend import ConfigBackend
+from AutoSummoner.Config.ConfigChange import ConfigChange
+from AutoSummoner.Config.ConfigWriter import ConfigWriter
+from AutoSummoner.Config.MainFeatures import MainFeatures
+
+
+class SqliteConfigBackend(ConfigBackend):
+    """
+    Backend storing the configuration in a SQLite database (WAL mode).
+    Auto champion select profiles, their per-champion summoner spells and their per-champion runes are stored in
+    dedicated tables, so that changing one of them only updates a single row.
+    Saves read the final value of the changed sections and keys, the rows are written from these values in the background.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS settings (
+            section TEXT NOT NULL,
+            key TEXT NOT NULL,
+            value TEXT NOT NULL,
+            PRIMARY KEY (section, key)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS profiles (
+            profile_id INTEGER PRIMARY KEY
+        );
+        CREATE TABLE IF NOT EXISTS profile_settings (
+            profile_id INTEGER NOT NULL REFERENCES profiles (profile_id) ON DELETE CASCADE,
+            key TEXT NOT NULL,
+            value TEXT NOT NULL,
+            PRIMARY KEY (profile_id, key)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS champion_summoner_spells (
+            profile_id INTEGER NOT NULL REFERENCES profiles (profile_id) ON DELETE CASCADE,
+            champion_id INTEGER NOT NULL,
+            summoner_spell_1 INTEGER,
+            summoner_spell_2 INTEGER,
+            PRIMARY KEY (profile_id, champion_id)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS champion_runes (
+            profile_id INTEGER NOT NULL REFERENCES profiles (profile_id) ON DELETE CASCADE,
+            champion_id INTEGER NOT NULL,
+            rune_id INTEGER NOT NULL,
+            PRIMARY KEY (profile_id, champion_id)
+        ) WITHOUT ROWID;
+    """
+
+    PROFILE_SECTION_PATTERN = re.compile(re.escape(MainFeatures.AUTO_CHAMPION_SELECT.value) + r"\.(\d+)")
+    SUMMONER_SPELL_KEY_PATTERN = re.compile(r"summoner_spell_[12]_(\d+)")
+    RUNE_KEY_PATTERN = re.compile(r"rune_(\d+)")
+
+    def __init__(self, path: str):
+        """
+        Initializes the SQLite backend, creating the database tables if needed.
+        :param path: path of the SQLite database.
+        """
+        super().__init__()
+        self.__path = path
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        with self.__lock:
+            self.__connection.execute("PRAGMA journal_mode=WAL")
+            self.__connection.execute("PRAGMA synchronous=NORMAL")
+            self.__connection.execute("PRAGMA foreign_keys=ON")
+            self.__connection.executescript(self.SCHEMA)
+        self.__data_version = None
+        self.__writer = ConfigWriter(self.__write_updates, merge_function=self.__merge_updates,
+                                     error_function=self._report_write_error)
+
+    def get_path(self) -> str:
+        """
+        :return: path of the SQLite database.
+        """
+        return self.__path
+
+    def is_empty(self) -> bool:
+        """
+        :return: True if the database does not contain any configuration yet, False otherwise.
+        """
+        with self.__lock:
+            settings_count = self.__connection.execute("SELECT COUNT(*) FROM settings").fetchone()[0]
+            profiles_count = self.__connection.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+        return settings_count == 0 and profiles_count == 0
+
+    def load(self, config_parser: ConfigParser) -> bool:
+        """
+        Loads the database into the configuration parser, values and profiles deleted from the database are removed.
+        Does nothing while a save is still pending or when the database was not modified by another connection.
+        :param config_parser: the configuration parser.
+        :return: True if the configuration parser was modified, False otherwise.
+        """
+        self._statistics["load_calls"] += 1
+        if self.__writer.has_pending_write():
+            return False
+
+        content = self.__read_content()
+        if content is None:
+            return False
+
+        for section in config_parser.sections():
+            values = content.get(section)
+            if values is None and self.PROFILE_SECTION_PATTERN.fullmatch(section) is not None:
+                config_parser.remove_section(section)
+                continue
+            for key in config_parser.options(section):
+                if values is None or key not in values:
+                    config_parser.remove_option(section, key)
+
+        for section, values in content.items():
+            if not config_parser.has_section(section):
+                config_parser.add_section(section)
+            for key, value in values.items():
+                config_parser.set(section, key, value)
+
+        self._statistics["load_parses"] += 1
+        return True
+
+    def __read_content(self) -> dict[str, dict[str, str]] | None:
+        """
+        :return: the content of the database by section and key, or None if it was not modified by another connection
+        since it was last read.
+        """
+        content: dict[str, dict[str, str]] = {}
+        with self.__lock:
+            data_version = self.__connection.execute("PRAGMA data_version").fetchone()[0]
+            if data_version == self.__data_version:
+                return None
+            self.__data_version = data_version
+            for section, key, value in self.__connection.execute("SELECT section, key, value FROM settings"):
+                content.setdefault(section, {})[key] = value
+            for (profile_id,) in self.__connection.execute("SELECT profile_id FROM profiles ORDER BY profile_id"):
+                content[self.__get_profile_section(profile_id)] = {}
+            for profile_id, key, value in self.__connection.execute("SELECT profile_id, key, value FROM profile_settings JOIN profiles USING (profile_id)"):
+                content[self.__get_profile_section(profile_id)][key] = value
+            for profile_id, champion_id, summoner_spell_1, summoner_spell_2 in self.__connection.execute(
+                    "SELECT profile_id, champion_id, summoner_spell_1, summoner_spell_2 "
+                    "FROM champion_summoner_spells JOIN profiles USING (profile_id)"):
+                if summoner_spell_1 is not None:
+                    content[self.__get_profile_section(profile_id)][f"summoner_spell_1_{champion_id}"] = str(summoner_spell_1)
+                if summoner_spell_2 is not None:
+                    content[self.__get_profile_section(profile_id)][f"summoner_spell_2_{champion_id}"] = str(summoner_spell_2)
+            for profile_id, champion_id, rune_id in self.__connection.execute("SELECT profile_id, champion_id, rune_id FROM champion_runes JOIN profiles USING (profile_id)"):
+                content[self.__get_profile_section(profile_id)][f"rune_{champion_id}"] = str(rune_id)
+        return content
+
+    def save(self, config_parser: ConfigParser, changes: list[ConfigChange]) -> None:
+        """
+        Reads the current value of the changed sections and keys and schedules their storage.
+        :param config_parser: the configuration parser.
+        :param changes: changes made to the configuration since the last save.
+        """
+        changed_keys: dict[str, set[str] | None] = {}
+        for change in changes:
+            if change.key is None:
+                changed_keys[change.section] = None
+            elif changed_keys.get(change.section, set()) is not None:
+                changed_keys.setdefault(change.section, set()).add(change.key)
+
+        updates = {section: self.__get_section_update(config_parser, section, keys) for section, keys in changed_keys.items()}
+        if len(updates) > 0:
+            self.__writer.schedule(updates)
+
+    def flush(self) -> None:
+        """
+        Waits until all the row updates are committed.
+        """
+        self.__writer.flush()
+
+    def has_pending_write(self) -> bool:
+        """
+        :return: True if some row updates are not committed yet, False otherwise.
+        """
+        return self.__writer.has_pending_write()
+
+    def import_ini(self, ini_path: str) -> None:
+        """
+        Imports an INI configuration file into the database, in a single transaction.
+        Values already stored in the database are replaced by the values of the INI file.
+        :param ini_path: path of the INI configuration file.
+        """
+        config_parser = ConfigParser()
+        with open(ini_path, encoding="utf-8") as ini_file:
+            config_parser.read_file(ini_file)
+
+        operations = []
+        for section in config_parser.sections():
+            _, values = self.__get_section_update(config_parser, section, None)
+            operations += self.__get_operations(section, False, values)
+        self.__execute(operations)
+
+    @classmethod
+    def __get_section_update(cls, config_parser: ConfigParser, section: str, keys: set[str] | None) -> tuple[bool, dict[str, str | None] | None]:
+        """
+        :param config_parser: the configuration parser.
+        :param section: a changed section.
+        :param keys: changed keys of the section, or None if the whole section was added or removed.
+        :return: True if the stored section must be replaced, False if only the given values must be stored,
+        and the current values of the section by key (None for removed keys), or None if the section was removed.
+        """
+        if not config_parser.has_section(section):
+            return True, None
+        if keys is None:
+            return True, {key: config_parser.get(section, key, raw=True) for key in config_parser.options(section)}
+
+        # Both summoner spells of a champion are stored in the same row
+        for key in list(keys):
+            summoner_spell_match = cls.SUMMONER_SPELL_KEY_PATTERN.fullmatch(key)
+            if summoner_spell_match is not None:
+                keys.update(f"summoner_spell_{index}_{summoner_spell_match.group(1)}" for index in (1, 2))
+        return False, {key: config_parser.get(section, key, raw=True, fallback=None) for key in keys}
+
+    @staticmethod
+    def __merge_updates(pending_updates: dict, new_updates: dict) -> dict:
+        """
+        Merges newly scheduled section updates into the pending ones, keeping only the latest value of each key.
+        A section which is replaced or removed discards the pending values of the section.
+        :param pending_updates: section updates not committed yet, by section.
+        :param new_updates: newly scheduled section updates, by section.
+        :return: the merged section updates, by section.
+        """
+        for section, (replace, values) in new_updates.items():
+            pending_update = pending_updates.pop(section, None)
+            if pending_update is not None and not replace:
+                pending_replace, pending_values = pending_update
+                replace = pending_replace
+                values = {**(pending_values if pending_values is not None else {}), **values}
+            pending_updates[section] = (replace, values)
+        return pending_updates
+
+    def __write_updates(self, updates: dict) -> None:
+        """
+        Commits the section updates in a single transaction, called from the writer thread.
+        :param updates: section updates, by section.
+        """
+        self.__execute([operation for section, (replace, values) in updates.items()
+                        for operation in self.__get_operations(section, replace, values)])
+
+    def __execute(self, operations: list[tuple[str, tuple]]) -> None:
+        """
+        Executes SQL statements in a single transaction.
+        :param operations: list of SQL statements and their parameters.
+        """
+        with self.__lock:
+            self.__connection.execute("BEGIN")
+            try:
+                for statement, parameters in operations:
+                    self.__connection.execute(statement, parameters)
+            except sqlite3.Error:
+                self.__connection.execute("ROLLBACK")
+                raise
+            self.__connection.execute("COMMIT")
+            self._statistics["writes"] += 1
+            self._statistics["written_bytes"] += sum(len(str(parameter).encode("utf-8")) for _, parameters in operations for parameter in parameters)
+
+    def __get_operations(self, section: str, replace: bool, values: dict[str, str | None] | None) -> list[tuple[str, tuple]]:
+        """
+        :param section: a changed section.
+        :param replace: True to delete the stored section before storing the values, False to only store the values.
+        :param values: values of the section by key (None to delete a key), or None if the section was removed.
+        :return: the SQL statements storing the section.
+        """
+        profile_match = self.PROFILE_SECTION_PATTERN.fullmatch(section)
+        if profile_match is None:
+            operations = [("DELETE FROM settings WHERE section = ?", (section,))] if replace else []
+            for key, value in (values if values is not None else {}).items():
+                if value is None:
+                    operations.append(("DELETE FROM settings WHERE section = ? AND key = ?", (section, key)))
+                else:
+                    operations.append(("INSERT OR REPLACE INTO settings (section, key, value) VALUES (?, ?, ?)", (section, key, value)))
+            return operations
+
+        profile_id = int(profile_match.group(1))
+        operations = [("DELETE FROM profiles WHERE profile_id = ?", (profile_id,))] if replace else []
+        if values is None:
+            return operations
+        operations.append(("INSERT OR IGNORE INTO profiles (profile_id) VALUES (?)", (profile_id,)))
+        for key in values:
+            operation = self.__get_profile_operation(profile_id, key, values)
+            if operation is not None:
+                operations.append(operation)
+        return operations
+
+    def __get_profile_operation(self, profile_id: int, key: str, values: dict[str, str | None]) -> tuple[str, tuple] | None:
+        """
+        :param profile_id: id of an auto champion select profile.
+        :param key: a changed key of the profile.
+        :param values: values of the profile by key (None for removed keys).
+        :return: the SQL statement storing the value of the key, or None if it is stored by the statement of another key.
+        """
+        summoner_spell_match = self.SUMMONER_SPELL_KEY_PATTERN.fullmatch(key)
+        rune_match = self.RUNE_KEY_PATTERN.fullmatch(key)
+        if summoner_spell_match is not None:
+            champion_id = int(summoner_spell_match.group(1))
+            summoner_spell_1_key = f"summoner_spell_1_{champion_id}"
+            if key != summoner_spell_1_key and summoner_spell_1_key in values:
+                return None
+            return self.__get_summoner_spells_operation(profile_id, champion_id, values)
+
+        if rune_match is not None:
+            champion_id = int(rune_match.group(1))
+            if values[key] is None:
+                return ("DELETE FROM champion_runes WHERE profile_id = ? AND champion_id = ?", (profile_id, champion_id))
+            return ("INSERT OR REPLACE INTO champion_runes (profile_id, champion_id, rune_id) VALUES (?, ?, ?)",
+                    (profile_id, champion_id, values[key]))
+
+        if values[key] is None:
+            return ("DELETE FROM profile_settings WHERE profile_id = ? AND key = ?", (profile_id, key))
+        return ("INSERT OR REPLACE INTO profile_settings (profile_id, key, value) VALUES (?, ?, ?)", (profile_id, key, values[key]))
+
+    @staticmethod
+    def __get_summoner_spells_operation(profile_id: int, champion_id: int, values: dict[str, str | None]) -> tuple[str, tuple]:
+        """
+        :param profile_id: id of an auto champion select profile.
+        :param champion_id: id of a champion.
+        :param values: values of the profile by key (None for removed keys).
+        :return: the SQL statement storing both summoner spells of the champion.
+        """
+        summoner_spell_1 = values.get(f"summoner_spell_1_{champion_id}")
+        summoner_spell_2 = values.get(f"summoner_spell_2_{champion_id}")
+        if summoner_spell_1 is None and summoner_spell_2 is None:
+            return ("DELETE FROM champion_summoner_spells WHERE profile_id = ? AND champion_id = ?", (profile_id, champion_id))
+        return ("INSERT OR REPLACE INTO champion_summoner_spells "
+                "(profile_id, champion_id, summoner_spell_1, summoner_spell_2) VALUES (?, ?, ?, ?)",
+                (profile_id, champion_id, summoner_spell_1, summoner_spell_2))
+
+    @staticmethod
+    def __get_profile_section(profile_id: int) -> str:
+        """
+        :param profile_id: id of an auto champion select profile.
+        :return: the configuration section of the profile.
+        """
+        return MainFeatures.AUTO_CHAMPION_SELECT.value + "." + str(profile_id)
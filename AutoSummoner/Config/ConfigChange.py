@@ -0,0 +1,13 @@
+"""Module containing the ConfigChange class."""
+from typing import NamedTuple
+
+
+class ConfigChange(NamedTuple):
+    """
+    Class representing a change of the configuration.
+    The key is None when the whole section was added or removed.
+    External changes come from modifications of the configuration storage made outside AutoSummoner.
+    """
+    section: str
+    key: str | None = None
+    external: bool = False
@@ -0,0 +1,210 @@
+"""Module containing the ConfigFileWatcher class."""
+import configparser
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable
+
+from AutoSummoner.Config.ConfigChange import ConfigChange
+
+
+class ConfigFileWatcher:
+    """
+    Class watching the configuration file for external modifications, in a background thread.
+    Uses inotify on Linux and falls back to polling the file stat signature elsewhere.
+    Modified files are parsed and compared with their previous content in the background thread,
+    only the changed sections and keys are reported.
+    """
+    # pylint: disable=too-many-instance-attributes
+    # The watcher thread keeps its settings and the last content it read, to only report what changed
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    INOTIFY_EVENT_HEADER = struct.Struct("iIII")
+
+    DEFAULT_POLL_INTERVAL = 1.0
+    SETTLE_DELAY = 0.05
+
+    def __init__(self, path: str, callback: Callable[[dict[str, dict[str, str]], list[ConfigChange]], None],
+                 is_own_content: Callable[[bytes], bool] = None, poll_interval: float = DEFAULT_POLL_INTERVAL):
+        """
+        Initializes the configuration file watcher.
+        :param path: path of the configuration file.
+        :param callback: function called from the watcher thread with the new content of the file and the list of changes.
+        :param is_own_content: function telling if the content with the given SHA-256 hash was written by AutoSummoner itself,
+        such content is not reported as an external modification.
+        :param poll_interval: interval (in seconds) between two checks when inotify is not available.
+        """
+        self.__path = os.path.abspath(path)
+        self.__callback = callback
+        self.__is_own_content = is_own_content
+        self.__poll_interval = poll_interval
+        self.__stop_event = threading.Event()
+        self.__thread = None
+        self.__content: dict[str, dict[str, str]] = {}
+        self.__content_hash = None
+
+    def start(self) -> None:
+        """
+        Starts watching the configuration file.
+        """
+        if self.__thread is not None:
+            return
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(target=self.__run, name="ConfigFileWatcher", daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops watching the configuration file.
+        """
+        self.__stop_event.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def __run(self) -> None:
+        """
+        Watcher thread.
+        """
+        self.__check_file(report=False)
+        inotify_file_descriptor = self.__create_inotify()
+        if inotify_file_descriptor is None:
+            self.__poll()
+        else:
+            try:
+                self.__watch_inotify(inotify_file_descriptor)
+            finally:
+                os.close(inotify_file_descriptor)
+
+    def __create_inotify(self) -> int | None:
+        """
+        :return: an inotify file descriptor watching the directory of the configuration file, or None if inotify is not available.
+        """
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            file_descriptor = libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        except (OSError, AttributeError):
+            return None
+        if file_descriptor < 0:
+            return None
+
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_FROM | self.IN_MOVED_TO | self.IN_CREATE | self.IN_DELETE
+        if libc.inotify_add_watch(file_descriptor, os.path.dirname(self.__path).encode(), mask) < 0:
+            os.close(file_descriptor)
+            return None
+        return file_descriptor
+
+    def __watch_inotify(self, file_descriptor: int) -> None:
+        """
+        Waits for inotify events on the configuration file until the watcher is stopped.
+        :param file_descriptor: inotify file descriptor.
+        """
+        file_name = os.path.basename(self.__path).encode()
+        while not self.__stop_event.is_set():
+            readable, _, _ = select.select([file_descriptor], [], [], self.__poll_interval)
+            if len(readable) == 0:
+                continue
+
+            file_changed = False
+            while True:
+                try:
+                    events = os.read(file_descriptor, 4096)
+                except BlockingIOError:
+                    break
+                offset = 0
+                while offset < len(events):
+                    _, _, _, name_length = self.INOTIFY_EVENT_HEADER.unpack_from(events, offset)
+                    offset += self.INOTIFY_EVENT_HEADER.size
+                    name = events[offset:offset + name_length].rstrip(b"\0")
+                    offset += name_length
+                    file_changed = file_changed or name == file_name
+
+                # Editors often write a file in several steps, wait for it to settle before reading it
+                time.sleep(self.SETTLE_DELAY)
+
+            if file_changed:
+                self.__check_file(report=True)
+
+    def __poll(self) -> None:
+        """
+        Checks the stat signature of the configuration file regularly until the watcher is stopped.
+        """
+        last_signature = self.__get_signature()
+        while not self.__stop_event.wait(self.__poll_interval):
+            signature = self.__get_signature()
+            if signature != last_signature:
+                last_signature = signature
+                self.__check_file(report=True)
+
+    def __get_signature(self) -> tuple[int, int, int] | None:
+        """
+        :return: the stat signature of the configuration file, or None if it does not exist.
+        """
+        try:
+            stat = os.stat(self.__path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def __check_file(self, report: bool) -> None:
+        """
+        Reads and parses the configuration file if its content changed, and reports the changes.
+        :param report: True to call the callback with the changes, False to only remember the current content.
+        """
+        try:
+            with open(self.__path, 'rb') as config_file:
+                raw_content = config_file.read()
+        except OSError:
+            return
+
+        content_hash = hashlib.sha256(raw_content).digest()
+        if content_hash == self.__content_hash:
+            return
+
+        config_parser = configparser.ConfigParser()
+        try:
+            config_parser.read_string(raw_content.decode("utf-8"), source=self.__path)
+        except (configparser.Error, UnicodeDecodeError) as e:
+            print("Failed to parse modified configuration file !\n", e)
+            return
+
+        content = {section: {key: config_parser.get(section, key, raw=True) for key in config_parser.options(section)}
+                   for section in config_parser.sections()}
+        changes = self.get_changes(self.__content, content)
+        self.__content = content
+        self.__content_hash = content_hash
+
+        own_content = self.__is_own_content is not None and self.__is_own_content(content_hash)
+        if report and not own_content and len(changes) > 0:
+            self.__callback(content, changes)
+
+    @staticmethod
+    def get_changes(previous_content: dict[str, dict[str, str]], content: dict[str, dict[str, str]]) -> list[ConfigChange]:
+        """
+        :param previous_content: previous content of the configuration, by section and key.
+        :param content: new content of the configuration, by section and key.
+        :return: the list of sections added or removed and of keys added, modified or removed.
+        """
+        changes = []
+        for section, values in content.items():
+            previous_values = previous_content.get(section)
+            if previous_values is None:
+                changes.append(ConfigChange(section))
+                previous_values = {}
+            changes += [ConfigChange(section, key) for key, value in values.items() if previous_values.get(key) != value]
+            changes += [ConfigChange(section, key) for key in previous_values if key not in values]
+        changes += [ConfigChange(section) for section in previous_content if section not in content]
+        return changes
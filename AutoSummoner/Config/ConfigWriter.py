@@ -0,0 +1,159 @@
+"""Module containing the ConfigWriter class."""
+import atexit
+import threading
+import time
+from typing import Any, Callable
+
+
+class ConfigWriter:
+    """
+    Class running the writes of a configuration backend in a background thread, coalescing successive saves.
+    Content which failed to be written stays pending and is written again after the maximum delay, or on flush.
+    """
+    # pylint: disable=too-many-instance-attributes
+    # The timing state of the writer thread is kept in attributes protected by the same condition
+
+    DEFAULT_DEBOUNCE_DELAY = 0.25
+    DEFAULT_MAX_DELAY = 2.0
+
+    def __init__(self, write_function: Callable[[Any], None], merge_function: Callable[[Any, Any], Any] = None,
+                 error_function: Callable[[Exception | None], None] = None,
+                 debounce_delay: float = DEFAULT_DEBOUNCE_DELAY, max_delay: float = DEFAULT_MAX_DELAY):
+        """
+        Initializes the configuration writer.
+        :param write_function: function writing the scheduled content, called from the writer thread.
+        :param merge_function: function merging the pending content with newly scheduled content,
+        by default the newly scheduled content replaces the pending content.
+        :param error_function: function called from the writer thread with the exception when a write fails,
+        and with None when the content is written again after a failure.
+        :param debounce_delay: delay (in seconds) without any new save before the content is written.
+        :param max_delay: maximum delay (in seconds) a save can be postponed by successive saves,
+        and delay before a failed write is retried.
+        """
+        self.__write_function = write_function
+        self.__merge_function = merge_function
+        self.__error_function = error_function
+        self.__debounce_delay = debounce_delay
+        self.__max_delay = max_delay
+        self.__condition = threading.Condition()
+        self.__thread = None
+        self.__pending_content = None
+        self.__pending_since = 0.0
+        self.__last_schedule_time = 0.0
+        self.__writing = False
+        self.__flush_requested = False
+        self.__write_attempts = 0
+        self.__failed_write_attempt = 0
+        self.__retry_time = 0.0
+
+    def schedule(self, content: Any) -> None:
+        """
+        Schedules the writing of the content, merged with any content which was not written yet.
+        :param content: content to write.
+        """
+        with self.__condition:
+            now = time.monotonic()
+            if self.__pending_content is None:
+                self.__pending_since = now
+                self.__pending_content = content
+            elif self.__merge_function is not None:
+                self.__pending_content = self.__merge_function(self.__pending_content, content)
+            else:
+                self.__pending_content = content
+            self.__last_schedule_time = now
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__run, name="ConfigWriter", daemon=True)
+                self.__thread.start()
+                atexit.register(self.flush)
+            self.__condition.notify_all()
+
+    def has_pending_write(self) -> bool:
+        """
+        :return: True if some content was scheduled but is not written yet, False otherwise.
+        """
+        with self.__condition:
+            return self.__pending_content is not None or self.__writing
+
+    def flush(self) -> None:
+        """
+        Writes the pending content immediately and waits until it is written, or until writing it failed.
+        """
+        with self.__condition:
+            if self.__pending_content is None and not self.__writing:
+                return
+            write_attempts = self.__write_attempts
+            while (self.__pending_content is not None or self.__writing) and \
+                    (self.__writing or self.__failed_write_attempt <= write_attempts):
+                # Requested again after a failed write which started before the flush
+                if not self.__flush_requested:
+                    self.__flush_requested = True
+                    self.__condition.notify_all()
+                self.__condition.wait()
+
+    def __run(self) -> None:
+        """
+        Writer thread, writes the pending content once no save happened during the debounce delay.
+        """
+        while True:
+            with self.__condition:
+                while self.__pending_content is None:
+                    self.__condition.wait()
+
+                while not self.__flush_requested:
+                    now = time.monotonic()
+                    remaining = max(min(self.__last_schedule_time + self.__debounce_delay,
+                                        self.__pending_since + self.__max_delay),
+                                    self.__retry_time) - now
+                    if remaining <= 0:
+                        break
+                    self.__condition.wait(remaining)
+
+                content = self.__pending_content
+                self.__pending_content = None
+                self.__writing = True
+                self.__write_attempts += 1
+
+            try:
+                self.__write_function(content)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self.__on_write_failed(content, e)
+            else:
+                self.__on_write_succeeded()
+
+    def __on_write_succeeded(self) -> None:
+        """
+        Ends a successful write, and reports that the configuration is saved again if the previous write failed.
+        """
+        with self.__condition:
+            recovered = self.__retry_time > 0
+            self.__retry_time = 0.0
+            self.__writing = False
+            if self.__pending_content is None:
+                self.__flush_requested = False
+            self.__condition.notify_all()
+        if recovered and self.__error_function is not None:
+            self.__error_function(None)
+
+    def __on_write_failed(self, content: Any, error: Exception) -> None:
+        """
+        Puts the content which failed to be written back in the pending content, to write it again after the maximum delay.
+        :param content: the content which failed to be written.
+        :param error: the exception raised by the write function.
+        """
+        with self.__condition:
+            now = time.monotonic()
+            if self.__pending_content is None:
+                self.__pending_content = content
+                self.__last_schedule_time = now
+                self.__pending_since = now
+            elif self.__merge_function is not None:
+                self.__pending_content = self.__merge_function(content, self.__pending_content)
+            self.__retry_time = now + self.__max_delay
+            self.__failed_write_attempt = self.__write_attempts
+            self.__writing = False
+            self.__flush_requested = False
+            self.__condition.notify_all()
+        if self.__error_function is not None:
+            self.__error_function(error)
+        else:
+            print("Failed to save configuration !\n", error)
@@ -1,42 +1,259 @@
 """Module containing the Configuration class."""
 import configparser
+import os
+from contextlib import contextmanager
+from typing import Callable, Iterator
 
+from AutoSummoner.Config.Backends.ConfigBackend import ConfigBackend
+from AutoSummoner.Config.Backends.IniConfigBackend import IniConfigBackend
+from AutoSummoner.Config.Backends.SqliteConfigBackend import SqliteConfigBackend
+from AutoSummoner.Config.ConfigChange import ConfigChange
+from AutoSummoner.Config.ConfigFileWatcher import ConfigFileWatcher
 from AutoSummoner.Config.Features.ConfigAutoChampionSelect import ConfigAutoChampionSelect
 from AutoSummoner.Config.Features.ConfigAutoLobby import ConfigAutoLobby
 from AutoSummoner.Config.Features.ConfigAutoQueue import ConfigAutoQueue
 from AutoSummoner.Config.MainFeatures import MainFeatures
+from AutoSummoner.Config.Snapshots.ConfigSnapshot import ConfigSnapshot
 
 
 class Configuration:
-    """Class representing the AutoSummoner Configuration."""
+    """
+    Class representing the AutoSummoner Configuration.
+    The configuration is only modified from the UI thread. Every save publishes a new immutable snapshot
+    which other threads read without any lock.
+    """
+    INI_PATH = "config.ini"
+    SQLITE_PATH = "config.db"
+    BACKEND_ENVIRONMENT_VARIABLE = "AUTOSUMMONER_CONFIG_BACKEND"
+
     __config_parser = configparser.ConfigParser()
+    __config_backend: ConfigBackend = None
     __feature_configurations = {}
+    __batch_depth = 0
+    __batch_modified = False
+    __version = 0
+    __snapshot: ConfigSnapshot | None = None
+    __pending_changes: list[ConfigChange] = []
+    __listeners: list[Callable[[list[ConfigChange]], None]] = []
 
     def __init__(self):
         """
         Initializes the Configuration
         """
+        if Configuration.__config_backend is None:
+            Configuration.__config_backend = self.__create_backend()
         self.load_config()
         self.__feature_configurations = {
             MainFeatures.AUTO_LOBBY: ConfigAutoLobby(self, self.__config_parser),
             MainFeatures.AUTO_QUEUE: ConfigAutoQueue(self, self.__config_parser),
             MainFeatures.AUTO_CHAMPION_SELECT: ConfigAutoChampionSelect(self, self.__config_parser)
         }
+        if Configuration.__snapshot is None or Configuration.__snapshot.get_version() != Configuration.__version:
+            self.__publish_snapshot()
+
+    @staticmethod
+    def __create_backend() -> ConfigBackend:
+        """
+        :return: the SQLite backend if a SQLite database exists or is requested by the environment, the INI backend otherwise.
+        On the first use of the SQLite backend, the existing INI file is imported into the database.
+        """
+        use_sqlite = os.environ.get(Configuration.BACKEND_ENVIRONMENT_VARIABLE, "").lower() == "sqlite" or \
+            os.path.exists(Configuration.SQLITE_PATH)
+        if not use_sqlite:
+            return IniConfigBackend(Configuration.INI_PATH)
+
+        backend = SqliteConfigBackend(Configuration.SQLITE_PATH)
+        if backend.is_empty() and os.path.exists(Configuration.INI_PATH):
+            backend.import_ini(Configuration.INI_PATH)
+        return backend
 
     def load_config(self) -> None:
         """
-        Load configuration from the config.ini file
-        :return:
+        Load configuration from the configuration storage, when it changed since it was last loaded or saved.
+        Only called when a Configuration is created: the first one reads the storage, the following ones skip it.
+        Later modifications of the storage are detected by the file watcher, which reads and diffs the file in its own
+        thread and applies them with apply_external_changes, without going through this method.
         """
-        self.__config_parser.read("config.ini")
+        if self.__config_backend.load(self.__config_parser):
+            Configuration.__version += 1
+            if len(self.__feature_configurations) > 0:
+                self.__publish_snapshot()
 
     def save_config(self) -> None:
         """
-        Save the configuration to the config.ini file
+        Save the configuration to the configuration storage.
+        The storage is written in the background, successive saves are grouped into a single write.
+        """
+        Configuration.__version += 1
+        if Configuration.__batch_depth > 0:
+            Configuration.__batch_modified = True
+            return
+
+        self.__commit(store=True)
+
+    def __commit(self, store: bool) -> None:
+        """
+        Stores the pending changes, publishes a new snapshot and notifies the listeners.
+        :param store: True to save the changes to the configuration storage, False if they already come from it.
+        """
+        changes = list(dict.fromkeys(Configuration.__pending_changes))
+        Configuration.__pending_changes.clear()
+        if store:
+            self.__config_backend.save(self.__config_parser, changes)
+        else:
+            self.__config_backend.notify_external_changes(changes)
+        self.__publish_snapshot(changes)
+        if len(changes) > 0:
+            for listener in list(Configuration.__listeners):
+                listener(changes)
+
+    def apply_external_changes(self, content: dict[str, dict[str, str]], changes: list[ConfigChange]) -> None:
+        """
+        Applies modifications made to the configuration storage outside AutoSummoner, without saving them again.
+        Only the given sections and keys are updated, values already equal to the new content are ignored.
+        :param content: new content of the configuration storage, by section and key.
+        :param changes: sections and keys modified in the configuration storage.
+        """
+        Configuration.__version += 1
+        for change in changes:
+            if change.section not in content:
+                if self.__config_parser.remove_section(change.section):
+                    Configuration.__pending_changes.append(ConfigChange(change.section, external=True))
+                continue
+            if not self.__config_parser.has_section(change.section):
+                self.__config_parser.add_section(change.section)
+                Configuration.__pending_changes.append(ConfigChange(change.section, external=True))
+            if change.key is None:
+                continue
+
+            value = content[change.section].get(change.key)
+            current_value = self.__config_parser.get(change.section, change.key, raw=True, fallback=None)
+            if value == current_value:
+                continue
+            if value is None:
+                self.__config_parser.remove_option(change.section, change.key)
+            else:
+                self.__config_parser.set(change.section, change.key, value)
+            Configuration.__pending_changes.append(ConfigChange(change.section, change.key, external=True))
+
+        self.get_feature_configuration(MainFeatures.AUTO_CHAMPION_SELECT).refresh_profiles()
+        self.__commit(store=False)
+
+    def create_file_watcher(self, callback: Callable[[dict[str, dict[str, str]], list[ConfigChange]], None]) -> ConfigFileWatcher | None:
+        """
+        Creates a watcher reporting the modifications of the configuration file made outside AutoSummoner.
+        The callback is called from the watcher thread, the changes should be applied with apply_external_changes
+        from the thread which modifies the configuration.
+        :param callback: function called with the new content of the configuration file and the list of changes.
+        :return: the watcher (not started yet), or None if the configuration is not stored in an INI file.
+        """
+        if not isinstance(self.__config_backend, IniConfigBackend):
+            return None
+        return ConfigFileWatcher(self.__config_backend.get_path(), callback, self.__config_backend.is_own_content)
+
+    def set_value(self, section: str, key: str, value: str) -> None:
+        """
+        Changes a value of the configuration, listeners are notified when the configuration is saved.
+        :param section: section of the value.
+        :param key: key of the value.
+        :param value: new value.
+        """
+        self.__config_parser.set(section, key, value)
+        Configuration.__pending_changes.append(ConfigChange(section, key))
+
+    def add_section(self, section: str) -> None:
+        """
+        Adds a section to the configuration if it does not exist yet, listeners are notified when the configuration is saved.
+        :param section: section to add.
+        """
+        if not self.__config_parser.has_section(section):
+            self.__config_parser.add_section(section)
+            Configuration.__pending_changes.append(ConfigChange(section))
+
+    def remove_section(self, section: str) -> None:
+        """
+        Removes a whole section of the configuration, listeners are notified when the configuration is saved.
+        :param section: section to remove.
+        """
+        if self.__config_parser.remove_section(section):
+            Configuration.__pending_changes.append(ConfigChange(section))
+
+    def add_listener(self, listener: Callable[[list[ConfigChange]], None]) -> None:
+        """
+        Registers a function called with the list of changes every time the configuration is saved.
+        Listeners are called from the thread which changed the configuration.
+        :param listener: function to call.
+        """
+        Configuration.__listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[list[ConfigChange]], None]) -> None:
+        """
+        Unregisters a function previously registered with add_listener.
+        :param listener: function to unregister.
+        """
+        Configuration.__listeners.remove(listener)
+
+    def set_write_error_listener(self, listener: Callable[[Exception | None], None] | None) -> None:
+        """
+        Failed writes are kept and retried, the listener is told about the failure and about the next successful write.
+        :param listener: function called from the writer thread with the exception when the configuration could not be saved,
+        and with None once it is saved again, or None to print the failures.
+        """
+        self.__config_backend.set_write_error_callback(listener)
+
+    def flush(self) -> None:
+        """
+        Waits until all the saved configuration is written to the configuration storage.
+        """
+        self.__config_backend.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator["Configuration"]:
+        """
+        Groups all the configuration changes made inside the context into a single save and a single notification.
+        Batches can be nested, the configuration is saved when the outermost batch ends.
+        """
+        Configuration.__batch_depth += 1
+        try:
+            yield self
+        finally:
+            Configuration.__batch_depth -= 1
+            if Configuration.__batch_depth == 0 and Configuration.__batch_modified:
+                Configuration.__batch_modified = False
+                self.save_config()
+
+    def get_load_statistics(self) -> dict[str, int]:
+        """
+        :return: number of calls to load_config, number of times the storage was actually read and number of skipped reads.
+        Modifications applied from the file watcher are not counted.
+        """
+        return self.__config_backend.get_load_statistics()
+
+    def get_write_statistics(self) -> dict[str, int]:
+        """
+        :return: number of writes to the configuration storage and number of bytes written.
+        """
+        return self.__config_backend.get_write_statistics()
+
+    def get_version(self) -> int:
+        """
+        :return: the version of the configuration, incremented every time the configuration changes.
+        """
+        return Configuration.__version
+
+    def get_snapshot(self) -> ConfigSnapshot:
+        """
+        Can be called from any thread, the snapshot is never modified once published.
+        :return: an immutable snapshot of the last saved configuration.
+        """
+        return Configuration.__snapshot
+
+    def __publish_snapshot(self, changes: list[ConfigChange] = None) -> None:
+        """
+        Compiles a new snapshot of the configuration and publishes it.
+        :param changes: changes made since the previous snapshot, or None to compile the whole configuration again.
         """
-        with open('config.ini', 'w', encoding="utf-8") as configfile:
-            self.__config_parser.write(configfile)
-            configfile.flush()
+        Configuration.__snapshot = ConfigSnapshot(Configuration.__version, self, Configuration.__snapshot, changes)
 
     def get_feature_configuration(self, feature: MainFeatures) -> ConfigAutoLobby | ConfigAutoQueue | ConfigAutoChampionSelect:
         """
@@ -2,6 +2,7 @@
 from configparser import ConfigParser
 
 from AutoSummoner.Config.MainFeatures import MainFeatures
+from AutoSummoner.Config.ProfileIndex import ProfileIndex
 from AutoSummoner.Config.Features.ConfigAutoChampionSelectProfile import ConfigAutoChampionSelectProfile
 
 
@@ -10,6 +11,8 @@ class ConfigAutoChampionSelect:
     __config = None
     __config_parser = None
     __config_per_profile = {}
+    __profile_index: ProfileIndex = None
+    __profile_index_version: int = None
 
     SECTION = MainFeatures.AUTO_CHAMPION_SELECT.value
 
@@ -23,7 +26,12 @@ class ConfigAutoChampionSelect:
         self.__config_parser = config_parser
         if not self.__config_parser.has_section(self.SECTION):
             self.__config_parser.add_section(self.SECTION)
+        self.refresh_profiles()
 
+    def refresh_profiles(self) -> None:
+        """
+        Updates the list of profiles with the profile sections currently in the configuration.
+        """
         auto_champion_select_profiles_ids = []
 
         for section in self.__config_parser.sections():
@@ -33,15 +41,21 @@ class ConfigAutoChampionSelect:
                 except ValueError as e:
                     print(e)
 
+        for profile_id in list(self.__config_per_profile.keys()):
+            if profile_id not in auto_champion_select_profiles_ids:
+                self.__config_per_profile.pop(profile_id)
+
         for profile in auto_champion_select_profiles_ids:
-            self.__config_per_profile[profile] = ConfigAutoChampionSelectProfile(profile, self.__config, self.__config_parser)
+            if profile not in self.__config_per_profile:
+                self.__config_per_profile[profile] = ConfigAutoChampionSelectProfile(profile, self.__config, self.__config_parser)
+        self.__profile_index = None
 
     def set_enabled(self, enabled: bool) -> None:
         """
         Save whether the auto champion select feature is enabled in the config file.
         :param enabled: True to indicate that auto champion select is enabled, False otherwise.
         """
-        self.__config_parser.set(self.SECTION, "enabled", str(enabled))
+        self.__config.set_value(self.SECTION, "enabled", str(enabled))
         self.__config.save_config()
 
     def is_enabled(self) -> bool:
@@ -50,6 +64,22 @@ class ConfigAutoChampionSelect:
         """
         return self.__config_parser.getboolean(self.SECTION, "enabled", fallback=False)
 
+    def set_lock_in_offset(self, lock_in_offset: int) -> None:
+        """
+        Save when picked champions should be locked in, in the config file.
+        :param lock_in_offset: time (in milliseconds) before the end of the pick turn at which the champion is locked in,
+        or 0 to lock it in immediately.
+        """
+        self.__config.set_value(self.SECTION, "lock_in_offset", str(max(lock_in_offset, 0)))
+        self.__config.save_config()
+
+    def get_lock_in_offset(self) -> int:
+        """
+        :return: time (in milliseconds) before the end of the pick turn at which the champion is locked in,
+        or 0 if it is locked in immediately.
+        """
+        return max(self.__config_parser.getint(self.SECTION, "lock_in_offset", fallback=0), 0)
+
     def get_all_profiles(self) -> list[ConfigAutoChampionSelectProfile]:
         """
         :return: list of all auto champion select profiles
@@ -68,13 +98,12 @@ class ConfigAutoChampionSelect:
         Generates a new auto champion select profile
         :return: the newly created auto champion select profile
         """
-        profile_ids = [profile.get_id() for profile in self.get_all_profiles()]
-        if len(profile_ids) == 0:
-            new_profile_id = 0
-        else:
-            new_profile_id = max(profile_ids) + 1
+        # The profiles are shared by every Configuration, the new id is computed from all of them
+        new_profile_id = max(self.__config_per_profile.keys(), default=-1) + 1
 
+        self.__config.add_section(self.SECTION+"."+str(new_profile_id))
         self.__config_per_profile[new_profile_id] = ConfigAutoChampionSelectProfile(new_profile_id, self.__config, self.__config_parser)
+        self.__profile_index = None
 
         return self.__config_per_profile[new_profile_id]
 
@@ -84,7 +113,8 @@ class ConfigAutoChampionSelect:
         :param profile_id: id of the profile to remove
         """
         self.__config_per_profile.pop(profile_id)
-        self.__config_parser.remove_section(self.SECTION+"."+str(profile_id))
+        self.__profile_index = None
+        self.__config.remove_section(self.SECTION+"."+str(profile_id))
         self.__config.save_config()
 
     def find_profile_config(self, queue_id: int, position: str) -> ConfigAutoChampionSelectProfile | None:
@@ -93,9 +123,7 @@ class ConfigAutoChampionSelect:
         :param position: requested position
         :return: an auto champion select profile which can be used for the given queue id and position, or None if no profile could be found
         """
-        for profile in self.get_all_profiles():
-            if queue_id in profile.get_queues_id():
-                if (position == "" and len(profile.get_positions()) == 0) or \
-                        (position.upper() in [position.get_league_position_str() for position in profile.get_positions()]):
-                    return profile
-        return None
+        if self.__profile_index is None or self.__profile_index_version != self.__config.get_version():
+            self.__profile_index_version = self.__config.get_version()
+            self.__profile_index = ProfileIndex(self.get_all_profiles())
+        return self.__profile_index.find(queue_id, position)
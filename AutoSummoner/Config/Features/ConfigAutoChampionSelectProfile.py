@@ -39,7 +39,7 @@ class ConfigAutoChampionSelectProfile:
         :param name:
         :return:
         """
-        self.__config_parser.set(self.section, "name", name)
+        self.__config.set_value(self.section, "name", name)
         self.__config.save_config()
 
     def get_name(self) -> str:
@@ -53,7 +53,7 @@ class ConfigAutoChampionSelectProfile:
         Save the list of queues id this profile can be applied to in the config file.
         :param queues: list of queues id this profile can be applied to.
         """
-        self.__config_parser.set(self.section, "queues", ','.join([str(queue) for queue in queues]))
+        self.__config.set_value(self.section, "queues", ','.join([str(queue) for queue in queues]))
         self.__config.save_config()
 
     def get_queues_id(self) -> list[int]:
@@ -71,7 +71,7 @@ class ConfigAutoChampionSelectProfile:
         Save the list of positions this profile can be applied to in the config file.
         :param positions: list of positions this profile can be applied to.
         """
-        self.__config_parser.set(self.section, "positions", ','.join([str(position.get_index()) for position in positions]))
+        self.__config.set_value(self.section, "positions", ','.join([str(position.get_index()) for position in positions]))
         self.__config.save_config()
 
     def get_positions(self) -> list[Position]:
@@ -89,7 +89,7 @@ class ConfigAutoChampionSelectProfile:
         Save the id of the champions that should be banned in the config file.
         :param champions_ban_id: list of id of the champions to ban (ordered by priority).
         """
-        self.__config_parser.set(self.section, "champions_ban", ','.join([str(champion_id) for champion_id in champions_ban_id]))
+        self.__config.set_value(self.section, "champions_ban", ','.join([str(champion_id) for champion_id in champions_ban_id]))
         self.__config.save_config()
 
     def get_champions_ban_id(self) -> list[int]:
@@ -107,7 +107,7 @@ class ConfigAutoChampionSelectProfile:
         Save the id of the champions that should be picked in the config file.
         :param champions_pick_id: list of id of the champions to pick (ordered by priority).
         """
-        self.__config_parser.set(self.section, "champions_pick", ','.join([str(champion_id) for champion_id in champions_pick_id]))
+        self.__config.set_value(self.section, "champions_pick", ','.join([str(champion_id) for champion_id in champions_pick_id]))
         self.__config.save_config()
 
     def get_champions_pick_id(self) -> list[int]:
@@ -126,8 +126,8 @@ class ConfigAutoChampionSelectProfile:
         :param summoner_spell_1_id: id of the first summoner spell that should be used for all champions.
         :param summoner_spell_2_id: id of the first summoner spell that should be used for all champions.
         """
-        self.__config_parser.set(self.section, "summoner_spell_1_global", str(summoner_spell_1_id))
-        self.__config_parser.set(self.section, "summoner_spell_2_global", str(summoner_spell_2_id))
+        self.__config.set_value(self.section, "summoner_spell_1_global", str(summoner_spell_1_id))
+        self.__config.set_value(self.section, "summoner_spell_2_global", str(summoner_spell_2_id))
         self.__config.save_config()
 
     def get_summoner_spells_id_global(self) -> tuple[int, int] | None:
@@ -151,8 +151,8 @@ class ConfigAutoChampionSelectProfile:
         :param summoner_spell_1_id: id of the first summoner spell.
         :param summoner_spell_2_id: id of the first summoner spell.
         """
-        self.__config_parser.set(self.section, f"summoner_spell_1_{champion_id}", str(summoner_spell_1_id))
-        self.__config_parser.set(self.section, f"summoner_spell_2_{champion_id}", str(summoner_spell_2_id))
+        self.__config.set_value(self.section, f"summoner_spell_1_{champion_id}", str(summoner_spell_1_id))
+        self.__config.set_value(self.section, f"summoner_spell_2_{champion_id}", str(summoner_spell_2_id))
         self.__config.save_config()
 
     def get_summoner_spells_id_per_champion_id(self, champion_id: int) -> tuple[int, int] | None:
@@ -169,12 +169,26 @@ class ConfigAutoChampionSelectProfile:
         return (int(summoner_spell_1_str),
                     int(summoner_spell_2_str))
 
+    def get_all_summoner_spells_id_per_champion_id(self) -> dict[int, tuple[int, int]]:
+        """
+        :return: dictionary of the summoner spells id that should be used, by champion id.
+        """
+        values = dict(self.__config_parser.items(self.section, raw=True))
+        summoner_spells_per_champion = {}
+        for key, summoner_spell_1_str in values.items():
+            champion_id_str = key.removeprefix("summoner_spell_1_")
+            if key.startswith("summoner_spell_1_") and champion_id_str.isdigit():
+                summoner_spell_2_str = values.get(f"summoner_spell_2_{champion_id_str}", "")
+                if len(summoner_spell_1_str) > 0 and len(summoner_spell_2_str) > 0:
+                    summoner_spells_per_champion[int(champion_id_str)] = (int(summoner_spell_1_str), int(summoner_spell_2_str))
+        return summoner_spells_per_champion
+
     def set_using_individual_summoner_spell(self, enabled: bool) -> None:
         """
         Save whether this profile roles should use individual summoner spells per champion to pick.
         :param enabled: True if this profile should use individual summoner spells per champion to pick, false otherwise
         """
-        self.__config_parser.set(self.section, "summoner_spells_unique_per_champion", str(enabled))
+        self.__config.set_value(self.section, "summoner_spells_unique_per_champion", str(enabled))
         self.__config.save_config()
 
     def is_using_individual_summoner_spell(self) -> bool:
@@ -188,7 +202,7 @@ class ConfigAutoChampionSelectProfile:
         Save the id of the rune that should be used for all champions.
         :param rune_id: id of the rune that should be used for all champions.
         """
-        self.__config_parser.set(self.section, "rune_global", str(rune_id))
+        self.__config.set_value(self.section, "rune_global", str(rune_id))
         self.__config.save_config()
 
     def get_rune_id_global(self) -> int:
@@ -202,7 +216,7 @@ class ConfigAutoChampionSelectProfile:
         Save whether this profile roles should use individual rune per champion to pick.
         :param enabled: True if this profile should use individual rune per champion to pick, false otherwise
         """
-        self.__config_parser.set(self.section, "runes_unique_per_champion", str(enabled))
+        self.__config.set_value(self.section, "runes_unique_per_champion", str(enabled))
         self.__config.save_config()
 
     def is_using_individual_rune(self) -> bool:
@@ -217,7 +231,7 @@ class ConfigAutoChampionSelectProfile:
         :param champion_id: id of the champion.
         :param rune_id: id of the rune.
         """
-        self.__config_parser.set(self.section, f"rune_{champion_id}", str(rune_id))
+        self.__config.set_value(self.section, f"rune_{champion_id}", str(rune_id))
         self.__config.save_config()
 
     def get_rune_id_per_champion(self, champion_id: int) -> int:
@@ -226,3 +240,14 @@ class ConfigAutoChampionSelectProfile:
         :return: id of the rune that should be used for the given champion id.
         """
         return self.__config_parser.getint(self.section, f"rune_{champion_id}", fallback=0)
+
+    def get_all_runes_id_per_champion(self) -> dict[int, int]:
+        """
+        :return: dictionary of the id of the rune that should be used, by champion id.
+        """
+        runes_per_champion = {}
+        for key, rune_id_str in self.__config_parser.items(self.section, raw=True):
+            champion_id_str = key.removeprefix("rune_")
+            if key.startswith("rune_") and champion_id_str.isdigit():
+                runes_per_champion[int(champion_id_str)] = int(rune_id_str)
+        return runes_per_champion
@@ -33,7 +33,7 @@ class ConfigAutoLobby:
         Save whether the auto lobby feature is enabled in the config file.
         :param enabled: True to indicate that auto lobby is enabled, False otherwise.
         """
-        self.__config_parser.set(self.SECTION, "enabled", str(enabled))
+        self.__config.set_value(self.SECTION, "enabled", str(enabled))
         self.__config.save_config()
 
     def is_enabled(self) -> bool:
@@ -48,8 +48,8 @@ class ConfigAutoLobby:
         Save whether the auto select queue feature is enabled in the config file.
         :param enabled: True to indicate that auto select queue is enabled, False otherwise.
         """
-        self.__config_parser.set(self.SECTION, "auto_select_queue", str(enabled))
-        self.__config_parser.set(self.SECTION_AUTO_SELECT_QUEUE, "queue_id", str(queue_id))
+        self.__config.set_value(self.SECTION, "auto_select_queue", str(enabled))
+        self.__config.set_value(self.SECTION_AUTO_SELECT_QUEUE, "queue_id", str(queue_id))
         self.__config.save_config()
 
     def is_auto_select_queue_enabled(self) -> bool:
@@ -70,7 +70,7 @@ class ConfigAutoLobby:
         Save whether the auto select roles feature is enabled in the config file.
         :param enabled: True to indicate that auto select roles is enabled, False otherwise.
         """
-        self.__config_parser.set(self.SECTION, "auto_select_roles", str(enabled))
+        self.__config.set_value(self.SECTION, "auto_select_roles", str(enabled))
         self.__config.save_config()
 
     def is_auto_select_roles_enabled(self) -> bool:
@@ -85,8 +85,8 @@ class ConfigAutoLobby:
         :param first_preference: first role to be selected
         :param second_preference: second role to be selected
         """
-        self.__config_parser.set(self.SECTION_AUTO_SELECT_ROLES, "first_preference", first_preference.value)
-        self.__config_parser.set(self.SECTION_AUTO_SELECT_ROLES, "second_preference", second_preference.value)
+        self.__config.set_value(self.SECTION_AUTO_SELECT_ROLES, "first_preference", first_preference.value)
+        self.__config.set_value(self.SECTION_AUTO_SELECT_ROLES, "second_preference", second_preference.value)
         self.__config.save_config()
 
     def get_auto_select_roles(self) -> tuple[Position, Position]:
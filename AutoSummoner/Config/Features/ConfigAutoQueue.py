@@ -27,7 +27,7 @@ class ConfigAutoQueue:
         Save whether the auto queue feature is enabled in the config file.
         :param enabled: True to indicate that auto queue is enabled, False otherwise.
         """
-        self.__config_parser.set(self.SECTION, "enabled", str(enabled))
+        self.__config.set_value(self.SECTION, "enabled", str(enabled))
         self.__config.save_config()
 
     def is_enabled(self) -> bool:
@@ -41,7 +41,7 @@ class ConfigAutoQueue:
         Save whether the auto start queue feature is enabled in the config file.
         :param enabled: True to indicate that auto start queue is enabled, False otherwise.
         """
-        self.__config_parser.set(self.SECTION, "auto_start_queue", str(enabled))
+        self.__config.set_value(self.SECTION, "auto_start_queue", str(enabled))
         self.__config.save_config()
 
     def is_auto_start_queue_enabled(self) -> bool:
@@ -55,7 +55,7 @@ class ConfigAutoQueue:
         Save whether the auto accept match feature is enabled in the config file.
         :param enabled: True to indicate that auto accept match is enabled, False otherwise.
         """
-        self.__config_parser.set(self.SECTION, "auto_accept_match", str(enabled))
+        self.__config.set_value(self.SECTION, "auto_accept_match", str(enabled))
         self.__config.save_config()
 
     def is_auto_accept_match_enabled(self) -> bool:
@@ -0,0 +1,35 @@
+"""Module containing the ProfileIndex class."""
+from AutoSummoner.LcuInterface.Position import Position
+
+
+class ProfileIndex:
+    """
+    Index of the auto champion select profiles by queue id and LCU position.
+    Profiles without any position are indexed under the empty position, which the LCU uses when no position is assigned.
+    When several profiles match the same queue and position, the profile with the lowest id is used.
+    """
+    # pylint: disable=too-few-public-methods
+    # The index is built once per configuration version and only looked up afterwards
+    ANY_POSITION = ""
+
+    def __init__(self, profiles):
+        """
+        Builds the index.
+        :param profiles: auto champion select profiles (configurations or snapshots) to index.
+        """
+        self.__profiles_by_key = {}
+        for profile in sorted(profiles, key=lambda profile_: profile_.get_id()):
+            positions: list[Position] = profile.get_positions()
+            league_positions = [position.get_league_position_str() for position in positions] if len(positions) > 0 \
+                else [self.ANY_POSITION]
+            for queue_id in profile.get_queues_id():
+                for league_position in league_positions:
+                    self.__profiles_by_key.setdefault((queue_id, league_position), profile)
+
+    def find(self, queue_id: int, position: str):
+        """
+        :param queue_id: requested queue id
+        :param position: requested LCU position string, empty if no position is assigned
+        :return: the profile to use for the given queue id and position, or None if no profile could be found
+        """
+        return self.__profiles_by_key.get((queue_id, position.upper()))
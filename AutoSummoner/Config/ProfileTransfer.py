@@ -0,0 +1,296 @@
+"""Module containing the ProfileTransfer class."""
+import argparse
+import contextlib
+import itertools
+import json
+import sys
+from typing import ContextManager, Iterable, Iterator, TextIO
+
+from AutoSummoner.Config.Configuration import Configuration
+from AutoSummoner.Config.Features.ConfigAutoChampionSelect import ConfigAutoChampionSelect
+from AutoSummoner.Config.Features.ConfigAutoChampionSelectProfile import ConfigAutoChampionSelectProfile
+from AutoSummoner.Config.MainFeatures import MainFeatures
+from AutoSummoner.LcuInterface.Assets.AssetsWorker import AssetsWorker
+from AutoSummoner.LcuInterface.Position import Position
+
+
+class ProfileTransfer:
+    """
+    Class importing and exporting auto champion select profiles in bulk, as JSON lines (one profile per line).
+    Files are streamed line by line and imported profiles are validated and created in batches,
+    all inside a single configuration batch so that the whole import is saved at once.
+    """
+
+    DEFAULT_BATCH_SIZE = 500
+    LIST_FIELDS = ("queues", "positions", "champions_ban", "champions_pick")
+    DICT_FIELDS = ("summoner_spells_per_champion", "runes_per_champion")
+
+    def __init__(self, config: Configuration, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Initializes the profile transfer.
+        :param config: the Configuration object.
+        :param batch_size: number of profiles validated and created at once during an import.
+        """
+        self.__config = config
+        self.__batch_size = batch_size
+
+    def export_profiles(self, output_file: TextIO) -> int:
+        """
+        Writes all the auto champion select profiles to a JSON lines file.
+        :param output_file: file the profiles are written to.
+        :return: the number of exported profiles.
+        """
+        config_auto_champion_select: ConfigAutoChampionSelect = self.__config.get_feature_configuration(MainFeatures.AUTO_CHAMPION_SELECT)
+        count = 0
+        for profile in config_auto_champion_select.get_all_profiles():
+            output_file.write(json.dumps(self.profile_to_dict(profile), separators=(",", ":")) + "\n")
+            count += 1
+        return count
+
+    def import_profiles(self, input_file: TextIO, known_champion_ids: set[int] = None, known_queue_ids: set[int] = None) -> int:
+        """
+        Creates a new auto champion select profile for each line of a JSON lines file.
+        Either all the profiles are imported, or none of them if one of the lines is invalid.
+        :param input_file: file the profiles are read from, line by line.
+        :param known_champion_ids: ids of the existing champions, or None to skip the champion ids validation.
+        :param known_queue_ids: ids of the existing queues, or None to skip the queue ids validation.
+        :return: the number of imported profiles.
+        :raises ValueError: if a line is not a valid profile.
+        """
+        config_auto_champion_select: ConfigAutoChampionSelect = self.__config.get_feature_configuration(MainFeatures.AUTO_CHAMPION_SELECT)
+        imported_profiles_id = []
+        with self.__config.batch():
+            try:
+                for batch in self.__read_batches(input_file):
+                    self.__validate_batch(batch, known_champion_ids, known_queue_ids)
+                    for _, profile_dict in batch:
+                        profile = config_auto_champion_select.generate_profile()
+                        imported_profiles_id.append(profile.get_id())
+                        self.__apply_profile_dict(profile, profile_dict)
+            except Exception as e:
+                # Nothing of a failed import is saved, whatever the error
+                for profile_id in imported_profiles_id:
+                    config_auto_champion_select.remove_profile(profile_id)
+                if isinstance(e, (TypeError, ValueError)):
+                    raise ValueError(str(e)) from e
+                raise
+        return len(imported_profiles_id)
+
+    @staticmethod
+    def profile_to_dict(profile: ConfigAutoChampionSelectProfile) -> dict:
+        """
+        :param profile: an auto champion select profile.
+        :return: the profile as a JSON serializable dictionary.
+        """
+        return {
+            "name": profile.get_name(),
+            "queues": profile.get_queues_id(),
+            "positions": [position.value for position in profile.get_positions()],
+            "champions_ban": profile.get_champions_ban_id(),
+            "champions_pick": profile.get_champions_pick_id(),
+            "summoner_spells_global": profile.get_summoner_spells_id_global(),
+            "summoner_spells_unique_per_champion": profile.is_using_individual_summoner_spell(),
+            "summoner_spells_per_champion": {str(champion_id): summoner_spells_id for champion_id, summoner_spells_id
+                                             in profile.get_all_summoner_spells_id_per_champion_id().items()},
+            "rune_global": profile.get_rune_id_global(),
+            "runes_unique_per_champion": profile.is_using_individual_rune(),
+            "runes_per_champion": {str(champion_id): rune_id for champion_id, rune_id
+                                   in profile.get_all_runes_id_per_champion().items()}
+        }
+
+    def __read_batches(self, input_file: TextIO) -> Iterator[list[tuple[int, dict]]]:
+        """
+        Reads and parses the file line by line, without loading it fully in memory.
+        :param input_file: file the profiles are read from.
+        :return: an iterator over batches of (line number, profile dictionary).
+        :raises ValueError: if a line is not a JSON object.
+        """
+        lines = ((line_number, line) for line_number, line in enumerate(input_file, start=1) if len(line.strip()) > 0)
+        while True:
+            batch = []
+            for line_number, line in itertools.islice(lines, self.__batch_size):
+                try:
+                    profile_dict = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Line {line_number} is not valid JSON : {e}") from e
+                if not isinstance(profile_dict, dict):
+                    raise ValueError(f"Line {line_number} is not a JSON object")
+                batch.append((line_number, profile_dict))
+            if len(batch) == 0:
+                return
+            yield batch
+
+    @staticmethod
+    def __validate_batch(batch: list[tuple[int, dict]], known_champion_ids: set[int] | None, known_queue_ids: set[int] | None) -> None:
+        """
+        Checks the values of a batch of profiles, all the champion and queue ids of the batch are checked at once.
+        :param batch: list of (line number, profile dictionary).
+        :param known_champion_ids: ids of the existing champions, or None to skip the champion ids validation.
+        :param known_queue_ids: ids of the existing queues, or None to skip the queue ids validation.
+        :raises ValueError: if a profile of the batch is invalid.
+        """
+        errors = []
+        champion_ids_per_line = {}
+        queue_ids_per_line = {}
+        for line_number, profile_dict in batch:
+            structure_error = ProfileTransfer.__get_structure_error(profile_dict)
+            if structure_error is not None:
+                errors.append(f"line {line_number} : {structure_error}")
+                continue
+            try:
+                queue_ids_per_line[line_number], champion_ids_per_line[line_number] = ProfileTransfer.__get_ids(profile_dict)
+            except (TypeError, ValueError):
+                errors.append(f"line {line_number} : invalid champion, queue or rune id")
+
+        for known_ids, ids_per_line, name in ((known_champion_ids, champion_ids_per_line, "champion"),
+                                              (known_queue_ids, queue_ids_per_line, "queue")):
+            if known_ids is None:
+                continue
+            unknown_ids = set().union(*ids_per_line.values()) - known_ids
+            if len(unknown_ids) == 0:
+                continue
+            for line_number, ids in ids_per_line.items():
+                if not ids.isdisjoint(unknown_ids):
+                    errors.append(f"line {line_number} : unknown {name} ids {sorted(ids & unknown_ids)}")
+
+        if len(errors) > 0:
+            raise ValueError("Invalid profiles :\n" + "\n".join(sorted(errors)))
+
+    @staticmethod
+    def __get_ids(profile_dict: dict) -> tuple[set[int], set[int]]:
+        """
+        :param profile_dict: a profile dictionary with a valid structure.
+        :return: the queue ids and the champion ids used by the profile.
+        :raises TypeError: if an id is not a number.
+        :raises ValueError: if an id is not a number.
+        """
+        queue_ids = {int(queue_id) for queue_id in profile_dict.get("queues", [])}
+        champion_ids = {int(champion_id) for champion_id in profile_dict.get("champions_ban", [])} | \
+            {int(champion_id) for champion_id in profile_dict.get("champions_pick", [])} | \
+            {int(champion_id) for champion_id in profile_dict.get("summoner_spells_per_champion", {})} | \
+            {int(champion_id) for champion_id in profile_dict.get("runes_per_champion", {})}
+        for rune_id in [profile_dict.get("rune_global", 0), *profile_dict.get("runes_per_champion", {}).values()]:
+            int(rune_id)
+        return queue_ids, champion_ids
+
+    @staticmethod
+    def __get_structure_error(profile_dict: dict) -> str | None:
+        """
+        Checks the types of the values of a profile dictionary, so that it can be applied without error once validated.
+        :param profile_dict: the profile dictionary.
+        :return: a description of the first invalid value, or None if the structure of the profile is valid.
+        """
+        for field in ProfileTransfer.LIST_FIELDS:
+            if not isinstance(profile_dict.get(field, []), list):
+                return f"{field} is not a list"
+        for field in ProfileTransfer.DICT_FIELDS:
+            if not isinstance(profile_dict.get(field, {}), dict):
+                return f"{field} is not an object"
+        if not all(isinstance(position, str) for position in profile_dict.get("positions", [])):
+            return "positions are not strings"
+        unknown_positions = set(profile_dict.get("positions", [])) - {position.value for position in Position}
+        if len(unknown_positions) > 0:
+            return f"unknown positions {sorted(unknown_positions)}"
+
+        summoner_spells = list(profile_dict.get("summoner_spells_per_champion", {}).values())
+        if profile_dict.get("summoner_spells_global") is not None:
+            summoner_spells.append(profile_dict["summoner_spells_global"])
+        for summoner_spells_id in summoner_spells:
+            if not isinstance(summoner_spells_id, list) or len(summoner_spells_id) != 2 or \
+                    not all(isinstance(spell_id, int) and not isinstance(spell_id, bool) for spell_id in summoner_spells_id):
+                return "summoner spells are not lists of 2 ids"
+        return None
+
+    @staticmethod
+    def __apply_profile_dict(profile: ConfigAutoChampionSelectProfile, profile_dict: dict) -> None:
+        """
+        Saves the values of a validated profile dictionary in a profile.
+        :param profile: the auto champion select profile.
+        :param profile_dict: the profile dictionary.
+        """
+        profile.set_name(str(profile_dict.get("name", "Imported profile")))
+        profile.set_queues_id([int(queue_id) for queue_id in profile_dict.get("queues", [])])
+        profile.set_positions([Position(position) for position in profile_dict.get("positions", [])])
+        profile.set_champions_ban_id([int(champion_id) for champion_id in profile_dict.get("champions_ban", [])])
+        profile.set_champions_pick_id([int(champion_id) for champion_id in profile_dict.get("champions_pick", [])])
+        if profile_dict.get("summoner_spells_global") is not None:
+            profile.set_summoner_spells_id_global(*[int(spell_id) for spell_id in profile_dict["summoner_spells_global"]])
+        profile.set_using_individual_summoner_spell(bool(profile_dict.get("summoner_spells_unique_per_champion", False)))
+        for champion_id, summoner_spells_id in profile_dict.get("summoner_spells_per_champion", {}).items():
+            profile.set_summoner_spells_id_per_champion_id(int(champion_id), *[int(spell_id) for spell_id in summoner_spells_id])
+        profile.set_rune_id_global(int(profile_dict.get("rune_global", 0)))
+        profile.set_using_individual_rune(bool(profile_dict.get("runes_unique_per_champion", False)))
+        for champion_id, rune_id in profile_dict.get("runes_per_champion", {}).items():
+            profile.set_rune_id_per_champion(int(champion_id), int(rune_id))
+
+    @staticmethod
+    def load_champion_ids() -> set[int]:
+        """
+        Loads the id of all League of Legends champions from the community dragon API, like the assets worker does.
+        Callers which already loaded the champions (e.g. the UI) should pass their ids to import_profiles instead.
+        :return: the set of champion ids.
+        """
+        return set(AssetsWorker.fetch_champions())
+
+
+def parse_ids(ids: str | None) -> set[int] | None:
+    """
+    :param ids: comma separated list of ids, or None.
+    :return: the set of ids, or None if no ids were given.
+    """
+    if ids is None:
+        return None
+    return {int(id_) for id_ in ids.split(",") if len(id_) > 0}
+
+
+def open_file(path: str, mode: str) -> ContextManager[TextIO]:
+    """
+    :param path: path of the file, or "-" for the standard input / output.
+    :param mode: "r" or "w".
+    :return: the opened file, the standard input / output is not closed at the end of the with block.
+    """
+    if path == "-":
+        return contextlib.nullcontext(sys.stdin if mode == "r" else sys.stdout)
+    return open(path, mode, encoding="utf-8")
+
+
+def main(arguments: Iterable[str] = None) -> None:
+    """
+    Command line interface importing and exporting the auto champion select profiles of the configuration
+    of the current directory.
+    :param arguments: command line arguments, sys.argv by default.
+    """
+    argument_parser = argparse.ArgumentParser(description="Imports or exports AutoSummoner auto champion select profiles as JSON lines.")
+    subparsers = argument_parser.add_subparsers(dest="command", required=True)
+    export_parser = subparsers.add_parser("export", help="export all the profiles")
+    export_parser.add_argument("path", nargs="?", default="-", help="path of the JSON lines file, - for the standard output")
+    import_parser = subparsers.add_parser("import", help="import profiles, in addition to the existing ones")
+    import_parser.add_argument("path", nargs="?", default="-", help="path of the JSON lines file, - for the standard input")
+    import_parser.add_argument("--validate-champions", action="store_true",
+                               help="check the champion ids against the champion list of the community dragon API")
+    import_parser.add_argument("--queues", help="comma separated list of the valid queue ids")
+    import_parser.add_argument("--batch-size", type=int, default=ProfileTransfer.DEFAULT_BATCH_SIZE,
+                               help="number of profiles validated at once")
+    parsed_arguments = argument_parser.parse_args(arguments)
+
+    config = Configuration()
+    if parsed_arguments.command == "export":
+        with open_file(parsed_arguments.path, "w") as output_file:
+            count = ProfileTransfer(config).export_profiles(output_file)
+        print(f"Exported {count} profiles", file=sys.stderr)
+        return
+
+    known_champion_ids = ProfileTransfer.load_champion_ids() if parsed_arguments.validate_champions else None
+    try:
+        with open_file(parsed_arguments.path, "r") as input_file:
+            count = ProfileTransfer(config, parsed_arguments.batch_size).import_profiles(
+                input_file, known_champion_ids, parse_ids(parsed_arguments.queues))
+    except ValueError as e:
+        print("Failed to import profiles !\n", e, file=sys.stderr)
+        sys.exit(1)
+    config.flush()
+    print(f"Imported {count} profiles", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
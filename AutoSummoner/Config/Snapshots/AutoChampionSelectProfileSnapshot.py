@@ -0,0 +1,123 @@
+"""Module containing the AutoChampionSelectProfileSnapshot class."""
+from types import MappingProxyType
+
+from AutoSummoner.Config.Features.ConfigAutoChampionSelectProfile import ConfigAutoChampionSelectProfile
+from AutoSummoner.Config.Snapshots.FrozenSnapshot import FrozenSnapshot
+from AutoSummoner.LcuInterface.Position import Position
+
+
+class AutoChampionSelectProfileSnapshot(FrozenSnapshot):
+    """Immutable snapshot of an Auto Champion Select profile, with every value already parsed."""
+    __slots__ = ("_id", "_name", "_queues_id", "_positions", "_league_positions",
+                 "_champions_ban_id", "_champions_pick_id",
+                 "_using_individual_summoner_spell", "_summoner_spells_id_global", "_summoner_spells_id_per_champion",
+                 "_using_individual_rune", "_rune_id_global", "_rune_id_per_champion")
+    _id: int
+    _name: str
+    _queues_id: frozenset[int]
+    _positions: tuple[Position, ...]
+    _league_positions: frozenset[str]
+    _champions_ban_id: tuple[int, ...]
+    _champions_pick_id: tuple[int, ...]
+    _using_individual_summoner_spell: bool
+    _summoner_spells_id_global: tuple[int, int] | None
+    _summoner_spells_id_per_champion: MappingProxyType[int, tuple[int, int]]
+    _using_individual_rune: bool
+    _rune_id_global: int
+    _rune_id_per_champion: MappingProxyType[int, int]
+
+    def __init__(self, profile: ConfigAutoChampionSelectProfile):
+        """
+        Compiles the auto champion select profile configuration.
+        :param profile: the auto champion select profile configuration.
+        """
+        section = profile.section
+        positions = tuple(self._read(profile.get_positions, [], section, "positions"))
+        self._freeze(_id=profile.get_id(),
+                     _name=profile.get_name(),
+                     _queues_id=frozenset(self._read(profile.get_queues_id, [], section, "queues")),
+                     _positions=positions,
+                     _league_positions=frozenset(position.get_league_position_str() for position in positions),
+                     _champions_ban_id=tuple(self._read(profile.get_champions_ban_id, [], section, "champions_ban")),
+                     _champions_pick_id=tuple(self._read(profile.get_champions_pick_id, [], section, "champions_pick")),
+                     _using_individual_summoner_spell=self._read(profile.is_using_individual_summoner_spell, False,
+                                                                 section, "summoner_spells_unique_per_champion"),
+                     _summoner_spells_id_global=self._read(profile.get_summoner_spells_id_global, None,
+                                                           section, "summoner_spell_1_global, summoner_spell_2_global"),
+                     _summoner_spells_id_per_champion=MappingProxyType(self._read(profile.get_all_summoner_spells_id_per_champion_id, {},
+                                                                                  section, "summoner_spell_*")),
+                     _using_individual_rune=self._read(profile.is_using_individual_rune, False, section, "runes_unique_per_champion"),
+                     _rune_id_global=self._read(profile.get_rune_id_global, 0, section, "rune_global"),
+                     _rune_id_per_champion=MappingProxyType(self._read(profile.get_all_runes_id_per_champion, {}, section, "rune_*")))
+
+    def get_id(self) -> int:
+        """
+        :return: the id of this profile
+        """
+        return self._id
+
+    def get_name(self) -> str:
+        """
+        :return: name of the profile
+        """
+        return self._name
+
+    def get_queues_id(self) -> frozenset[int]:
+        """
+        :return: set of queues id that this profile is applied to.
+        """
+        return self._queues_id
+
+    def get_positions(self) -> tuple[Position, ...]:
+        """
+        :return: positions that this profile is applied to.
+        """
+        return self._positions
+
+    def get_league_positions(self) -> frozenset[str]:
+        """
+        :return: set of LCU position strings that this profile is applied to.
+        """
+        return self._league_positions
+
+    def get_champions_ban_id(self) -> tuple[int, ...]:
+        """
+        :return: id of the champions that should be banned (ordered by priority).
+        """
+        return self._champions_ban_id
+
+    def get_champions_pick_id(self) -> tuple[int, ...]:
+        """
+        :return: id of the champions that should be picked (ordered by priority).
+        """
+        return self._champions_pick_id
+
+    def is_using_individual_summoner_spell(self) -> bool:
+        """
+        :return: True if this profile should use individual summoner spells per champion to pick, false otherwise
+        """
+        return self._using_individual_summoner_spell
+
+    def is_using_individual_rune(self) -> bool:
+        """
+        :return: True if this profile should use individual rune per champion to pick, false otherwise
+        """
+        return self._using_individual_rune
+
+    def get_summoner_spells_to_pick(self, champion_id: int | None) -> tuple[int, int] | None:
+        """
+        :param champion_id: id of the champion that will be picked, or None if no champion will be picked.
+        :return: id of the summoner spells that should be selected, or None if none are configured.
+        """
+        if self._using_individual_summoner_spell:
+            return self._summoner_spells_id_per_champion.get(champion_id) if champion_id is not None else None
+        return self._summoner_spells_id_global
+
+    def get_rune_to_pick(self, champion_id: int | None) -> int | None:
+        """
+        :param champion_id: id of the champion that will be picked, or None if no champion will be picked.
+        :return: id of the rune that should be selected, or None if no champion will be picked with individual runes.
+        """
+        if self._using_individual_rune:
+            return self._rune_id_per_champion.get(champion_id, 0) if champion_id is not None else None
+        return self._rune_id_global
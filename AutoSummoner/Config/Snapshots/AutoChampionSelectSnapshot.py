@@ -0,0 +1,62 @@
+"""Module containing the AutoChampionSelectSnapshot class."""
+from AutoSummoner.Config.Features.ConfigAutoChampionSelect import ConfigAutoChampionSelect
+from AutoSummoner.Config.ProfileIndex import ProfileIndex
+from AutoSummoner.Config.Snapshots.AutoChampionSelectProfileSnapshot import AutoChampionSelectProfileSnapshot
+from AutoSummoner.Config.Snapshots.FrozenSnapshot import FrozenSnapshot
+
+
+class AutoChampionSelectSnapshot(FrozenSnapshot):
+    """Immutable snapshot of the Auto Champion Select configuration."""
+    __slots__ = ("_enabled", "_lock_in_offset", "_profiles", "_profile_index")
+    _enabled: bool
+    _lock_in_offset: int
+    _profiles: tuple[AutoChampionSelectProfileSnapshot, ...]
+    _profile_index: ProfileIndex
+
+    def __init__(self, config_auto_champion_select: ConfigAutoChampionSelect, previous_snapshot=None, changed_sections: set[str] = None):
+        """
+        Compiles the auto champion select configuration and its profiles.
+        Profiles of the previous snapshot whose section did not change are reused as is.
+        :param config_auto_champion_select: the auto champion select configuration.
+        :param previous_snapshot: the previous auto champion select snapshot, or None to compile every profile.
+        :param changed_sections: sections changed since the previous snapshot.
+        """
+        previous_profiles = {} if previous_snapshot is None else {profile.get_id(): profile for profile in previous_snapshot.get_all_profiles()}
+        if changed_sections is None:
+            changed_sections = set()
+        profiles = tuple(previous_profiles[profile.get_id()]
+                         if profile.get_id() in previous_profiles and profile.section not in changed_sections
+                         else AutoChampionSelectProfileSnapshot(profile)
+                         for profile in config_auto_champion_select.get_all_profiles())
+        section = config_auto_champion_select.SECTION
+        self._freeze(_enabled=self._read(config_auto_champion_select.is_enabled, False, section, "enabled"),
+                     _lock_in_offset=self._read(config_auto_champion_select.get_lock_in_offset, 0, section, "lock_in_offset"),
+                     _profiles=profiles,
+                     _profile_index=ProfileIndex(profiles))
+
+    def is_enabled(self) -> bool:
+        """
+        :return: True if auto champion select is enabled, False otherwise.
+        """
+        return self._enabled
+
+    def get_lock_in_offset(self) -> int:
+        """
+        :return: time (in milliseconds) before the end of the pick turn at which the champion is locked in,
+        or 0 if it is locked in immediately.
+        """
+        return self._lock_in_offset
+
+    def get_all_profiles(self) -> tuple[AutoChampionSelectProfileSnapshot, ...]:
+        """
+        :return: all auto champion select profiles
+        """
+        return self._profiles
+
+    def find_profile_config(self, queue_id: int, position: str) -> AutoChampionSelectProfileSnapshot | None:
+        """
+        :param queue_id: requested queue_id
+        :param position: requested position
+        :return: an auto champion select profile which can be used for the given queue id and position, or None if no profile could be found
+        """
+        return self._profile_index.find(queue_id, position)
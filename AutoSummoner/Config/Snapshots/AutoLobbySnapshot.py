@@ -0,0 +1,61 @@
+"""Module containing the AutoLobbySnapshot class."""
+from AutoSummoner.Config.Features.ConfigAutoLobby import ConfigAutoLobby
+from AutoSummoner.Config.Snapshots.FrozenSnapshot import FrozenSnapshot
+from AutoSummoner.LcuInterface.Position import Position
+
+
+class AutoLobbySnapshot(FrozenSnapshot):
+    """Immutable snapshot of the Auto Lobby configuration."""
+    __slots__ = ("_enabled", "_auto_select_queue_enabled", "_auto_select_queue_id",
+                 "_auto_select_roles_enabled", "_auto_select_roles")
+    _enabled: bool
+    _auto_select_queue_enabled: bool
+    _auto_select_queue_id: int
+    _auto_select_roles_enabled: bool
+    _auto_select_roles: tuple[Position, Position]
+
+    def __init__(self, config_auto_lobby: ConfigAutoLobby):
+        """
+        Compiles the auto lobby configuration.
+        :param config_auto_lobby: the auto lobby configuration.
+        """
+        section = config_auto_lobby.SECTION
+        self._freeze(_enabled=self._read(config_auto_lobby.is_enabled, False, section, "enabled"),
+                     _auto_select_queue_enabled=self._read(config_auto_lobby.is_auto_select_queue_enabled, False,
+                                                           section, "auto_select_queue"),
+                     _auto_select_queue_id=self._read(config_auto_lobby.get_auto_select_queue_id, 0,
+                                                      config_auto_lobby.SECTION_AUTO_SELECT_QUEUE, "queue_id"),
+                     _auto_select_roles_enabled=self._read(config_auto_lobby.is_auto_select_roles_enabled, False,
+                                                           section, "auto_select_roles"),
+                     _auto_select_roles=self._read(config_auto_lobby.get_auto_select_roles, (Position.TOP, Position.MIDDLE),
+                                                   config_auto_lobby.SECTION_AUTO_SELECT_ROLES, "first_preference, second_preference"))
+
+    def is_enabled(self) -> bool:
+        """
+        :return: True if auto lobby is enabled, False otherwise.
+        """
+        return self._enabled
+
+    def is_auto_select_queue_enabled(self) -> bool:
+        """
+        :return: True if auto select queue is enabled, False otherwise.
+        """
+        return self._auto_select_queue_enabled
+
+    def get_auto_select_queue_id(self) -> int:
+        """
+        :return: the id of the queue which should be selected automatically or 0 it wasn't configured
+        """
+        return self._auto_select_queue_id
+
+    def is_auto_select_roles_enabled(self) -> bool:
+        """
+        :return: True if auto select roles is enabled, False otherwise.
+        """
+        return self._auto_select_roles_enabled
+
+    def get_auto_select_roles(self) -> tuple[Position, Position]:
+        """
+        :return: the roles which should be automatically selected.
+        """
+        return self._auto_select_roles
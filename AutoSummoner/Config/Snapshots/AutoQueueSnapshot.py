@@ -0,0 +1,39 @@
+"""Module containing the AutoQueueSnapshot class."""
+from AutoSummoner.Config.Features.ConfigAutoQueue import ConfigAutoQueue
+from AutoSummoner.Config.Snapshots.FrozenSnapshot import FrozenSnapshot
+
+
+class AutoQueueSnapshot(FrozenSnapshot):
+    """Immutable snapshot of the Auto Queue configuration."""
+    __slots__ = ("_enabled", "_auto_start_queue_enabled", "_auto_accept_match_enabled")
+    _enabled: bool
+    _auto_start_queue_enabled: bool
+    _auto_accept_match_enabled: bool
+
+    def __init__(self, config_auto_queue: ConfigAutoQueue):
+        """
+        Compiles the auto queue configuration.
+        :param config_auto_queue: the auto queue configuration.
+        """
+        section = config_auto_queue.SECTION
+        self._freeze(_enabled=self._read(config_auto_queue.is_enabled, False, section, "enabled"),
+                     _auto_start_queue_enabled=self._read(config_auto_queue.is_auto_start_queue_enabled, False, section, "auto_start_queue"),
+                     _auto_accept_match_enabled=self._read(config_auto_queue.is_auto_accept_match_enabled, False, section, "auto_accept_match"))
+
+    def is_enabled(self) -> bool:
+        """
+        :return: True if auto queue is enabled, False otherwise.
+        """
+        return self._enabled
+
+    def is_auto_start_queue_enabled(self) -> bool:
+        """
+        :return: True if auto start queue is enabled, False otherwise.
+        """
+        return self._auto_start_queue_enabled
+
+    def is_auto_accept_match_enabled(self) -> bool:
+        """
+        :return: True if auto accept match is enabled, False otherwise.
+        """
+        return self._auto_accept_match_enabled
@@ -0,0 +1,68 @@
+"""Module containing the ConfigSnapshot class."""
+from types import MappingProxyType
+
+from AutoSummoner.Config.ConfigChange import ConfigChange
+from AutoSummoner.Config.Features.ConfigAutoLobby import ConfigAutoLobby
+from AutoSummoner.Config.Features.ConfigAutoQueue import ConfigAutoQueue
+from AutoSummoner.Config.MainFeatures import MainFeatures
+from AutoSummoner.Config.Snapshots.AutoChampionSelectSnapshot import AutoChampionSelectSnapshot
+from AutoSummoner.Config.Snapshots.AutoLobbySnapshot import AutoLobbySnapshot
+from AutoSummoner.Config.Snapshots.AutoQueueSnapshot import AutoQueueSnapshot
+from AutoSummoner.Config.Snapshots.FrozenSnapshot import FrozenSnapshot
+
+
+class ConfigSnapshot(FrozenSnapshot):
+    """Immutable snapshot of the whole AutoSummoner configuration at a given version."""
+    __slots__ = ("_version", "_feature_snapshots")
+    _version: int
+    _feature_snapshots: MappingProxyType[MainFeatures, AutoLobbySnapshot | AutoQueueSnapshot | AutoChampionSelectSnapshot]
+
+    def __init__(self, version: int, config, previous_snapshot=None, changes: list[ConfigChange] = None):
+        """
+        Compiles the configuration.
+        When a previous snapshot and the changes made since are given, the unchanged parts of the previous snapshot are reused.
+        :param version: version of the configuration being compiled.
+        :param config: the Configuration object.
+        :param previous_snapshot: the previous snapshot of the configuration, or None.
+        :param changes: changes made to the configuration since the previous snapshot, or None if unknown.
+        """
+        changed_sections = None if previous_snapshot is None or changes is None else {change.section for change in changes}
+
+        if changed_sections is not None and changed_sections.isdisjoint(ConfigAutoLobby.SECTIONS):
+            auto_lobby_snapshot = previous_snapshot.get_feature_configuration(MainFeatures.AUTO_LOBBY)
+        else:
+            auto_lobby_snapshot = AutoLobbySnapshot(config.get_feature_configuration(MainFeatures.AUTO_LOBBY))
+
+        if changed_sections is not None and ConfigAutoQueue.SECTION not in changed_sections:
+            auto_queue_snapshot = previous_snapshot.get_feature_configuration(MainFeatures.AUTO_QUEUE)
+        else:
+            auto_queue_snapshot = AutoQueueSnapshot(config.get_feature_configuration(MainFeatures.AUTO_QUEUE))
+
+        config_auto_champion_select = config.get_feature_configuration(MainFeatures.AUTO_CHAMPION_SELECT)
+        if changed_sections is not None and not any(section.startswith(config_auto_champion_select.SECTION) for section in changed_sections):
+            auto_champion_select_snapshot = previous_snapshot.get_feature_configuration(MainFeatures.AUTO_CHAMPION_SELECT)
+        else:
+            auto_champion_select_snapshot = AutoChampionSelectSnapshot(
+                config_auto_champion_select,
+                previous_snapshot.get_feature_configuration(MainFeatures.AUTO_CHAMPION_SELECT) if changed_sections is not None else None,
+                changed_sections)
+
+        self._freeze(_version=version,
+                     _feature_snapshots=MappingProxyType({
+                         MainFeatures.AUTO_LOBBY: auto_lobby_snapshot,
+                         MainFeatures.AUTO_QUEUE: auto_queue_snapshot,
+                         MainFeatures.AUTO_CHAMPION_SELECT: auto_champion_select_snapshot
+                     }))
+
+    def get_version(self) -> int:
+        """
+        :return: the version of the configuration this snapshot was compiled from.
+        """
+        return self._version
+
+    def get_feature_configuration(self, feature: MainFeatures) -> AutoLobbySnapshot | AutoQueueSnapshot | AutoChampionSelectSnapshot:
+        """
+        :param feature: requested main feature
+        :return: the snapshot of the feature configuration
+        """
+        return self._feature_snapshots[feature]
@@ -0,0 +1,39 @@
+"""Module containing the FrozenSnapshot class."""
+from typing import Any, Callable
+
+
+class FrozenSnapshot:
+    """Base class of the immutable configuration snapshots."""
+    __slots__ = ()
+
+    def _freeze(self, **values) -> None:
+        """
+        Sets the values of the snapshot, only meant to be called from the snapshot constructor.
+        :param values: values of the snapshot slots.
+        """
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    @staticmethod
+    def _read(getter: Callable[[], Any], default: Any, section: str, key: str) -> Any:
+        """
+        Reads a configuration value while compiling a snapshot.
+        An invalid stored value is left as is in the configuration, a warning is printed and the default value is used,
+        so that a single bad value does not prevent the whole configuration from being compiled.
+        :param getter: function reading and parsing the value.
+        :param default: value used when the stored value is invalid.
+        :param section: section of the value, shown in the warning.
+        :param key: key of the value, shown in the warning.
+        :return: the parsed value, or the default value.
+        """
+        try:
+            return getter()
+        except (ValueError, IndexError) as e:
+            print(f"Invalid configuration value {key} in [{section}], the default value is used !\n", e)
+            return default
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
@@ -0,0 +1,56 @@
+"""Module containing the ActionLatencyRecorder class."""
+import json
+import threading
+
+from AutoSummoner.LcuInterface.ActionTrace import ActionTrace
+from AutoSummoner.LcuInterface.LatencyHistogram import LatencyHistogram
+
+
+class ActionLatencyRecorder:
+    """
+    Class aggregating the traces of the actions sent to the League client into latency histograms, per action and stage:
+    "decision" (event received to action decided), "wait" (action decided to request sent, including scheduling delays),
+    "response" (request sent to response received) and "total" (event received to response received).
+    Traces are recorded by the LCU worker thread, the histograms can be read from any thread.
+    """
+
+    STAGES = ("decision", "wait", "response", "total")
+
+    def __init__(self):
+        """
+        Initializes the recorder.
+        """
+        self.__histograms: dict[str, dict[str, LatencyHistogram]] = {}
+        self.__lock = threading.Lock()
+
+    def record(self, action: str, trace: ActionTrace) -> None:
+        """
+        Records a completed action, traces whose request was not sent or answered are ignored.
+        :param action: name of the action (ready_check_accept, ban, pick, rune, spells...).
+        :param trace: trace of the action.
+        """
+        if trace.sent is None or trace.responded is None:
+            return
+        decided = trace.decided if trace.decided is not None else trace.sent
+        latencies = (decided - trace.received, trace.sent - decided, trace.responded - trace.sent, trace.responded - trace.received)
+        with self.__lock:
+            histograms = self.__histograms.setdefault(action, {stage: LatencyHistogram() for stage in self.STAGES})
+            for stage, latency in zip(self.STAGES, latencies):
+                histograms[stage].add(max(latency, 0) * 1000)
+
+    def get_summary(self) -> dict[str, dict[str, dict]]:
+        """
+        :return: for each action and stage, the number of actions, percentiles and maximum latency (in milliseconds)
+        and the count of each bucket.
+        """
+        with self.__lock:
+            return {action: {stage: histogram.to_dict() for stage, histogram in histograms.items()}
+                    for action, histograms in self.__histograms.items()}
+
+    def dump(self, path: str) -> None:
+        """
+        Writes the summary to a JSON file.
+        :param path: path of the file.
+        """
+        with open(path, "w", encoding="utf-8") as dump_file:
+            json.dump(self.get_summary(), dump_file, indent=2)
@@ -0,0 +1,139 @@
+"""Module containing the ActionScheduler class."""
+import asyncio
+import time
+from typing import Awaitable, Callable, Hashable
+
+
+class ActionScheduler:
+    """
+    Class running champion select actions before their deadline.
+    Pending actions run one at a time, the action with the least remaining time first.
+    An action can be delayed until a given time before its deadline (e.g. to lock in a champion as late as possible),
+    and is retried with an exponential backoff until its deadline when it fails.
+    Scheduling an action again replaces the pending one with the same key, an action which succeeded is not run again
+    until the scheduler is cleared.
+    """
+
+    DEFAULT_TIME_LEFT = 30.0
+    MIN_BACKOFF = 0.1
+    MAX_BACKOFF = 1.0
+
+    def __init__(self):
+        """
+        Initializes the action scheduler.
+        """
+        self.__pending: dict[Hashable, tuple[float, float, Callable[[], Awaitable[bool]], float]] = {}
+        self.__running: set[Hashable] = set()
+        self.__done: set[Hashable] = set()
+        self.__wakeup: asyncio.Event | None = None
+        self.__task: asyncio.Future | None = None
+        self.__statistics = {"executed": 0, "retried": 0, "missed": 0}
+
+    @classmethod
+    def get_deadline(cls, champion_select_state: dict) -> float:
+        """
+        :param champion_select_state: current champion select state dictionary.
+        :return: the time (time.monotonic() clock) at which the current champion select phase ends.
+        """
+        timer = champion_select_state.get("timer", {})
+        time_left = timer.get("adjustedTimeLeftInPhase")
+        if not isinstance(time_left, (int, float)) or time_left <= 0:
+            return time.monotonic() + cls.DEFAULT_TIME_LEFT
+
+        # The time left was computed by the client at internalNowInEpochMs, the client runs on the same machine
+        computed_at = timer.get("internalNowInEpochMs")
+        elapsed = max(time.time() * 1000 - computed_at, 0) if isinstance(computed_at, (int, float)) and computed_at > 0 else 0
+        return time.monotonic() + max(time_left - elapsed, 0) / 1000
+
+    def schedule(self, key: Hashable, action_function: Callable[[], Awaitable[bool]], deadline: float, offset: float = 0) -> None:
+        """
+        Schedules an action, must be called from the event loop thread.
+        :param key: key identifying the action.
+        :param action_function: function running the action, returns True when the action succeeded.
+        :param deadline: time (time.monotonic() clock) after which the action cannot be run anymore.
+        :param offset: time (in seconds) before the deadline at which the action is run, or 0 to run it immediately.
+        """
+        if key in self.__done or key in self.__running:
+            return
+        not_before = deadline - offset if offset > 0 else 0
+        backoff = self.MIN_BACKOFF
+        if key in self.__pending:
+            # A pending retry keeps its backoff
+            _, previous_not_before, _, backoff = self.__pending[key]
+            not_before = max(not_before, previous_not_before)
+        self.__pending[key] = (deadline, not_before, action_function, backoff)
+        if self.__task is None or self.__task.done():
+            self.__wakeup = asyncio.Event()
+            self.__task = asyncio.ensure_future(self.__run())
+        self.__wakeup.set()
+
+    def cancel(self, key: Hashable) -> None:
+        """
+        Cancels a pending action.
+        :param key: key identifying the action.
+        """
+        self.__pending.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Cancels all pending actions and forgets the actions which succeeded, called when champion select ends.
+        """
+        self.__pending.clear()
+        self.__done.clear()
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+        self.__running.clear()
+
+    def get_statistics(self) -> dict[str, int]:
+        """
+        :return: number of actions run, number of retries, number of actions which missed their deadline and number of pending actions.
+        """
+        return {**self.__statistics, "pending": len(self.__pending)}
+
+    async def __run(self) -> None:
+        """
+        Runs the pending actions until there are none left.
+        """
+        while self.__pending:
+            now = time.monotonic()
+            for key in [key for key, (deadline, _, _, _) in self.__pending.items() if deadline <= now]:
+                self.__pending.pop(key)
+                self.__statistics["missed"] += 1
+                print(f"Champion select action {key} missed its deadline !")
+
+            ready = [(deadline, key) for key, (deadline, not_before, _, _) in self.__pending.items() if not_before <= now]
+            if not ready:
+                if self.__pending:
+                    next_start = min(not_before for _, not_before, _, _ in self.__pending.values())
+                    await self.__sleep(next_start - now)
+                continue
+
+            _, key = min(ready, key=lambda item: item[0])
+            deadline, _, action_function, backoff = self.__pending.pop(key)
+            self.__running.add(key)
+            try:
+                succeeded = await action_function()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                print(f"Failed to run champion select action {key} !\n", e)
+                succeeded = False
+            finally:
+                self.__running.discard(key)
+                self.__statistics["executed"] += 1
+
+            if succeeded:
+                self.__done.add(key)
+            elif time.monotonic() + backoff < deadline:
+                self.__statistics["retried"] += 1
+                self.__pending[key] = (deadline, time.monotonic() + backoff, action_function, min(backoff * 2, self.MAX_BACKOFF))
+
+    async def __sleep(self, duration: float) -> None:
+        """
+        Waits for the given duration, or until an action is scheduled.
+        :param duration: maximum duration (in seconds).
+        """
+        self.__wakeup.clear()
+        try:
+            await asyncio.wait_for(self.__wakeup.wait(), timeout=max(duration, 0))
+        except asyncio.TimeoutError:
+            pass
@@ -0,0 +1,41 @@
+"""Module containing the ActionTrace class."""
+import time
+
+
+class ActionTrace:
+    """
+    Class holding the timestamps (time.perf_counter() clock) of an action, from the reception of the LCU event
+    which triggered it to the response of the League client.
+    """
+    __slots__ = ("received", "decided", "sent", "responded")
+
+    def __init__(self, received: float = None):
+        """
+        Initializes the trace.
+        :param received: time at which the LCU event was received, or None to use the current time.
+        """
+        self.received = received if received is not None else time.perf_counter()
+        self.decided: float | None = None
+        self.sent: float | None = None
+        self.responded: float | None = None
+
+    def decide(self) -> "ActionTrace":
+        """
+        Records the time at which the action was decided.
+        :return: the trace itself.
+        """
+        self.decided = time.perf_counter()
+        return self
+
+    def on_request_sent(self) -> None:
+        """
+        Records the time at which the first request of the action was sent.
+        """
+        if self.sent is None:
+            self.sent = time.perf_counter()
+
+    def on_response_received(self) -> None:
+        """
+        Records the time at which the last response of the action was received.
+        """
+        self.responded = time.perf_counter()
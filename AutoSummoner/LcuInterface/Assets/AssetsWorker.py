@@ -9,6 +9,9 @@ from AutoSummoner.LcuInterface.Assets.Champion import Champion
 class AssetsWorker(QObject):
     """Asset worker responsible for loading static assets in the background"""
 
+    CHAMPIONS_URL = 'https://raw.communitydragon.org/latest/plugins/rcp-be-lol-game-data/global/default/v1/champion-summary.json'
+    SUMMONER_SPELLS_URL = 'https://raw.communitydragon.org/latest/plugins/rcp-be-lol-game-data/global/default/v1/summoner-spells.json'
+
     __champions_dict = {}
     __summoner_spells_dict = {}
 
@@ -29,19 +32,27 @@ class AssetsWorker(QObject):
         Loads all League of Legends champions data from the community dragon API
         """
         try:
-            response = requests.get('https://raw.communitydragon.org/latest/plugins/rcp-be-lol-game-data/global/default/v1/champion-summary.json', timeout=30)
-            champions = response.json()
+            self.__champions_dict = self.fetch_champions()
         except requests.exceptions.RequestException as e:
             print("Failed to get champion list !\n", e)
             return
 
-        self.__champions_dict = {}
-        for champion in champions:
+        self.champions_loaded.emit(self.__champions_dict)
+
+    @staticmethod
+    def fetch_champions() -> dict[int, Champion]:
+        """
+        Loads all League of Legends champions data from the community dragon API
+        :return: the champions by id, sorted by name
+        :raises requests.exceptions.RequestException: if the champion list could not be loaded
+        """
+        response = requests.get(AssetsWorker.CHAMPIONS_URL, timeout=30)
+        champions_dict = {}
+        for champion in response.json():
             if champion["id"] > 0:
-                self.__champions_dict[champion["id"]] = Champion(champion["id"], champion["name"])
+                champions_dict[champion["id"]] = Champion(champion["id"], champion["name"])
 
-        self.__champions_dict = dict(sorted(self.__champions_dict.items(), key=lambda champ: champ[1].name()))
-        self.champions_loaded.emit(self.__champions_dict)
+        return dict(sorted(champions_dict.items(), key=lambda champ: champ[1].name()))
 
     def __load_summoner_spells(self):
         """
@@ -49,7 +60,7 @@ class AssetsWorker(QObject):
         """
         summoners_spells = []
         try:
-            response = requests.get('https://raw.communitydragon.org/latest/plugins/rcp-be-lol-game-data/global/default/v1/summoner-spells.json', timeout=30)
+            response = requests.get(self.SUMMONER_SPELLS_URL, timeout=30)
             summoners_spells = response.json()
         except requests.exceptions.RequestException as e:
             print("Failed to get summoner spell list !\n", e)
@@ -0,0 +1,76 @@
+"""Module containing the BootstrapCache class."""
+import json
+import os
+import tempfile
+import threading
+
+
+class BootstrapCache:
+    """
+    Class storing the League client data loaded when AutoSummoner connects (queues, owned champions, rune pages),
+    so that the UI can be populated before the client answers on the next start.
+    Data is stored per summoner and client version, only the most recent entries are kept.
+    """
+
+    DEFAULT_PATH = "lcu_cache.json"
+    MAX_ENTRIES = 4
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        """
+        Initializes the bootstrap cache.
+        :param path: path of the cache file.
+        """
+        self.__path = path
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def get_key(summoner: dict, game_version: str) -> str | None:
+        """
+        :param summoner: current summoner dictionary.
+        :param game_version: version of the League client.
+        :return: the cache key of the summoner and client version, or None if one of them is unknown.
+        """
+        if not isinstance(summoner, dict) or not isinstance(game_version, str) or "puuid" not in summoner:
+            return None
+        return summoner["puuid"] + "/" + game_version
+
+    def load(self, key: str) -> dict | None:
+        """
+        :param key: cache key.
+        :return: the data stored for the key, or None if there is none.
+        """
+        return self.__read_entries().get(key)
+
+    def save(self, key: str, data: dict) -> None:
+        """
+        Stores the data for the key, the cache file is replaced atomically.
+        :param key: cache key.
+        :param data: JSON serializable data.
+        """
+        with self.__lock:
+            entries = self.__read_entries()
+            entries.pop(key, None)
+            entries[key] = data
+            entries = dict(list(entries.items())[-self.MAX_ENTRIES:])
+
+            directory = os.path.dirname(os.path.abspath(self.__path))
+            file_descriptor, temporary_path = tempfile.mkstemp(prefix=".lcu_cache-", suffix=".tmp", dir=directory)
+            try:
+                with os.fdopen(file_descriptor, "w", encoding="utf-8") as temporary_file:
+                    json.dump(entries, temporary_file, separators=(",", ":"))
+                os.replace(temporary_path, self.__path)
+            except OSError as e:
+                if os.path.exists(temporary_path):
+                    os.remove(temporary_path)
+                print("Failed to save League client cache !\n", e)
+
+    def __read_entries(self) -> dict[str, dict]:
+        """
+        :return: all the cache entries, from the oldest to the most recent.
+        """
+        try:
+            with open(self.__path, encoding="utf-8") as cache_file:
+                entries = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
@@ -0,0 +1,173 @@
+"""Module containing the ChampionSelectTracker class."""
+from collections import Counter
+
+from AutoSummoner.Config.Snapshots.AutoChampionSelectProfileSnapshot import AutoChampionSelectProfileSnapshot
+
+
+class ChampionSelectTracker:
+    """
+    Class tracking the state of a champion select session.
+    Every session update is compared with the previous one action by action, the banned, picked and hovered champions
+    are only updated for the actions which changed.
+    """
+    # pylint: disable=too-many-instance-attributes
+    # Each derived champion set is kept up-to-date incrementally, so that updates do not rescan the whole session
+
+    def __init__(self):
+        """
+        Initializes the champion select tracker.
+        """
+        self.__session_key = None
+        self.__actions: dict[int, tuple] = {}
+        self.__local_actions: dict[int, dict] = {}
+        self.__banned_champions = Counter()
+        self.__picked_champions = Counter()
+        self.__hovered_champions = Counter()
+        self.__revision = 0
+        self.__cached_choices: dict[tuple[str, AutoChampionSelectProfileSnapshot], int | None] = {}
+
+    def reset(self) -> None:
+        """
+        Forgets the current session, called when the champion select ends.
+        """
+        self.__session_key = None
+        self.__actions.clear()
+        self.__local_actions.clear()
+        self.__banned_champions.clear()
+        self.__picked_champions.clear()
+        self.__hovered_champions.clear()
+        self.__revision += 1
+        self.__cached_choices.clear()
+
+    def update(self, champion_select_state: dict) -> bool:
+        """
+        Applies a new champion select session.
+        :param champion_select_state: current champion select state dictionary.
+        :return: True if an action changed since the previous session update, False otherwise.
+        """
+        local_player_cell_id = champion_select_state["localPlayerCellId"]
+        session_key = (champion_select_state.get("gameId"), local_player_cell_id)
+        changed = session_key != self.__session_key
+        if changed:
+            self.reset()
+            self.__session_key = session_key
+
+        seen_actions_id = set()
+        for action in champion_select_state["actions"]:
+            for subaction in action:
+                action_id = subaction["id"]
+                seen_actions_id.add(action_id)
+                state = (subaction["type"], subaction["actorCellId"], subaction["championId"],
+                         subaction["completed"], subaction["isInProgress"])
+                previous_state = self.__actions.get(action_id)
+                if state == previous_state:
+                    continue
+
+                changed = True
+                if previous_state is not None:
+                    self.__apply_action_state(previous_state, local_player_cell_id, -1)
+                self.__apply_action_state(state, local_player_cell_id, 1)
+                self.__actions[action_id] = state
+                if subaction["actorCellId"] == local_player_cell_id and not subaction["completed"]:
+                    self.__local_actions[action_id] = subaction
+                else:
+                    self.__local_actions.pop(action_id, None)
+
+        for action_id in [action_id for action_id in self.__actions if action_id not in seen_actions_id]:
+            changed = True
+            self.__apply_action_state(self.__actions.pop(action_id), local_player_cell_id, -1)
+            self.__local_actions.pop(action_id, None)
+
+        if changed:
+            self.__revision += 1
+            self.__cached_choices.clear()
+        return changed
+
+    def __apply_action_state(self, state: tuple, local_player_cell_id: int, count: int) -> None:
+        """
+        Adds or removes the champion of an action to the banned, picked and hovered champions.
+        :param state: state of the action (type, actor cell id, champion id, completed, in progress).
+        :param local_player_cell_id: cell id of the local player.
+        :param count: 1 to add the champion, -1 to remove it.
+        """
+        action_type, actor_cell_id, champion_id, completed, _ = state
+        if action_type == "ban" and completed:
+            self.__update_counter(self.__banned_champions, champion_id, count)
+        elif action_type == "pick" and actor_cell_id != local_player_cell_id:
+            self.__update_counter(self.__picked_champions, champion_id, count)
+            if not completed and champion_id != 0:
+                self.__update_counter(self.__hovered_champions, champion_id, count)
+
+    @staticmethod
+    def __update_counter(counter: Counter, champion_id: int, count: int) -> None:
+        """
+        :param counter: champion counter to update.
+        :param champion_id: champion id.
+        :param count: 1 to add the champion, -1 to remove it.
+        """
+        counter[champion_id] += count
+        if counter[champion_id] <= 0:
+            del counter[champion_id]
+
+    def get_revision(self) -> int:
+        """
+        :return: a number incremented every time the session changes.
+        """
+        return self.__revision
+
+    def get_banned_champions(self) -> set[int]:
+        """
+        :return: id of the champions banned by completed ban actions.
+        """
+        return set(self.__banned_champions)
+
+    def get_picked_champions(self) -> set[int]:
+        """
+        :return: id of the champions picked or hovered by other players.
+        """
+        return set(self.__picked_champions)
+
+    def get_hovered_champions(self) -> set[int]:
+        """
+        :return: id of the champions hovered by other players, not locked in yet.
+        """
+        return set(self.__hovered_champions)
+
+    def get_local_actions(self) -> list[dict]:
+        """
+        :return: the actions of the local player which are not completed yet, in their champion select order.
+        """
+        return [self.__local_actions[action_id] for action_id in sorted(self.__local_actions)]
+
+    def is_unavailable(self, champion_id: int) -> bool:
+        """
+        :param champion_id: champion id.
+        :return: True if the champion is banned or picked by another player, False otherwise.
+        """
+        return champion_id in self.__banned_champions or champion_id in self.__picked_champions
+
+    def get_champion_to_pick(self, profile: AutoChampionSelectProfileSnapshot) -> int | None:
+        """
+        :param profile: auto champion select profile.
+        :return: the first champion of the profile pick list which is neither banned nor picked, or None.
+        """
+        return self.__get_first_available(("pick", profile), profile.get_champions_pick_id())
+
+    def get_champion_to_ban(self, profile: AutoChampionSelectProfileSnapshot) -> int | None:
+        """
+        :param profile: auto champion select profile.
+        :return: the first champion of the profile ban list which is neither banned nor picked, or None.
+        """
+        return self.__get_first_available(("ban", profile), profile.get_champions_ban_id())
+
+    def __get_first_available(self, cache_key: tuple[str, AutoChampionSelectProfileSnapshot], champions_id: tuple[int, ...]) -> int | None:
+        """
+        The result is kept until the session changes, as profiles snapshots are never modified.
+        :param cache_key: key of the result in the cache.
+        :param champions_id: champions id ordered by priority.
+        :return: the first available champion, or None.
+        """
+        if cache_key not in self.__cached_choices:
+            self.__cached_choices[cache_key] = next(
+                (champion_id for champion_id in champions_id if not self.is_unavailable(champion_id)), None)
+        return self.__cached_choices[cache_key]
@@ -0,0 +1,65 @@
+"""Module containing the CoalescingDispatcher class."""
+import time
+from typing import Any, Awaitable, Callable
+
+from lcu_driver.connection import Connection
+
+
+class CoalescingDispatcher:
+    """
+    Class dispatching LCU states to a processing coroutine, the latest state wins.
+    A single processing pass runs at a time, states received during a pass replace each other
+    and only the most recent one is processed once the pass is over.
+    """
+
+    def __init__(self, process_function: Callable[[Connection, Any], Awaitable[None]]):
+        """
+        Initializes the dispatcher.
+        :param process_function: coroutine processing a state, called with the LCU connection and the state.
+        """
+        self.__process_function = process_function
+        self.__latest_state: tuple[Connection, Any, float] | None = None
+        self.__state_received_time = 0.0
+        self.__processing = False
+        self.__received = 0
+        self.__processed = 0
+
+    async def dispatch(self, connection: Connection, state: Any) -> None:
+        """
+        Processes the state, or keeps it for later if a processing pass is already running.
+        Must be called from the event loop thread.
+        :param connection: LCU connection.
+        :param state: the new state.
+        """
+        self.__received += 1
+        self.__latest_state = (connection, state, time.perf_counter())
+        if self.__processing:
+            return
+
+        self.__processing = True
+        try:
+            while self.__latest_state is not None:
+                connection, state, self.__state_received_time = self.__latest_state
+                self.__latest_state = None
+                self.__processed += 1
+                try:
+                    await self.__process_function(connection, state)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    print("Failed to process LCU state !\n", e)
+        finally:
+            self.__processing = False
+
+    def get_state_received_time(self) -> float:
+        """
+        :return: the time (time.perf_counter() clock) at which the state being processed was received.
+        """
+        return self.__state_received_time
+
+    def get_statistics(self) -> dict[str, int]:
+        """
+        :return: number of states received, number of states processed and number of states dropped
+        because a more recent state was received.
+        """
+        return {"received": self.__received,
+                "processed": self.__processed,
+                "coalesced": self.__received - self.__processed - (1 if self.__latest_state is not None else 0)}
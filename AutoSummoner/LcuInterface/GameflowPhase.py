@@ -0,0 +1,29 @@
+"""Module containing the GameflowPhase Enum"""
+from enum import Enum
+
+
+class GameflowPhase(str, Enum):
+    """Enum of the League client gameflow phases."""
+    NONE = "None"
+    LOBBY = "Lobby"
+    MATCHMAKING = "Matchmaking"
+    CHECKED_INTO_TOURNAMENT = "CheckedIntoTournament"
+    READY_CHECK = "ReadyCheck"
+    CHAMP_SELECT = "ChampSelect"
+    GAME_START = "GameStart"
+    FAILED_TO_LAUNCH = "FailedToLaunch"
+    IN_PROGRESS = "InProgress"
+    RECONNECT = "Reconnect"
+    WAITING_FOR_STATS = "WaitingForStats"
+    PRE_END_OF_GAME = "PreEndOfGame"
+    END_OF_GAME = "EndOfGame"
+    TERMINATED_IN_ERROR = "TerminatedInError"
+
+    @staticmethod
+    def get_phase(gameflow: dict) -> str:
+        """
+        :param gameflow: League gameflow dictionary.
+        :return: the phase of the gameflow, "None" if the gameflow has no phase.
+        Phases unknown to this Enum are returned as they are.
+        """
+        return gameflow.get("phase", GameflowPhase.NONE.value) if isinstance(gameflow, dict) else GameflowPhase.NONE.value
@@ -0,0 +1,18 @@
+"""Module containing the GameflowState class."""
+from typing import Awaitable, Callable, NamedTuple
+
+from lcu_driver.connection import Connection
+
+GameflowHook = Callable[[Connection, dict], Awaitable[None]]
+
+
+class GameflowState(NamedTuple):
+    """
+    Class describing what AutoSummoner does in a gameflow phase.
+    Hooks are coroutines called with the LCU connection and the gameflow dictionary.
+    The resources to prefetch are fetched when the phase is entered, concurrently with the entry hook.
+    """
+    on_enter: GameflowHook | None = None
+    on_update: GameflowHook | None = None
+    on_exit: GameflowHook | None = None
+    prefetch: tuple[str, ...] = ()
@@ -0,0 +1,108 @@
+"""Module containing the GameflowStateMachine class."""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from lcu_driver.connection import Connection
+
+from AutoSummoner.LcuInterface.GameflowPhase import GameflowPhase
+from AutoSummoner.LcuInterface.GameflowState import GameflowState
+
+
+class GameflowStateMachine:
+    """
+    Table driven state machine of the League client gameflow.
+    On every gameflow update, the exit hook of the previous phase and the entry hook of the new phase are called
+    when the phase changed, then the update hook of the current phase is called.
+    The time spent in each phase and in each transition is recorded.
+    """
+
+    def __init__(self, states: dict[str, GameflowState], default_state: GameflowState,
+                 prefetch_function: Callable[[Connection, str], Awaitable[Any]]):
+        """
+        Initializes the gameflow state machine.
+        :param states: states of the gameflow, by phase.
+        :param default_state: state of the phases which are not in the table.
+        :param prefetch_function: coroutine fetching a resource, called with the LCU connection and the resource URI.
+        """
+        self.__states = states
+        self.__default_state = default_state
+        self.__prefetch_function = prefetch_function
+        self.__phase: str | None = None
+        self.__phase_start = 0.0
+        self.__phase_statistics: dict[str, dict[str, float]] = {}
+        self.__transition_statistics: dict[str, dict[str, float]] = {}
+
+    def reset(self) -> None:
+        """
+        Forgets the current phase without calling its exit hook, called when the LCU connection is (re)established.
+        """
+        self.__phase = None
+
+    def get_phase(self) -> str | None:
+        """
+        :return: the current gameflow phase, or None before the first gameflow update.
+        """
+        return self.__phase
+
+    async def update(self, connection: Connection, gameflow: dict) -> None:
+        """
+        Applies a gameflow update.
+        :param connection: LCU connection.
+        :param gameflow: current League gameflow dictionary.
+        """
+        phase = GameflowPhase.get_phase(gameflow)
+        state = self.__states.get(phase, self.__default_state)
+        if phase != self.__phase:
+            await self.__transition(connection, gameflow, phase, state)
+
+        if state.on_update is not None:
+            await state.on_update(connection, gameflow)
+
+    async def __transition(self, connection: Connection, gameflow: dict, phase: str, state: GameflowState) -> None:
+        """
+        Leaves the current phase and enters the new one.
+        :param connection: LCU connection.
+        :param gameflow: current League gameflow dictionary.
+        :param phase: the new phase.
+        :param state: the state of the new phase.
+        """
+        now = time.perf_counter()
+        previous_phase = self.__phase
+        if previous_phase is not None:
+            self.__record(self.__phase_statistics, previous_phase, now - self.__phase_start)
+            previous_state = self.__states.get(previous_phase, self.__default_state)
+            if previous_state.on_exit is not None:
+                await previous_state.on_exit(connection, gameflow)
+
+        self.__phase = phase
+        self.__phase_start = now
+        entry = [self.__prefetch_function(connection, uri) for uri in state.prefetch]
+        if state.on_enter is not None:
+            entry.append(state.on_enter(connection, gameflow))
+        for result in await asyncio.gather(*entry, return_exceptions=True):
+            if isinstance(result, Exception):
+                print(f"Failed to enter gameflow phase {phase} !\n", result)
+
+        transition = f"{previous_phase if previous_phase is not None else 'Connected'} -> {phase}"
+        self.__record(self.__transition_statistics, transition, time.perf_counter() - now)
+
+    @staticmethod
+    def __record(statistics: dict[str, dict[str, float]], name: str, duration: float) -> None:
+        """
+        :param statistics: statistics to update.
+        :param name: name of the phase or transition.
+        :param duration: duration in seconds.
+        """
+        entry = statistics.setdefault(name, {"count": 0, "total_ms": 0.0, "last_ms": 0.0})
+        entry["count"] += 1
+        entry["total_ms"] += duration * 1000
+        entry["last_ms"] = duration * 1000
+
+    def get_statistics(self) -> dict[str, dict[str, dict[str, float]]]:
+        """
+        :return: number of times, total and last duration (in milliseconds) spent in each phase (the current phase
+        excluded) and in each transition (exit hook, prefetch and entry hook).
+        """
+        return {"phases": {name: dict(entry) for name, entry in self.__phase_statistics.items()},
+                "transitions": {name: dict(entry) for name, entry in self.__transition_statistics.items()}}
@@ -0,0 +1,49 @@
+"""Module containing the InFlightRegistry class."""
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class InFlightRegistry:
+    """
+    Class deduplicating identical LCU requests.
+    While a request is outstanding, the same request (same key) is not sent again,
+    the callers wait for the outstanding request and share its response instead.
+    """
+
+    def __init__(self):
+        """
+        Initializes the in-flight registry.
+        """
+        self.__in_flight: dict[Hashable, asyncio.Task] = {}
+        self.__issued = 0
+        self.__suppressed = 0
+
+    async def request(self, key: Hashable, request_function: Callable[[], Awaitable[T]]) -> T:
+        """
+        Sends a request, unless a request with the same key is still outstanding.
+        Must be called from the event loop thread.
+        :param key: key identifying the request.
+        :param request_function: function sending the request.
+        :return: the response of the request.
+        """
+        task = self.__in_flight.get(key)
+        if task is not None:
+            self.__suppressed += 1
+        else:
+            self.__issued += 1
+            task = asyncio.ensure_future(request_function())
+            self.__in_flight[key] = task
+            task.add_done_callback(lambda _: self.__in_flight.pop(key, None))
+
+        # A cancelled caller must not cancel the request the other callers are waiting for
+        return await asyncio.shield(task)
+
+    def get_statistics(self) -> dict[str, int]:
+        """
+        :return: number of requests sent, number of duplicate requests suppressed and number of outstanding requests.
+        """
+        return {"issued": self.__issued,
+                "suppressed": self.__suppressed,
+                "in_flight": len(self.__in_flight)}
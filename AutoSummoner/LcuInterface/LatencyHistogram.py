@@ -0,0 +1,52 @@
+"""Module containing the LatencyHistogram class."""
+import bisect
+
+
+class LatencyHistogram:
+    """
+    Class counting latencies in fixed buckets, so that percentiles can be computed in constant memory.
+    """
+
+    BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+    def __init__(self):
+        """
+        Initializes an empty histogram.
+        """
+        self.__counts = [0] * (len(self.BOUNDS_MS) + 1)
+        self.__count = 0
+        self.__max = 0.0
+
+    def add(self, latency_ms: float) -> None:
+        """
+        :param latency_ms: latency in milliseconds.
+        """
+        self.__counts[bisect.bisect_left(self.BOUNDS_MS, latency_ms)] += 1
+        self.__count += 1
+        self.__max = max(self.__max, latency_ms)
+
+    def get_percentile(self, percentile: float) -> float:
+        """
+        :param percentile: requested percentile, between 0 and 100.
+        :return: the upper bound (in milliseconds) of the bucket holding the percentile, the maximum latency for the
+        last bucket, or 0 if the histogram is empty.
+        """
+        rank = self.__count * percentile / 100
+        cumulated = 0
+        for index, count in enumerate(self.__counts):
+            cumulated += count
+            if count > 0 and cumulated >= rank:
+                return min(self.BOUNDS_MS[index], self.__max) if index < len(self.BOUNDS_MS) else self.__max
+        return 0.0
+
+    def to_dict(self) -> dict:
+        """
+        :return: the number of latencies, percentiles, maximum latency and the count of each bucket.
+        """
+        return {"count": self.__count,
+                "p50_ms": self.get_percentile(50),
+                "p90_ms": self.get_percentile(90),
+                "p99_ms": self.get_percentile(99),
+                "max_ms": self.__max,
+                "buckets": {f"<={bound}" if index < len(self.BOUNDS_MS) else f">{self.BOUNDS_MS[-1]}": count
+                            for index, (bound, count) in enumerate(zip(self.BOUNDS_MS + (None,), self.__counts))}}
@@ -0,0 +1,100 @@
+"""Module containing the LcuResourceMirror class."""
+import time
+from typing import Any
+
+from aiohttp import ClientResponse
+from lcu_driver.connection import Connection
+from lcu_driver.events.responses import WebsocketEventResponse
+
+from AutoSummoner.LcuInterface.RequestLane import RequestLane
+from AutoSummoner.LcuInterface.RequestLanes import RequestLanes
+
+
+class LcuResourceMirror:
+    """
+    Class keeping a local copy of LCU resources, fed by websocket events.
+    A resource is up-to-date once it was received (by a websocket event or a REST request) and until it is deleted,
+    as the websocket delivers every later change. As a dropped websocket event would otherwise never be noticed,
+    copies older than the maximum age of their resource are also considered stale.
+    Resources which are not up-to-date are fetched with a REST request.
+    """
+
+    DEFAULT_MAX_AGES = {'/lol-gameflow/v1/session': 60.0,
+                        '/lol-lobby/v2/lobby': 60.0,
+                        '/lol-matchmaking/v1/ready-check': 10.0,
+                        '/lol-champ-select/v1/session': 10.0}
+
+    def __init__(self, request_lanes: RequestLanes, max_ages: dict[str, float] = None):
+        """
+        Initializes the resource mirror.
+        :param request_lanes: lanes through which the resources are fetched.
+        :param max_ages: maximum age (in seconds) of the copies by resource URI, resources without one never get stale.
+        """
+        self.__request_lanes = request_lanes
+        self.__max_ages = max_ages if max_ages is not None else self.DEFAULT_MAX_AGES
+        self.__resources: dict[str, tuple[float, Any]] = {}
+        self.__hits = 0
+        self.__misses = 0
+
+    def clear(self) -> None:
+        """
+        Forgets all the resources, called when the websocket connection is established or closed.
+        """
+        self.__resources.clear()
+
+    def apply_event(self, event: WebsocketEventResponse) -> None:
+        """
+        Updates the copy of a resource with a websocket event.
+        :param event: LCU websocket event (creation, update or deletion of the resource).
+        """
+        if event.type.upper() == "DELETE":
+            self.__resources.pop(event.uri, None)
+        else:
+            self.__resources[event.uri] = (time.monotonic(), event.data)
+
+    def get(self, uri: str, max_age: float = None) -> Any | None:
+        """
+        :param uri: URI of the resource.
+        :param max_age: maximum age (in seconds) of the copy, or None to use the maximum age of the resource.
+        :return: the local copy of the resource, or None if there is no usable copy.
+        """
+        if max_age is None:
+            max_age = self.__max_ages.get(uri)
+        resource = self.__resources.get(uri)
+        if resource is None or (max_age is not None and time.monotonic() - resource[0] > max_age):
+            return None
+        return resource[1]
+
+    async def get_or_fetch(self, connection: Connection, uri: str, max_age: float = None) -> Any:
+        """
+        :param connection: LCU connection.
+        :param uri: URI of the resource.
+        :param max_age: maximum age (in seconds) of the copy, or None to use the maximum age of the resource.
+        :return: the local copy of the resource, or the resource fetched with a REST request if there is no usable copy.
+        """
+        resource = self.get(uri, max_age)
+        if resource is not None:
+            self.__hits += 1
+            return resource
+        self.__misses += 1
+        return await self.fetch(connection, uri)
+
+    async def fetch(self, connection: Connection, uri: str) -> Any:
+        """
+        Fetches a resource with a REST request and keeps a copy of it if it exists.
+        :param connection: LCU connection.
+        :param uri: URI of the resource.
+        :return: the JSON response.
+        """
+        response: ClientResponse = await self.__request_lanes.request(connection, RequestLane.STATE, 'get', uri)
+        resource = await response.json()
+        if response.ok:
+            self.__resources[uri] = (time.monotonic(), resource)
+        return resource
+
+    def get_statistics(self) -> dict[str, int]:
+        """
+        :return: number of resources read from the local copy and number of resources fetched because no copy was usable.
+        """
+        return {"hits": self.__hits,
+                "misses": self.__misses}
@@ -1,5 +1,7 @@
 """This module contains the LcuWorker class."""
 import asyncio
+import time
+from typing import Any, Awaitable, Callable
 
 from PyQt5.QtCore import QObject, pyqtSignal
 from aiohttp import ClientResponse
@@ -8,32 +10,59 @@ from lcu_driver.connection import Connection
 from lcu_driver.events.responses import WebsocketEventResponse
 
 from AutoSummoner.Config.Configuration import Configuration
-from AutoSummoner.Config.Features.ConfigAutoChampionSelectProfile import ConfigAutoChampionSelectProfile
+from AutoSummoner.Config.Snapshots.AutoChampionSelectProfileSnapshot import AutoChampionSelectProfileSnapshot
 from AutoSummoner.Config.MainFeatures import MainFeatures
+from AutoSummoner.LcuInterface.ActionLatencyRecorder import ActionLatencyRecorder
+from AutoSummoner.LcuInterface.ActionScheduler import ActionScheduler
+from AutoSummoner.LcuInterface.ActionTrace import ActionTrace
 from AutoSummoner.LcuInterface.Assets.Queue import Queue
 from AutoSummoner.LcuInterface.Assets.Rune import Rune
+from AutoSummoner.LcuInterface.BootstrapCache import BootstrapCache
+from AutoSummoner.LcuInterface.ChampionSelectTracker import ChampionSelectTracker
+from AutoSummoner.LcuInterface.CoalescingDispatcher import CoalescingDispatcher
+from AutoSummoner.LcuInterface.GameflowPhase import GameflowPhase
+from AutoSummoner.LcuInterface.GameflowState import GameflowState
+from AutoSummoner.LcuInterface.GameflowStateMachine import GameflowStateMachine
+from AutoSummoner.LcuInterface.InFlightRegistry import InFlightRegistry
+from AutoSummoner.LcuInterface.LcuResourceMirror import LcuResourceMirror
+from AutoSummoner.LcuInterface.Replay.EventRecorder import EventRecorder
+from AutoSummoner.LcuInterface.RequestLane import RequestLane
+from AutoSummoner.LcuInterface.RequestLanes import RequestLanes
+from AutoSummoner.LcuInterface.RequeueFastPath import RequeueFastPath
+from AutoSummoner.LcuInterface.StatusReporter import StatusReporter
 
 
 class LcuWorker(QObject):
     """Class of the LCU Worker, responsible for communicating with the League client."""
+    # pylint: disable=too-many-instance-attributes
+    # The worker owns the per-connection components and the state shared by the LCU event handlers
 
     connector: Connector = None
     event_loop = None
     config = Configuration()
 
     # Signals
-    update_status = pyqtSignal(str)
+    update_status = pyqtSignal(object)
     update_queues = pyqtSignal(list)
     update_owned_champions = pyqtSignal(list)
     update_runes = pyqtSignal(list)
 
     __last_queue_id = None
-
-    def load_config(self) -> None:
-        """
-        Loads the configuration.
-        """
-        self.config.load_config()
+    __champion_select_tracker = ChampionSelectTracker()
+    __champion_select_dispatcher: CoalescingDispatcher = None
+    __request_lanes = RequestLanes()
+    __action_requests = InFlightRegistry()
+    __action_scheduler = ActionScheduler()
+    __single_commit_supported: bool | None = None
+    __applied_loadout = None
+    __request_durations: dict[str, float] = {}
+    __action_latencies = ActionLatencyRecorder()
+    __bootstrap_cache = BootstrapCache()
+    __reconcile_task: asyncio.Future = None
+    __resources = LcuResourceMirror(__request_lanes)
+    __gameflow: GameflowStateMachine = None
+    __requeue_fast_path: RequeueFastPath = None
+    __status_reporter: StatusReporter = None
 
     def run(self) -> None:
         """
@@ -41,58 +70,200 @@ class LcuWorker(QObject):
         """
         self.event_loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.event_loop)
+        self.setup_event_processing()
 
         self.connector = Connector(loop=self.event_loop)
         self.connector.ready(self.connect)
-        self.connector.ws.register(uri='/lol-gameflow/v1/session', event_types=('UPDATE',))(self.gameflow_changed)
-        self.connector.ws.register(uri='/lol-lobby/v2/lobby', event_types=('UPDATE',))(self.lobby_updated)
-        self.connector.ws.register(uri='/lol-matchmaking/v1/ready-check', event_types=('UPDATE',))(self.matchmaking_updated)
-        self.connector.ws.register(uri='/lol-champ-select/v1/session', event_types=('UPDATE',))(self.champion_select_updated)
+        self.connector.close(self.disconnect)
+        event_recorder = EventRecorder.from_environment()
+        for uri, handler in self.get_event_handlers().items():
+            if event_recorder is not None:
+                handler = event_recorder.wrap(uri, handler)
+            self.connector.ws.register(uri=uri, event_types=('CREATE', 'UPDATE', 'DELETE'))(handler)
         self.connector.start()
 
+    def setup_event_processing(self) -> None:
+        """
+        Creates the components processing the LCU events, called before the first event is handled.
+        """
+        self.__champion_select_dispatcher = CoalescingDispatcher(self.process_updated_champion_select)
+        end_of_game_state = GameflowState(on_enter=self.__enter_end_of_game, on_update=self.__update_other_phase)
+        self.__gameflow = GameflowStateMachine({
+            GameflowPhase.NONE.value: GameflowState(on_update=self.__update_no_lobby),
+            GameflowPhase.LOBBY.value: GameflowState(on_update=self.__update_lobby, prefetch=('/lol-lobby/v2/lobby',)),
+            GameflowPhase.MATCHMAKING.value: GameflowState(on_enter=self.__enter_matchmaking, on_update=self.__update_matchmaking),
+            GameflowPhase.READY_CHECK.value: GameflowState(on_enter=self.__enter_ready_check, on_update=self.__update_other_phase),
+            GameflowPhase.CHAMP_SELECT.value: GameflowState(on_update=self.__update_champion_select, on_exit=self.__exit_champion_select,
+                                                            prefetch=('/lol-champ-select/v1/session',)),
+            GameflowPhase.IN_PROGRESS.value: GameflowState(on_enter=self.__enter_game, on_update=self.__update_other_phase),
+            GameflowPhase.WAITING_FOR_STATS.value: end_of_game_state,
+            GameflowPhase.PRE_END_OF_GAME.value: end_of_game_state,
+            GameflowPhase.END_OF_GAME.value: end_of_game_state
+        }, GameflowState(on_update=self.__update_other_phase), self.__resources.get_or_fetch)
+        self.__status_reporter = StatusReporter(self.update_status.emit, self.__gameflow.get_phase)
+        self.__requeue_fast_path = RequeueFastPath(self.config, self.__action_requests, self.__request_lanes, self.__status_reporter.report)
+
+    def get_event_handlers(self) -> dict[str, Callable[[Connection, WebsocketEventResponse], Awaitable[None]]]:
+        """
+        :return: the handlers of the LCU websocket events, by subscribed URI.
+        """
+        return {'/lol-gameflow/v1/session': self.gameflow_changed,
+                '/lol-lobby/v2/lobby': self.lobby_updated,
+                '/lol-matchmaking/v1/ready-check': self.matchmaking_updated,
+                '/lol-champ-select/v1/session': self.champion_select_updated}
+
     async def connect(self, connection: Connection) -> None:
         """
         Called when the LCU connection is established, updates the UI with the current gameflow.
         :param connection: LCU connection.
         """
-        self.update_status.emit("Connected to League Client, loading configuration...")
-
-        # Loading queues
-        queues: ClientResponse = await connection.request('get', '/lol-game-queues/v1/queues')
-        queues_list = await queues.json()
-        queues_list = [item for item in queues_list if item["queueAvailability"] == "Available"]
-        queues_list = [Queue(item) for item in queues_list]
-        self.update_queues.emit(queues_list)
-
-        # Loading champions
-        owned_champions: ClientResponse = await connection.request('get', '/lol-champions/v1/owned-champions-minimal')
-        owned_champions_list: list[dict] = await owned_champions.json()
-        self.update_owned_champions.emit(owned_champions_list)
-
-        # Loading runes
-        runes: ClientResponse = await connection.request('get', '/lol-perks/v1/pages')
-        runes_list = await runes.json()
-        runes_list = [Rune(item) for item in runes_list]
-        self.update_runes.emit(runes_list)
-
-        self.update_status.emit("Connected to League Client, awaiting gameflow...")
-        gameflow_json: ClientResponse = await connection.request('get', '/lol-gameflow/v1/session')
-        gameflow_json: dict = await gameflow_json.json()
+        self.__status_reporter.report("loading configuration")
+
+        # The cache key and the gameflow are needed right away, the rest is loaded in the background
+        self.__resources.clear()
+        summoner, game_version, gameflow_json = await asyncio.gather(
+            self.__request_json(connection, RequestLane.STATE, '/lol-summoner/v1/current-summoner'),
+            self.__request_json(connection, RequestLane.STATE, '/lol-patch/v1/game-version'),
+            self.__resources.fetch(connection, '/lol-gameflow/v1/session'))
+
+        cache_key = BootstrapCache.get_key(summoner, game_version)
+        cached_assets = self.__bootstrap_cache.load(cache_key) if cache_key is not None else None
+        if cached_assets is not None:
+            self.__emit_assets(cached_assets)
+        await self.__cancel_reconcile_task()
+        self.__reconcile_task = asyncio.ensure_future(self.__reconcile_assets(connection, cache_key, cached_assets))
+
+        self.__status_reporter.report("awaiting gameflow")
+        self.__gameflow.reset()
+        self.__requeue_fast_path.reset()
+        self.__action_scheduler.clear()
+        self.__single_commit_supported = None
         await self.process_updated_gameflow(connection, gameflow_json)
 
-        if "phase" in gameflow_json:
-            if gameflow_json["phase"] == "Lobby":
-                lobby_status: ClientResponse = await connection.request('get', '/lol-lobby/v2/lobby')
-                lobby_status_json = await lobby_status.json()
-                await self.process_updated_lobby(connection, lobby_status_json)
-            elif gameflow_json["phase"] == "Matchmaking":
-                matchmaking_status: ClientResponse = await connection.request('get', '/lol-matchmaking/v1/ready-check')
-                matchmaking_status_json = await matchmaking_status.json()
-                await self.process_updated_matchmaking(connection, matchmaking_status_json)
-            elif gameflow_json["phase"] == "ChampSelect":
-                champion_select_status: ClientResponse = await connection.request('get', '/lol-champ-select/v1/session')
-                champion_select_status_json = await champion_select_status.json()
-                await self.process_updated_champion_select(connection, champion_select_status_json)
+    async def disconnect(self, _connection: Connection) -> None:
+        """
+        Called when the LCU connection is closed, stops loading the League client data in the background
+        and forgets the mirrored resources, as the websocket events are no longer received.
+        :param _connection: LCU connection.
+        """
+        await self.__cancel_reconcile_task()
+        self.__resources.clear()
+
+    async def __cancel_reconcile_task(self) -> None:
+        """
+        Cancels the background loading of the League client data, if it is still running.
+        """
+        if self.__reconcile_task is None:
+            return
+        self.__reconcile_task.cancel()
+        await asyncio.gather(self.__reconcile_task, return_exceptions=True)
+        self.__reconcile_task = None
+
+    async def __request_json(self, connection: Connection, lane: RequestLane, endpoint: str) -> Any:
+        """
+        :param connection: LCU connection.
+        :param lane: priority lane of the request.
+        :param endpoint: LCU endpoint to get.
+        :return: the JSON response of the endpoint.
+        """
+        response: ClientResponse = await self.__request_lanes.request(connection, lane, 'get', endpoint)
+        return await response.json()
+
+    async def __reconcile_assets(self, connection: Connection, cache_key: str | None, cached_assets: dict | None) -> None:
+        """
+        Loads the queues, owned champions and rune pages concurrently, updates the UI with the ones which differ
+        from the cached ones and stores them in the cache.
+        :param connection: LCU connection.
+        :param cache_key: cache key of the current summoner and client version, or None.
+        :param cached_assets: assets loaded from the cache, or None.
+        """
+        try:
+            queues_list, owned_champions_list, runes_list = await asyncio.gather(
+                self.__request_json(connection, RequestLane.BACKGROUND, '/lol-game-queues/v1/queues'),
+                self.__request_json(connection, RequestLane.BACKGROUND, '/lol-champions/v1/owned-champions-minimal'),
+                self.__request_json(connection, RequestLane.BACKGROUND, '/lol-perks/v1/pages'))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            print("Failed to load League client data !\n", e)
+            return
+
+        assets = {"queues": [item for item in queues_list if item["queueAvailability"] == "Available"],
+                  "owned_champions": owned_champions_list,
+                  "runes": runes_list}
+        if cached_assets is None:
+            cached_assets = {}
+        self.__emit_assets({name: value for name, value in assets.items() if cached_assets.get(name) != value})
+
+        if cache_key is not None and assets != cached_assets:
+            await asyncio.get_running_loop().run_in_executor(None, self.__bootstrap_cache.save, cache_key, assets)
+
+    def __emit_assets(self, assets: dict) -> None:
+        """
+        Updates the UI with the League client data.
+        :param assets: raw LCU queues, owned champions and rune pages, only the given ones are updated.
+        """
+        if "queues" in assets:
+            self.update_queues.emit([Queue(item) for item in assets["queues"]])
+        if "owned_champions" in assets:
+            self.update_owned_champions.emit(assets["owned_champions"])
+        if "runes" in assets:
+            self.update_runes.emit([Rune(item) for item in assets["runes"]])
+
+    def get_champion_select_statistics(self) -> dict[str, int]:
+        """
+        :return: number of champion select updates received, processed and dropped in favor of a more recent update.
+        """
+        return self.__champion_select_dispatcher.get_statistics()
+
+    def get_action_request_statistics(self) -> dict[str, int]:
+        """
+        :return: number of champion select action requests sent, suppressed as duplicates and still outstanding.
+        """
+        return self.__action_requests.get_statistics()
+
+    def is_single_commit_supported(self) -> bool | None:
+        """
+        :return: True if the League client selects and completes an action with a single request, False if it does not,
+        None if it was not detected yet.
+        """
+        return self.__single_commit_supported
+
+    def get_action_scheduler_statistics(self) -> dict[str, int]:
+        """
+        :return: number of champion select actions run, retried, which missed their deadline and still pending.
+        """
+        return self.__action_scheduler.get_statistics()
+
+    def get_request_lane_statistics(self) -> dict[str, dict[str, float]]:
+        """
+        :return: for each request priority lane, number of requests, number of queued requests, waiting times and outstanding requests.
+        """
+        return self.__request_lanes.get_statistics()
+
+    def get_resource_statistics(self) -> dict[str, int]:
+        """
+        :return: number of LCU resources read from the websocket copy and number of resources fetched with a REST request.
+        """
+        return self.__resources.get_statistics()
+
+    def get_action_latencies(self) -> dict[str, dict[str, dict]]:
+        """
+        Can be called from any thread.
+        :return: latency histograms of the actions, from the LCU event to the League client response, per action and stage.
+        """
+        return self.__action_latencies.get_summary()
+
+    def dump_action_latencies(self, path: str) -> None:
+        """
+        Writes the latency histograms of the actions to a JSON file, can be called from any thread.
+        :param path: path of the file.
+        """
+        self.__action_latencies.dump(path)
+
+    def get_request_durations(self) -> dict[str, float]:
+        """
+        :return: duration (in milliseconds) of the last request of each kind sent concurrently with others.
+        """
+        return dict(self.__request_durations)
 
     async def gameflow_changed(self, connection: Connection, event: WebsocketEventResponse) -> None:
         """
@@ -100,7 +271,9 @@ class LcuWorker(QObject):
         :param connection: LCU connection.
         :param event: gameflow changed event.
         """
-        await self.process_updated_gameflow(connection, event.data)
+        self.__resources.apply_event(event)
+        if event.type.upper() == 'UPDATE':
+            await self.process_updated_gameflow(connection, event.data)
 
     async def process_updated_gameflow(self, connection: Connection, gameflow: dict) -> None:
         """
@@ -108,31 +281,121 @@ class LcuWorker(QObject):
         :param connection: LCU connection.
         :param gameflow: current League gameflow dictionary.
         """
-        config_auto_lobby = self.config.get_feature_configuration(MainFeatures.AUTO_LOBBY)
+        await self.__gameflow.update(connection, gameflow)
 
-        if "phase" not in gameflow or gameflow["phase"] == "None":
-            self.__last_queue_id = None
-            auto_select_queue_id = config_auto_lobby.get_auto_select_queue_id()
-            if config_auto_lobby.is_enabled() and config_auto_lobby.is_auto_select_queue_enabled() and auto_select_queue_id > 0:
-                self.update_status.emit("Connected to League Client, changing lobby...")
-                await connection.request('post', '/lol-lobby/v2/lobby', data={"queueId": auto_select_queue_id})
-            else:
-                self.update_status.emit("Connected to League Client, waiting for lobby...")
-        elif gameflow["phase"] == "Lobby":
-            self.__last_queue_id = None
-            lobby_status: ClientResponse = await connection.request('get', '/lol-lobby/v2/lobby')
-            lobby_status_json = await lobby_status.json()
-            await self.process_updated_lobby(connection, lobby_status_json)
-        elif gameflow["phase"] == "Matchmaking":
-            self.__last_queue_id = None
-            self.update_status.emit("Connected to League Client, matchmaking in progress...")
-        elif gameflow["phase"] == "ChampSelect":
-            self.__last_queue_id = gameflow["gameData"]["queue"]["id"]
-            champion_select_status: ClientResponse = await connection.request('get', '/lol-champ-select/v1/session')
-            champion_select_status_json = await champion_select_status.json()
-            await self.process_updated_champion_select(connection, champion_select_status_json)
+    def get_gameflow_statistics(self) -> dict[str, dict[str, dict[str, float]]]:
+        """
+        :return: time spent in each gameflow phase and in each transition between phases.
+        """
+        return self.__gameflow.get_statistics()
+
+    def get_status_statistics(self) -> dict[str, int]:
+        """
+        :return: number of statuses reported, sent to the UI, replaced by a more recent status and not sent as they were already shown.
+        """
+        return self.__status_reporter.get_statistics()
+
+    def get_requeue_latencies(self) -> list[float]:
+        """
+        :return: the last durations (in milliseconds) between the end of a game and the start of the next matchmaking.
+        """
+        return self.__requeue_fast_path.get_latencies()
+
+    async def __update_no_lobby(self, connection: Connection, _gameflow: dict) -> None:
+        """
+        Creates the lobby when there is none, depending on the user configuration.
+        :param connection: LCU connection.
+        :param _gameflow: current League gameflow dictionary.
+        """
+        self.__last_queue_id = None
+        config_auto_lobby = self.config.get_snapshot().get_feature_configuration(MainFeatures.AUTO_LOBBY)
+        auto_select_queue_id = config_auto_lobby.get_auto_select_queue_id()
+        if config_auto_lobby.is_enabled() and config_auto_lobby.is_auto_select_queue_enabled() and auto_select_queue_id > 0:
+            self.__status_reporter.report("changing lobby")
+            await self.__request_lanes.request(connection, RequestLane.STATE, 'post', '/lol-lobby/v2/lobby', data={"queueId": auto_select_queue_id})
         else:
-            self.update_status.emit("Connected to League Client, gameflow phase : " + gameflow["phase"])
+            self.__status_reporter.report("waiting for lobby")
+
+    async def __update_lobby(self, connection: Connection, _gameflow: dict) -> None:
+        """
+        Processes the current lobby.
+        :param connection: LCU connection.
+        :param _gameflow: current League gameflow dictionary.
+        """
+        self.__last_queue_id = None
+        lobby_status_json = await self.__resources.get_or_fetch(connection, '/lol-lobby/v2/lobby')
+        await self.process_updated_lobby(connection, lobby_status_json)
+
+    async def __update_matchmaking(self, _connection: Connection, _gameflow: dict) -> None:
+        """
+        Shows that matchmaking is in progress.
+        :param _connection: LCU connection.
+        :param _gameflow: current League gameflow dictionary.
+        """
+        self.__last_queue_id = None
+        self.__status_reporter.report("matchmaking in progress")
+
+    async def __enter_matchmaking(self, _connection: Connection, _gameflow: dict) -> None:
+        """
+        Records the time elapsed since the end of the previous game.
+        :param _connection: LCU connection.
+        :param _gameflow: current League gameflow dictionary.
+        """
+        self.__requeue_fast_path.on_matchmaking_started()
+
+    async def __enter_game(self, _connection: Connection, _gameflow: dict) -> None:
+        """
+        Forgets the previous game when a new game starts.
+        :param _connection: LCU connection.
+        :param _gameflow: current League gameflow dictionary.
+        """
+        self.__requeue_fast_path.reset()
+
+    async def __enter_end_of_game(self, connection: Connection, gameflow: dict) -> None:
+        """
+        Starts the next game as soon as the current one ends.
+        :param connection: LCU connection.
+        :param gameflow: current League gameflow dictionary.
+        """
+        await self.__requeue_fast_path.on_game_end(connection, gameflow)
+
+    async def __enter_ready_check(self, connection: Connection, _gameflow: dict) -> None:
+        """
+        Processes the current ready check, which may have started before its websocket events were received.
+        :param connection: LCU connection.
+        :param _gameflow: current League gameflow dictionary.
+        """
+        matchmaking_status_json = await self.__resources.get_or_fetch(connection, '/lol-matchmaking/v1/ready-check')
+        if "state" in matchmaking_status_json:
+            await self.process_updated_matchmaking(connection, matchmaking_status_json)
+
+    async def __update_champion_select(self, connection: Connection, gameflow: dict) -> None:
+        """
+        Processes the current champion select session.
+        :param connection: LCU connection.
+        :param gameflow: current League gameflow dictionary.
+        """
+        self.__last_queue_id = gameflow["gameData"]["queue"]["id"]
+        champion_select_status_json = await self.__resources.get_or_fetch(connection, '/lol-champ-select/v1/session')
+        await self.__champion_select_dispatcher.dispatch(connection, champion_select_status_json)
+
+    async def __exit_champion_select(self, _connection: Connection, _gameflow: dict) -> None:
+        """
+        Forgets the champion select session.
+        :param _connection: LCU connection.
+        :param _gameflow: current League gameflow dictionary.
+        """
+        self.__champion_select_tracker.reset()
+        self.__action_scheduler.clear()
+        self.__applied_loadout = None
+
+    async def __update_other_phase(self, _connection: Connection, gameflow: dict) -> None:
+        """
+        Shows the current gameflow phase.
+        :param _connection: LCU connection.
+        :param gameflow: current League gameflow dictionary.
+        """
+        self.__status_reporter.report("gameflow phase : " + GameflowPhase.get_phase(gameflow))
 
     async def lobby_updated(self, connection: Connection, event: WebsocketEventResponse) -> None:
         """
@@ -140,7 +403,9 @@ class LcuWorker(QObject):
         :param connection: LCU connection.
         :param event: lobby updated event.
         """
-        await self.process_updated_lobby(connection, event.data)
+        self.__resources.apply_event(event)
+        if event.type.upper() == 'UPDATE':
+            await self.process_updated_lobby(connection, event.data)
 
     async def process_updated_lobby(self, connection: Connection, lobby_state: dict) -> None:
         """
@@ -148,11 +413,12 @@ class LcuWorker(QObject):
         :param connection: LCU connection.
         :param lobby_state: current lobby state dictionary.
         """
-        config_auto_lobby = self.config.get_feature_configuration(MainFeatures.AUTO_LOBBY)
+        config = self.config.get_snapshot()
+        config_auto_lobby = config.get_feature_configuration(MainFeatures.AUTO_LOBBY)
         auto_select_queue_id = config_auto_lobby.get_auto_select_queue_id()
         if config_auto_lobby.is_auto_select_queue_enabled() and 0 < auto_select_queue_id != lobby_state["gameConfig"]["queueId"]:
-            self.update_status.emit("Connected to League Client, changing lobby...")
-            await connection.request('post', '/lol-lobby/v2/lobby', data={"queueId": auto_select_queue_id})
+            self.__status_reporter.report("changing lobby")
+            await self.__request_lanes.request(connection, RequestLane.STATE, 'post', '/lol-lobby/v2/lobby', data={"queueId": auto_select_queue_id})
             return
 
         if config_auto_lobby.is_auto_select_roles_enabled():
@@ -160,21 +426,23 @@ class LcuWorker(QObject):
             if lobby_state["localMember"]["firstPositionPreference"] != "" and lobby_state["localMember"]["secondPositionPreference"] != "" and \
                     (lobby_state["localMember"]["firstPositionPreference"] != config_auto_select_roles_positions[0].get_league_position_str() or
                      lobby_state["localMember"]["secondPositionPreference"] != config_auto_select_roles_positions[1].get_league_position_str()):
-                self.update_status.emit("Connected to League Client, changing lobby roles...")
-                await connection.request('put',
-                                         '/lol-lobby/v2/lobby/members/localMember/position-preferences',
-                                         data={"firstPreference": config_auto_select_roles_positions[0].get_league_position_str(),
-                                               "secondPreference": config_auto_select_roles_positions[1].get_league_position_str()})
+                self.__status_reporter.report("changing lobby roles")
+                await self.__request_lanes.request(connection, RequestLane.STATE, 'put',
+                                                   '/lol-lobby/v2/lobby/members/localMember/position-preferences',
+                                                   data={"firstPreference": config_auto_select_roles_positions[0].get_league_position_str(),
+                                                         "secondPreference": config_auto_select_roles_positions[1].get_league_position_str()})
                 return
 
         if lobby_state["canStartActivity"]:
-            if self.config.get_feature_configuration(MainFeatures.AUTO_QUEUE).is_auto_start_queue_enabled():
-                self.update_status.emit("Connected to League Client, starting matchmaking...")
-                await connection.request('post', '/lol-lobby/v2/lobby/matchmaking/search')
+            if config.get_feature_configuration(MainFeatures.AUTO_QUEUE).is_auto_start_queue_enabled():
+                self.__status_reporter.report("starting matchmaking")
+                await self.__action_requests.request(
+                    ("lobby", "search"),
+                    lambda: self.__request_lanes.request(connection, RequestLane.CRITICAL, 'post', '/lol-lobby/v2/lobby/matchmaking/search'))
             else:
-                self.update_status.emit("Connected to League Client, waiting for matchmaking...")
+                self.__status_reporter.report("waiting for matchmaking")
         else:
-            self.update_status.emit("Connected to League Client, waiting for lobby to be ready...")
+            self.__status_reporter.report("waiting for lobby to be ready")
 
     async def matchmaking_updated(self, connection: Connection, event: WebsocketEventResponse) -> None:
         """
@@ -182,22 +450,33 @@ class LcuWorker(QObject):
         :param connection: LCU connection.
         :param event: matchmaking updated event.
         """
-        await self.process_updated_matchmaking(connection, event.data)
+        received = time.perf_counter()
+        self.__resources.apply_event(event)
+        if event.type.upper() == 'UPDATE':
+            await self.process_updated_matchmaking(connection, event.data, received)
 
-    async def process_updated_matchmaking(self, connection: Connection, matchmaking_state: dict) -> None:
+    async def process_updated_matchmaking(self, connection: Connection, matchmaking_state: dict, received: float = None) -> None:
         """
         Processes the matchmaking updated event and act depending on the user configuration.
         :param connection: LCU connection.
         :param matchmaking_state: current matchmaking state dictionary.
+        :param received: time (time.perf_counter() clock) at which the state was received, or None for now.
         """
+        trace = ActionTrace(received)
         if matchmaking_state["state"] == "InProgress" and matchmaking_state["playerResponse"] == "None":
-            if self.config.get_feature_configuration(MainFeatures.AUTO_QUEUE).is_auto_accept_match_enabled():
-                self.update_status.emit("Connected to League Client, accepting matchmaking...")
-                await connection.request('post', "/lol-matchmaking/v1/ready-check/accept")
+            if self.config.get_snapshot().get_feature_configuration(MainFeatures.AUTO_QUEUE).is_auto_accept_match_enabled():
+                self.__status_reporter.report("accepting matchmaking")
+                trace.decide()
+                response = await self.__action_requests.request(
+                    ("ready-check", "accept"),
+                    lambda: self.__request_lanes.request(connection, RequestLane.CRITICAL, 'post', "/lol-matchmaking/v1/ready-check/accept",
+                                                         trace=trace))
+                if response.ok:
+                    self.__action_latencies.record("ready_check_accept", trace)
             else:
-                self.update_status.emit("Connected to League Client, waiting for accepting match...")
+                self.__status_reporter.report("waiting for accepting match")
         elif matchmaking_state["state"] == "InProgress" and matchmaking_state["playerResponse"] == "Accepted":
-            self.update_status.emit("Connected to League Client, waiting for other players accepting match...")
+            self.__status_reporter.report("waiting for other players accepting match")
 
     async def champion_select_updated(self, connection: Connection, event: WebsocketEventResponse) -> None:
         """
@@ -205,7 +484,9 @@ class LcuWorker(QObject):
         :param connection: LCU connection.
         :param event: champion select updated event.
         """
-        await self.process_updated_champion_select(connection, event.data)
+        self.__resources.apply_event(event)
+        if event.type.upper() == 'UPDATE':
+            await self.__champion_select_dispatcher.dispatch(connection, event.data)
 
     async def process_updated_champion_select(self, connection: Connection, champion_select_state: dict) -> None:
         """
@@ -213,54 +494,215 @@ class LcuWorker(QObject):
         :param connection: LCU connection.
         :param champion_select_state: current champion select state dictionary.
         """
-        local_player_cell_id = champion_select_state["localPlayerCellId"]
         profile = self.__get_champion_select_profile(champion_select_state)
         if profile is None:
-            self.update_status.emit("Connected to League Client, waiting for champion select (no profile found)...")
+            self.__status_reporter.report("waiting for champion select (no profile found)")
             return
 
         # Finding champion to pick
-        banned_champions = self.__get_banned_champions(champion_select_state["actions"])
-        picked_champions = self.__get_picked_champions(champion_select_state["actions"], local_player_cell_id)
+        tracker = self.__champion_select_tracker
+        tracker.update(champion_select_state)
+        champion_to_pick = tracker.get_champion_to_pick(profile)
+        champion_to_ban = tracker.get_champion_to_ban(profile)
+
+        # Actions in progress are run by the scheduler before the end of the current turn
+        received = self.__champion_select_dispatcher.get_state_received_time()
+        deadline = ActionScheduler.get_deadline(champion_select_state)
+        lock_in_offset = self.config.get_snapshot().get_feature_configuration(MainFeatures.AUTO_CHAMPION_SELECT).get_lock_in_offset() / 1000
+
+        for subaction in tracker.get_local_actions():
+            if subaction["type"] == "ban" and subaction["isInProgress"]:
+                if champion_to_ban is not None:
+                    ban_trace = ActionTrace(received).decide()
+                    self.__action_scheduler.schedule(
+                        ("ban", subaction['id']),
+                        lambda action_id=subaction['id'], champion_id=champion_to_ban, trace=ban_trace:
+                            self.__ban(connection, action_id, champion_id, trace),
+                        deadline)
+                else:
+                    print("champion_to_ban is None !")
+            elif subaction["type"] == "pick":
+                if champion_to_pick is not None:
+                    response = None
+                    # A champion locked in right away is selected by the lock-in itself
+                    lock_in_now = subaction["isInProgress"] and lock_in_offset == 0
+                    if subaction["championId"] != champion_to_pick and not lock_in_now:
+                        response = await self.__patch_action(connection, subaction['id'], champion_to_pick)
+                    if lock_in_now or subaction["championId"] == champion_to_pick or (response is not None and response.ok):
+                        if subaction["isInProgress"]:
+                            pick_trace = ActionTrace(received).decide()
+                            self.__action_scheduler.schedule(
+                                ("pick", subaction['id']),
+                                lambda action_id=subaction['id'], champion_id=champion_to_pick, trace=pick_trace:
+                                    self.__lock_in(connection, action_id, champion_id, trace),
+                                deadline, lock_in_offset)
+                        # Runes and summoner spells are selected as soon as the champion is hovered, and at most once
+                        await self.__apply_loadout(connection, subaction['id'], champion_to_pick, profile, received)
+                else:
+                    print("champion_to_pick is None !")
+
+    async def __ban(self, connection: Connection, action_id: int, champion_id: int, trace: ActionTrace) -> bool:
+        """
+        Selects and bans a champion.
+        :param connection: LCU connection.
+        :param action_id: id of the ban action.
+        :param champion_id: id of the champion to ban.
+        :param trace: trace of the ban.
+        :return: True if the champion was banned, False otherwise.
+        """
+        self.__status_reporter.report("banning champion")
+        response = await self.__commit_action(connection, action_id, champion_id, trace)
+        if response.ok:
+            self.__action_latencies.record("ban", trace)
+            self.__status_reporter.report("waiting for pick")
+        return response.ok
+
+    async def __lock_in(self, connection: Connection, action_id: int, champion_id: int, trace: ActionTrace) -> bool:
+        """
+        Locks in the hovered champion.
+        :param connection: LCU connection.
+        :param action_id: id of the pick action.
+        :param champion_id: id of the hovered champion.
+        :param trace: trace of the pick.
+        :return: True if the champion was locked in, False otherwise.
+        """
+        response = await self.__commit_action(connection, action_id, champion_id, trace)
+        if response.ok:
+            self.__action_latencies.record("pick", trace)
+            self.__status_reporter.report("waiting for game to start")
+        return response.ok
 
-        champion_to_pick = self.__get_champion_to_pick(profile, banned_champions, picked_champions)
-        champion_to_ban = self.__get_champion_to_ban(profile, banned_champions, picked_champions)
+    async def __commit_action(self, connection: Connection, action_id: int, champion_id: int, trace: ActionTrace = None) -> ClientResponse:
+        """
+        Selects a champion and completes the champion select action.
+        Both are sent in a single request when the League client supports it, otherwise the champion is selected then
+        the action is completed.
+        :param connection: LCU connection.
+        :param action_id: id of the champion select action.
+        :param champion_id: id of the champion to select.
+        :param trace: trace of the action, or None.
+        :return: the LCU response of the last request.
+        """
+        single_response = None
+        if self.__single_commit_supported is not False:
+            single_response = await self.__action_requests.request(
+                (action_id, champion_id, 'commit'),
+                lambda: self.__request_lanes.request(connection, RequestLane.CRITICAL, 'patch', f"/lol-champ-select/v1/session/actions/{action_id}",
+                                                     trace=trace, data={"championId": champion_id, "completed": True}))
+            if single_response.ok:
+                if self.__single_commit_supported is None:
+                    # A client ignoring "completed" accepts the request too, the action is checked the first time
+                    self.__single_commit_supported = await self.__is_action_completed(connection, action_id)
+                if self.__single_commit_supported:
+                    return single_response
+                return await self.__complete_action(connection, action_id, champion_id, trace)
+
+        response = await self.__patch_action(connection, action_id, champion_id, trace)
+        if response.ok:
+            response = await self.__complete_action(connection, action_id, champion_id, trace)
+        # The single request is only known to be unsupported once the same action could be committed in two steps
+        if response.ok and single_response is not None and 400 <= single_response.status < 500 and self.__single_commit_supported is None:
+            self.__single_commit_supported = False
+        return response
+
+    async def __is_action_completed(self, connection: Connection, action_id: int) -> bool:
+        """
+        :param connection: LCU connection.
+        :param action_id: id of the champion select action.
+        :return: True if the champion select action is completed, False otherwise.
+        """
+        champion_select_state = await self.__resources.fetch(connection, '/lol-champ-select/v1/session')
+        for action in champion_select_state.get("actions", []):
+            for subaction in action:
+                if subaction["id"] == action_id:
+                    return subaction["completed"]
+        return False
 
-        summoners_to_pick_id = self.__get_summoners_to_pick(profile, champion_to_pick)
-        rune_to_pick_id = self.__get_rune_to_pick(profile, champion_to_pick)
+    async def __patch_action(self, connection: Connection, action_id: int, champion_id: int, trace: ActionTrace = None) -> ClientResponse:
+        """
+        Selects a champion for a champion select action, unless the same selection is already outstanding.
+        :param connection: LCU connection.
+        :param action_id: id of the champion select action.
+        :param champion_id: id of the champion to select.
+        :param trace: trace of the action, or None.
+        :return: the LCU response.
+        """
+        return await self.__action_requests.request(
+            (action_id, champion_id, 'patch'),
+            lambda: self.__request_lanes.request(connection, RequestLane.CRITICAL, 'patch', f"/lol-champ-select/v1/session/actions/{action_id}",
+                                                 trace=trace, data={"championId": champion_id}))
 
-        for action in champion_select_state["actions"]:
-            for subaction in action:
-                if subaction["actorCellId"] == local_player_cell_id and not subaction["completed"]:
-                    if subaction["type"] == "ban" and subaction["isInProgress"]:
-                        if champion_to_ban is not None:
-                            self.update_status.emit("Connected to League Client, banning champion...")
-                            response = await connection.request('patch', f"/lol-champ-select/v1/session/actions/{subaction['id']}", data={"championId": champion_to_ban})
-                            if response.ok:
-                                await connection.request('post', f"/lol-champ-select/v1/session/actions/{subaction['id']}/complete")
-                                self.update_status.emit("Connected to League Client, waiting for pick...")
-                        else:
-                            print("champion_to_ban is None !")
-                    elif subaction["type"] == "pick":
-                        if champion_to_pick is not None:
-                            response = None
-                            if subaction["championId"] != champion_to_pick:
-                                response = await connection.request('patch', f"/lol-champ-select/v1/session/actions/{subaction['id']}", data={"championId": champion_to_pick})
-                            if subaction["isInProgress"] and (subaction["championId"] == champion_to_pick or (response is not None and response.ok)):
-                                response = await connection.request('post',f"/lol-champ-select/v1/session/actions/{subaction['id']}/complete")
-                                if response.ok:
-                                    # Picking runes
-                                    if rune_to_pick_id is not None:
-                                        await connection.request('put', '/lol-perks/v1/currentpage', data=rune_to_pick_id)
-
-                                    if summoners_to_pick_id is not None:
-                                        await connection.request('patch', '/lol-champ-select/v1/session/my-selection', data={"spell1Id": summoners_to_pick_id[0], "spell2Id": summoners_to_pick_id[1]})
-
-                                self.update_status.emit("Connected to League Client, waiting for game to start...")
-                        else:
-                            print("champion_to_pick is None !")
-
-    def __get_champion_select_profile(self, champion_select_state: dict) -> ConfigAutoChampionSelectProfile | None:
+    async def __complete_action(self, connection: Connection, action_id: int, champion_id: int, trace: ActionTrace = None) -> ClientResponse:
+        """
+        Completes a champion select action (locks the selected champion), unless the same completion is already outstanding.
+        :param connection: LCU connection.
+        :param action_id: id of the champion select action.
+        :param champion_id: id of the selected champion.
+        :param trace: trace of the action, or None.
+        :return: the LCU response.
+        """
+        return await self.__action_requests.request(
+            (action_id, champion_id, 'complete'),
+            lambda: self.__request_lanes.request(connection, RequestLane.CRITICAL, 'post',
+                                                 f"/lol-champ-select/v1/session/actions/{action_id}/complete", trace=trace))
+
+    async def __apply_loadout(self, connection: Connection, action_id: int, champion_id: int,
+                              profile: AutoChampionSelectProfileSnapshot, received: float) -> None:
+        """
+        Selects the rune page and the summoner spells of the picked champion concurrently,
+        unless they were already selected (or are being selected) for the same champion.
+        :param connection: LCU connection.
+        :param action_id: id of the pick action.
+        :param champion_id: id of the picked champion.
+        :param profile: the auto champion select profile used.
+        :param received: time (time.perf_counter() clock) at which the champion select state was received.
+        """
+        rune_to_pick_id = profile.get_rune_to_pick(champion_id)
+        summoners_to_pick_id = profile.get_summoner_spells_to_pick(champion_id)
+        loadout = (action_id, champion_id, rune_to_pick_id, summoners_to_pick_id)
+        if loadout == self.__applied_loadout:
+            return
+        self.__applied_loadout = loadout
+
+        loadout_requests = {}
+        traces = {}
+        if rune_to_pick_id is not None:
+            traces["rune"] = ActionTrace(received).decide()
+            loadout_requests["rune"] = self.__request_lanes.request(connection, RequestLane.STATE, 'put', '/lol-perks/v1/currentpage',
+                                                                    trace=traces["rune"], data=rune_to_pick_id)
+        if summoners_to_pick_id is not None:
+            traces["summoner_spells"] = ActionTrace(received).decide()
+            loadout_requests["summoner_spells"] = self.__request_lanes.request(
+                connection, RequestLane.STATE, 'patch', '/lol-champ-select/v1/session/my-selection', trace=traces["summoner_spells"],
+                data={"spell1Id": summoners_to_pick_id[0], "spell2Id": summoners_to_pick_id[1]})
+        responses = await self.__gather_timed(loadout_requests)
+        for name, response in responses.items():
+            if not isinstance(response, Exception) and response.ok:
+                self.__action_latencies.record(name, traces[name])
+            elif self.__applied_loadout == loadout:
+                # The loadout is selected again on the next champion select update
+                self.__applied_loadout = None
+
+    async def __gather_timed(self, requests: dict[str, Awaitable[Any]]) -> dict[str, Any]:
+        """
+        Sends independent requests concurrently and records the duration of each of them.
+        :param requests: requests to send, by name.
+        :return: the response (or the raised exception) of each request, by name.
+        """
+        async def timed(name: str, request: Awaitable[Any]) -> Any:
+            start = time.perf_counter()
+            try:
+                return await request
+            finally:
+                self.__request_durations[name] = (time.perf_counter() - start) * 1000
+
+        responses = await asyncio.gather(*[timed(name, request) for name, request in requests.items()], return_exceptions=True)
+        for name, response in zip(requests, responses):
+            if isinstance(response, Exception):
+                print(f"Failed to send {name} request !\n", response)
+        return dict(zip(requests, responses))
+
+    def __get_champion_select_profile(self, champion_select_state: dict) -> AutoChampionSelectProfileSnapshot | None:
         local_player_cell_id = champion_select_state["localPlayerCellId"]
         local_player_position = ""
 
@@ -268,50 +710,5 @@ class LcuWorker(QObject):
             if player["cellId"] == local_player_cell_id:
                 local_player_position = player["assignedPosition"]
 
-        return self.config.get_feature_configuration(MainFeatures.AUTO_CHAMPION_SELECT).find_profile_config(self.__last_queue_id, local_player_position)
-
-    @staticmethod
-    def __get_banned_champions(champion_select_actions: list) -> list[int]:
-        banned_champions = []
-        for action in champion_select_actions:
-            for subaction in action:
-                if subaction["completed"] and subaction["type"] == "ban":
-                    banned_champions.append(subaction["championId"])
-        return banned_champions
-
-    @staticmethod
-    def __get_picked_champions(champion_select_actions: list, local_player_cell_id: int) -> list[int]:
-        picked_champions = []
-        for action in champion_select_actions:
-            for subaction in action:
-                if subaction["type"] == "pick" and subaction["actorCellId"] != local_player_cell_id:
-                    picked_champions.append(subaction["championId"])
-        return picked_champions
-
-    @staticmethod
-    def __get_champion_to_pick(profile: ConfigAutoChampionSelectProfile, banned_champions: list[int], picked_champions: list[int]) -> int | None:
-        champions_to_pick = [champion for champion in profile.get_champions_pick_id() if
-                             champion not in banned_champions and champion not in picked_champions]
-        return champions_to_pick[0] if len(champions_to_pick) > 0 else None
-
-    @staticmethod
-    def __get_champion_to_ban(profile: ConfigAutoChampionSelectProfile, banned_champions: list[int], picked_champions: list[int]) -> int | None:
-        champions_to_ban = [champion for champion in profile.get_champions_ban_id()
-                            if champion not in picked_champions and champion not in banned_champions]
-        return champions_to_ban[0] if len(champions_to_ban) > 0 else None
-
-    @staticmethod
-    def __get_summoners_to_pick(profile: ConfigAutoChampionSelectProfile, champion_to_pick: int) -> tuple[int, int] | None:
-        if profile.is_using_individual_summoner_spell():
-            if champion_to_pick is not None:
-                return profile.get_summoner_spells_id_per_champion_id(champion_to_pick)
-            return None
-        return profile.get_summoner_spells_id_global()
-
-    @staticmethod
-    def __get_rune_to_pick(profile: ConfigAutoChampionSelectProfile, champion_to_pick: int) -> int | None:
-        if profile.is_using_individual_rune():
-            if champion_to_pick is not None:
-                return profile.get_rune_id_per_champion(champion_to_pick)
-            return None
-        return profile.get_rune_id_global()
+        config_auto_champion_select = self.config.get_snapshot().get_feature_configuration(MainFeatures.AUTO_CHAMPION_SELECT)
+        return config_auto_champion_select.find_profile_config(self.__last_queue_id, local_player_position)
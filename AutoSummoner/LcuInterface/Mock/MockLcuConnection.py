@@ -0,0 +1,84 @@
+"""Module containing the MockLcuConnection class."""
+import asyncio
+import json
+from typing import Awaitable, Callable
+
+import aiohttp
+from aiohttp import ClientResponse
+from lcu_driver.events.responses import WebsocketEventResponse
+
+
+class MockLcuConnection:
+    """
+    Class connecting the LCU worker to a MockLcuServer, in place of the lcu_driver connection.
+    REST requests are sent like lcu_driver does (the "data" argument is sent as JSON)
+    and websocket events are dispatched to the handler subscribed to their URI.
+    """
+
+    def __init__(self, url: str):
+        """
+        Initializes the connection.
+        :param url: base URL of the mock League client.
+        """
+        self.__url = url
+        self.__session: aiohttp.ClientSession | None = None
+        self.__handler_tasks: set[asyncio.Future] = set()
+        self.__events_received = 0
+
+    async def open(self) -> None:
+        """
+        Opens the HTTP session.
+        """
+        self.__session = aiohttp.ClientSession()
+
+    async def close(self) -> None:
+        """
+        Waits for the running handlers and closes the HTTP session.
+        """
+        if self.__handler_tasks:
+            await asyncio.gather(*self.__handler_tasks, return_exceptions=True)
+        await self.__session.close()
+
+    async def request(self, method: str, endpoint: str, **kwargs) -> ClientResponse:
+        """
+        :param method: HTTP method.
+        :param endpoint: LCU endpoint.
+        :param kwargs: other arguments of the request, "data" is sent as JSON.
+        :return: the response, its body is already read.
+        """
+        if "data" in kwargs:
+            kwargs["json"] = kwargs.pop("data")
+        response = await self.__session.request(method, self.__url + endpoint, **kwargs)
+        await response.read()
+        return response
+
+    async def listen(self, handlers: dict[str, Callable[["MockLcuConnection", WebsocketEventResponse], Awaitable[None]]],
+                     subscribed: asyncio.Event = None) -> None:
+        """
+        Subscribes to the websocket events and dispatches them until the mock closes the websocket.
+        Every event is handled in its own task, like the events of the League client.
+        :param handlers: handlers of the events, by URI.
+        :param subscribed: event set once the subscription is sent, or None.
+        """
+        async with self.__session.ws_connect(self.__url) as socket:
+            await socket.send_str(json.dumps([5, "OnJsonApiEvent"]))
+            if subscribed is not None:
+                subscribed.set()
+            async for message in socket:
+                if message.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                _, _, payload = json.loads(message.data)
+                self.__events_received += 1
+                handler = handlers.get(payload["uri"])
+                if handler is None:
+                    continue
+                event = WebsocketEventResponse(event_type=payload["eventType"], uri=payload["uri"], data=payload["data"])
+                task = asyncio.ensure_future(handler(self, event))
+                self.__handler_tasks.add(task)
+                task.add_done_callback(self.__handler_tasks.discard)
+
+    def get_events_received(self) -> int:
+        """
+        :return: number of websocket events received.
+        """
+        return self.__events_received
@@ -0,0 +1,452 @@
+"""Module containing the MockLcuServer class."""
+import asyncio
+import copy
+import json
+import random
+import re
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable
+
+from aiohttp import WSMsgType, web
+
+from AutoSummoner.LcuInterface.Mock.MockLcuSettings import MockLcuSettings
+
+
+class MockLcuServer:
+    """
+    Class of a local mock of the League client (LCU) API, used to load and integration test the LCU worker.
+    It serves the REST endpoints used by the worker and the websocket event feed (WAMP "OnJsonApiEvent" messages),
+    with a configurable response latency.
+    The mock plays a simplified game loop: lobby, matchmaking, ready check, champion select (one ban and one pick
+    for the local player), game and end of game. Scripted scenarios can also push any resource update.
+    """
+    # pylint: disable=too-many-instance-attributes
+    # The mock keeps the whole state of a League client, from its resources to its web server
+
+    EVENT_NAME = "OnJsonApiEvent"
+    GAMEFLOW_URI = "/lol-gameflow/v1/session"
+    LOBBY_URI = "/lol-lobby/v2/lobby"
+    READY_CHECK_URI = "/lol-matchmaking/v1/ready-check"
+    CHAMPION_SELECT_URI = "/lol-champ-select/v1/session"
+    TURN_DURATION_MS = 30000
+
+    def __init__(self, settings: MockLcuSettings = MockLcuSettings()):
+        """
+        Initializes the mock League client.
+        :param settings: timings and behavior of the mock.
+        """
+        self.__settings = settings
+
+        self.__resources: dict[str, Any] = {}
+        self.__sockets: set[web.WebSocketResponse] = set()
+        self.__tasks: set[asyncio.Future] = set()
+        self.__requests = Counter()
+        self.__events_sent = 0
+        self.__game_id = 0
+        self.__last_queue_id = -1
+        self.__champion_select_end = 0.0
+        self.__runner: web.AppRunner | None = None
+        self.__port = 0
+
+        self.__routes: list[tuple[str, re.Pattern, Callable[[re.Match, Any], Awaitable[web.Response]]]] = [
+            ("post", re.compile(r"/lol-lobby/v2/lobby"), self.__create_lobby),
+            ("post", re.compile(r"/lol-lobby/v2/play-again"), self.__play_again),
+            ("put", re.compile(r"/lol-lobby/v2/lobby/members/localMember/position-preferences"), self.__select_positions),
+            ("post", re.compile(r"/lol-lobby/v2/lobby/matchmaking/search"), self.__start_matchmaking),
+            ("post", re.compile(r"/lol-matchmaking/v1/ready-check/accept"), self.__accept_ready_check),
+            ("patch", re.compile(r"/lol-champ-select/v1/session/actions/(\d+)"), self.__patch_action),
+            ("post", re.compile(r"/lol-champ-select/v1/session/actions/(\d+)/complete"), self.__complete_action),
+            ("patch", re.compile(r"/lol-champ-select/v1/session/my-selection"), self.__select_summoner_spells),
+            ("put", re.compile(r"/lol-perks/v1/currentpage"), self.__select_rune_page),
+            ("post", re.compile(r"/lol-end-of-game/v1/state/dismiss-stats"), self.__dismiss_stats)]
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Resets the client to an idle state, without lobby.
+        """
+        self.__resources = {
+            "/lol-summoner/v1/current-summoner": {"puuid": "mock-puuid", "summonerId": 1, "displayName": "Mock"},
+            "/lol-patch/v1/game-version": "0.0.0.mock",
+            "/lol-game-queues/v1/queues": [{"id": queue_id, "name": name, "gameMode": "CLASSIC", "queueAvailability": "Available"}
+                                           for queue_id, name in ((400, "Normal Draft"), (420, "Ranked Solo/Duo"), (440, "Ranked Flex"))],
+            "/lol-champions/v1/owned-champions-minimal": [{"id": champion_id, "name": f"Champion {champion_id}"} for champion_id in range(1, 11)],
+            "/lol-perks/v1/pages": [{"id": page_id, "name": f"Page {page_id}", "isValid": True} for page_id in range(1, 4)],
+            "/lol-perks/v1/currentpage": {"id": 1, "name": "Page 1", "isValid": True},
+            self.GAMEFLOW_URI: self.__gameflow("None")}
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """
+        Starts serving.
+        :param host: address to listen on.
+        :param port: port to listen on, 0 for any free port.
+        :return: the port the mock listens on.
+        """
+        application = web.Application()
+        application.router.add_route("*", "/{path:.*}", self.__handle)
+        self.__runner = web.AppRunner(application)
+        await self.__runner.setup()
+        site = web.TCPSite(self.__runner, host, port)
+        await site.start()
+        self.__port = self.__runner.addresses[0][1]
+        return self.__port
+
+    async def stop(self) -> None:
+        """
+        Stops serving and cancels the pending phase changes.
+        """
+        for task in list(self.__tasks):
+            task.cancel()
+        for socket in list(self.__sockets):
+            await socket.close()
+        if self.__runner is not None:
+            await self.__runner.cleanup()
+            self.__runner = None
+
+    def get_url(self) -> str:
+        """
+        :return: the base URL of the mock.
+        """
+        return f"http://127.0.0.1:{self.__port}"
+
+    def get_resource(self, uri: str) -> Any:
+        """
+        :param uri: URI of the resource.
+        :return: the current resource, or None if it does not exist.
+        """
+        return self.__resources.get(uri)
+
+    async def set_resource(self, uri: str, data: Any, event_type: str = "Update") -> None:
+        """
+        Changes a resource and sends the corresponding event to the websocket clients.
+        :param uri: URI of the resource.
+        :param data: new resource, ignored for a deletion.
+        :param event_type: "Create", "Update" or "Delete".
+        """
+        if event_type == "Delete":
+            self.__resources.pop(uri, None)
+            data = None
+        else:
+            self.__resources[uri] = data
+        message = json.dumps([8, self.EVENT_NAME, {"data": data, "eventType": event_type, "uri": uri}])
+        for socket in list(self.__sockets):
+            try:
+                await socket.send_str(message)
+                self.__events_sent += 1
+            except ConnectionError:
+                self.__sockets.discard(socket)
+
+    async def play(self, steps: list[dict]) -> None:
+        """
+        Plays a scripted scenario.
+        :param steps: steps of the scenario, each step waits "delay" seconds then sets the "data" of the "uri"
+        resource with an event of the given "type" ("Update" by default).
+        """
+        for step in steps:
+            if step.get("delay", 0) > 0:
+                await asyncio.sleep(step["delay"])
+            await self.set_resource(step["uri"], step.get("data"), step.get("type", "Update"))
+
+    async def start_game(self, queue_id: int) -> None:
+        """
+        Creates a lobby and starts the matchmaking, as a user would do.
+        :param queue_id: id of the queue.
+        """
+        await self.__create_lobby(None, {"queueId": queue_id})
+        await self.__start_matchmaking(None, None)
+
+    async def champion_select_storm(self, queue_id: int, rate: float, duration: float) -> None:
+        """
+        Enters champion select and sends champion select updates (an ally changing the hovered champion) at the given rate.
+        The game does not start before the end of the storm, even if the local player already picked.
+        :param queue_id: id of the queue of the game.
+        :param rate: number of updates per second.
+        :param duration: duration (in seconds) of the storm.
+        """
+        await self.__create_lobby(None, {"queueId": queue_id})
+        start = time.perf_counter()
+        self.__champion_select_end = start + duration
+        await self.__enter_champion_select()
+        sent = 0
+        while time.perf_counter() - start < duration:
+            session = copy.deepcopy(self.__resources[self.CHAMPION_SELECT_URI])
+            session["myTeam"][1]["championPickIntent"] = sent % 10 + 1
+            await self.set_resource(self.CHAMPION_SELECT_URI, session)
+            sent += 1
+            delay = start + sent / rate - time.perf_counter()
+            await asyncio.sleep(max(delay, 0))
+
+    def get_statistics(self) -> dict:
+        """
+        :return: number of REST requests per method and endpoint, number of events sent and number of websocket clients.
+        """
+        return {"requests": dict(self.__requests),
+                "events_sent": self.__events_sent,
+                "clients": len(self.__sockets)}
+
+    async def __handle(self, request: web.Request) -> web.StreamResponse:
+        """
+        Handles a REST request or a websocket connection.
+        :param request: the HTTP request.
+        :return: the response.
+        """
+        if request.headers.get("Upgrade", "").lower() == "websocket":
+            return await self.__handle_websocket(request)
+
+        if self.__settings.latency > 0 or self.__settings.jitter > 0:
+            await asyncio.sleep(self.__settings.latency + random.uniform(0, self.__settings.jitter))
+        method = request.method.lower()
+        body = await request.json() if request.can_read_body else None
+        for route_method, pattern, handler in self.__routes:
+            match = pattern.fullmatch(request.path)
+            if route_method == method and match is not None:
+                self.__requests[f"{method} {pattern.pattern}"] += 1
+                return await handler(match, body)
+
+        self.__requests[f"{method} {request.path}"] += 1
+        if method == "get" and request.path in self.__resources:
+            return web.json_response(self.__resources[request.path])
+        return self.__error(404, "RPC_ERROR", "Resource not found")
+
+    async def __handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        """
+        Sends the events to a websocket client once it subscribed to them.
+        :param request: the HTTP request.
+        :return: the websocket response, once the client disconnected.
+        """
+        socket = web.WebSocketResponse()
+        await socket.prepare(request)
+        async for message in socket:
+            if message.type != WSMsgType.TEXT:
+                continue
+            try:
+                message_code, event_name = json.loads(message.data)[:2]
+            except (ValueError, TypeError):
+                continue
+            if message_code == 5 and event_name == self.EVENT_NAME:
+                self.__sockets.add(socket)
+            elif message_code == 6 and event_name == self.EVENT_NAME:
+                self.__sockets.discard(socket)
+        self.__sockets.discard(socket)
+        return socket
+
+    @staticmethod
+    def __error(status: int, error_code: str, message: str) -> web.Response:
+        """
+        :param status: HTTP status.
+        :param error_code: LCU error code.
+        :param message: error message.
+        :return: an LCU error response.
+        """
+        return web.json_response({"errorCode": error_code, "httpStatus": status, "message": message}, status=status)
+
+    def __later(self, delay: float, coroutine_function: Callable[[], Awaitable[None]]) -> None:
+        """
+        Runs a phase change after a delay.
+        :param delay: delay in seconds.
+        :param coroutine_function: the phase change.
+        """
+        async def delayed() -> None:
+            await asyncio.sleep(delay)
+            await coroutine_function()
+        task = asyncio.ensure_future(delayed())
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+
+    def __gameflow(self, phase: str, queue_id: int = -1) -> dict:
+        """
+        :param phase: gameflow phase.
+        :param queue_id: id of the queue of the game, or -1.
+        :return: a gameflow session.
+        """
+        return {"phase": phase, "gameData": {"gameId": self.__game_id, "queue": {"id": queue_id}}}
+
+    def __get_queue_id(self) -> int:
+        """
+        :return: the id of the queue of the current lobby, or -1.
+        """
+        lobby = self.__resources.get(self.LOBBY_URI)
+        return lobby["gameConfig"]["queueId"] if lobby is not None else -1
+
+    async def __set_phase(self, phase: str) -> None:
+        """
+        :param phase: new gameflow phase.
+        """
+        await self.set_resource(self.GAMEFLOW_URI, self.__gameflow(phase, self.__get_queue_id()))
+
+    async def __create_lobby(self, _match: re.Match | None, body: Any) -> web.Response:
+        """
+        Creates a lobby for the queue given in the body.
+        """
+        queue_id = body.get("queueId") if isinstance(body, dict) else None
+        if not isinstance(queue_id, int):
+            return self.__error(400, "INVALID_REQUEST", "queueId is required")
+        lobby = {"gameConfig": {"queueId": queue_id},
+                 "localMember": {"firstPositionPreference": "UNSELECTED", "secondPositionPreference": "UNSELECTED"},
+                 "canStartActivity": True}
+        await self.set_resource(self.LOBBY_URI, lobby, "Create" if self.LOBBY_URI not in self.__resources else "Update")
+        await self.__set_phase("Lobby")
+        return web.json_response(lobby)
+
+    async def __play_again(self, _match: re.Match, _body: Any) -> web.Response:
+        """
+        Creates a lobby for the queue of the previous game.
+        """
+        if self.__last_queue_id < 0:
+            return self.__error(400, "INVALID_STATE", "No previous game")
+        return await self.__create_lobby(None, {"queueId": self.__last_queue_id})
+
+    async def __select_positions(self, _match: re.Match, body: Any) -> web.Response:
+        """
+        Selects the positions of the local player in the lobby.
+        """
+        lobby = copy.deepcopy(self.__resources.get(self.LOBBY_URI))
+        if lobby is None or not isinstance(body, dict):
+            return self.__error(400, "INVALID_STATE", "No lobby")
+        lobby["localMember"]["firstPositionPreference"] = body.get("firstPreference", "UNSELECTED")
+        lobby["localMember"]["secondPositionPreference"] = body.get("secondPreference", "UNSELECTED")
+        await self.set_resource(self.LOBBY_URI, lobby)
+        return web.Response(status=204)
+
+    async def __start_matchmaking(self, _match: re.Match | None, _body: Any) -> web.Response:
+        """
+        Starts the matchmaking, the ready check starts after the match delay.
+        """
+        if self.LOBBY_URI not in self.__resources:
+            return self.__error(400, "INVALID_STATE", "No lobby")
+        if self.__resources[self.GAMEFLOW_URI]["phase"] == "Matchmaking":
+            return web.Response(status=204)
+        await self.__set_phase("Matchmaking")
+        self.__later(self.__settings.match_delay, self.__start_ready_check)
+        return web.Response(status=204)
+
+    async def __start_ready_check(self) -> None:
+        """
+        Starts the ready check.
+        """
+        await self.set_resource(self.READY_CHECK_URI, {"state": "InProgress", "playerResponse": "None", "timer": 0})
+        await self.__set_phase("ReadyCheck")
+
+    async def __accept_ready_check(self, _match: re.Match, _body: Any) -> web.Response:
+        """
+        Accepts the ready check, champion select starts after the phase delay.
+        """
+        ready_check = self.__resources.get(self.READY_CHECK_URI)
+        if ready_check is None or ready_check["state"] != "InProgress":
+            return self.__error(400, "INVALID_STATE", "No ready check")
+        await self.set_resource(self.READY_CHECK_URI, dict(ready_check, playerResponse="Accepted"))
+        self.__later(self.__settings.phase_delay, self.__enter_champion_select)
+        return web.Response(status=204)
+
+    async def __enter_champion_select(self) -> None:
+        """
+        Starts a champion select session with a ban and a pick for the local player.
+        """
+        self.__game_id += 1
+        await self.set_resource(self.READY_CHECK_URI, {"state": "Invalid", "playerResponse": "None", "timer": 0})
+        session = {"gameId": self.__game_id,
+                   "localPlayerCellId": 0,
+                   "myTeam": [{"cellId": cell_id, "assignedPosition": "", "championId": 0, "championPickIntent": 0}
+                              for cell_id in range(5)],
+                   "theirTeam": [],
+                   "actions": [[{"id": 1, "type": "ban", "actorCellId": 0, "championId": 0, "completed": False, "isInProgress": True,
+                                 "isAllyAction": True}],
+                               [{"id": 2, "type": "pick", "actorCellId": 0, "championId": 0, "completed": False, "isInProgress": False,
+                                 "isAllyAction": True}]],
+                   "bans": {"myTeamBans": [], "theirTeamBans": []},
+                   "timer": self.__timer()}
+        await self.set_resource(self.CHAMPION_SELECT_URI, session, "Create")
+        await self.__set_phase("ChampSelect")
+
+    def __timer(self) -> dict:
+        """
+        :return: the champion select timer of a turn starting now.
+        """
+        return {"adjustedTimeLeftInPhase": self.TURN_DURATION_MS, "internalNowInEpochMs": int(time.time() * 1000), "phase": "BAN_PICK"}
+
+    async def __update_action(self, action_id: int, champion_id: int | None, completed: bool) -> web.Response:
+        """
+        Selects a champion and/or completes a champion select action of the local player.
+        :param action_id: id of the action.
+        :param champion_id: id of the champion to select, or None to keep the selected one.
+        :param completed: True to complete the action.
+        :return: the response.
+        """
+        session = copy.deepcopy(self.__resources.get(self.CHAMPION_SELECT_URI))
+        if session is None:
+            return self.__error(404, "RPC_ERROR", "Not in champion select")
+        actions = [subaction for action in session["actions"] for subaction in action]
+        action = next((subaction for subaction in actions if subaction["id"] == action_id), None)
+        if action is None or action["completed"]:
+            return self.__error(400, "INVALID_STATE", "Invalid action")
+        if champion_id is not None:
+            action["championId"] = champion_id
+        if completed:
+            if not action["isInProgress"] or action["championId"] == 0:
+                return self.__error(500, "RPC_ERROR", "Action cannot be completed")
+            action["completed"] = True
+            action["isInProgress"] = False
+            next_action = next((subaction for subaction in actions if not subaction["completed"]), None)
+            if next_action is not None:
+                next_action["isInProgress"] = True
+                session["timer"] = self.__timer()
+            else:
+                self.__later(self.__settings.phase_delay, self.__start_game)
+        await self.set_resource(self.CHAMPION_SELECT_URI, session)
+        return web.Response(status=204)
+
+    async def __patch_action(self, match: re.Match, body: Any) -> web.Response:
+        """
+        Selects a champion for an action, and completes it if the body says so and single commits are supported.
+        """
+        if not isinstance(body, dict):
+            return self.__error(400, "INVALID_REQUEST", "Body is required")
+        return await self.__update_action(int(match.group(1)), body.get("championId"), self.__settings.single_commit and body.get("completed") is True)
+
+    async def __complete_action(self, match: re.Match, _body: Any) -> web.Response:
+        """
+        Completes an action.
+        """
+        return await self.__update_action(int(match.group(1)), None, True)
+
+    async def __select_summoner_spells(self, _match: re.Match, _body: Any) -> web.Response:
+        """
+        Selects the summoner spells of the local player.
+        """
+        if self.CHAMPION_SELECT_URI not in self.__resources:
+            return self.__error(404, "RPC_ERROR", "Not in champion select")
+        return web.Response(status=204)
+
+    async def __select_rune_page(self, _match: re.Match, body: Any) -> web.Response:
+        """
+        Selects the current rune page.
+        """
+        page = next((page for page in self.__resources["/lol-perks/v1/pages"] if page["id"] == body), None)
+        if page is None:
+            return self.__error(404, "RPC_ERROR", "Unknown rune page")
+        self.__resources["/lol-perks/v1/currentpage"] = page
+        return web.Response(status=204)
+
+    async def __start_game(self) -> None:
+        """
+        Ends champion select and starts the game, the game ends after the game duration.
+        """
+        await asyncio.sleep(max(self.__champion_select_end - time.perf_counter(), 0))
+        await self.set_resource(self.CHAMPION_SELECT_URI, None, "Delete")
+        await self.__set_phase("InProgress")
+        self.__later(self.__settings.game_duration, self.__end_game)
+
+    async def __end_game(self) -> None:
+        """
+        Ends the game, the lobby is deleted.
+        """
+        self.__last_queue_id = self.__get_queue_id()
+        await self.set_resource(self.LOBBY_URI, None, "Delete")
+        await self.set_resource(self.GAMEFLOW_URI, self.__gameflow("EndOfGame", self.__last_queue_id))
+
+    async def __dismiss_stats(self, _match: re.Match, _body: Any) -> web.Response:
+        """
+        Dismisses the end of game statistics.
+        """
+        return web.Response(status=204)
@@ -0,0 +1,19 @@
+"""Module containing the MockLcuSettings class."""
+from typing import NamedTuple
+
+
+class MockLcuSettings(NamedTuple):
+    """
+    Class describing the timings and the behavior of the mock League client.
+    latency is the minimum time (in seconds) taken by every REST request, jitter the maximum random time added to it.
+    single_commit tells if a champion select action can be completed with a single PATCH.
+    match_delay is the time (in seconds) between the start of the matchmaking and the ready check, phase_delay the time
+    between an accepted ready check or a completed champion select and the next phase, game_duration the time between
+    the start and the end of a game.
+    """
+    latency: float = 0.0
+    jitter: float = 0.0
+    single_commit: bool = True
+    match_delay: float = 0.5
+    phase_delay: float = 0.1
+    game_duration: float = 1.0
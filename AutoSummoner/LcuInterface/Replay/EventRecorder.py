@@ -0,0 +1,83 @@
+"""Module containing the EventRecorder class."""
+import atexit
+import gzip
+import json
+import os
+import threading
+import time
+from typing import Awaitable, Callable
+
+from lcu_driver.connection import Connection
+from lcu_driver.events.responses import WebsocketEventResponse
+
+
+class EventRecorder:
+    """
+    Class appending the LCU websocket events to a gzip compressed JSON lines log, so that sessions can be replayed offline.
+    Every line holds the subscribed URI, the event URI, the event type, the event payload and the reception time.
+    Recording is enabled by setting the AUTOSUMMONER_EVENT_LOG environment variable to the path of the log.
+    """
+
+    ENVIRONMENT_VARIABLE = "AUTOSUMMONER_EVENT_LOG"
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(self, path: str):
+        """
+        Opens the log, a new compressed member is appended to an existing log.
+        :param path: path of the log.
+        """
+        self.__file = gzip.open(path, "at", encoding="utf-8")
+        self.__lock = threading.Lock()
+        self.__last_flush = time.monotonic()
+
+    @classmethod
+    def from_environment(cls):
+        """
+        :return: a recorder writing to the log given by the environment variable, or None if recording is disabled.
+        """
+        path = os.environ.get(cls.ENVIRONMENT_VARIABLE)
+        if not path:
+            return None
+        try:
+            recorder = cls(path)
+        except OSError as e:
+            print("Failed to open LCU event log !\n", e)
+            return None
+        atexit.register(recorder.close)
+        return recorder
+
+    def record(self, subscription: str, event: WebsocketEventResponse) -> None:
+        """
+        Appends an event to the log, the log is flushed at most once per FLUSH_INTERVAL.
+        :param subscription: URI of the subscription which received the event.
+        :param event: LCU websocket event.
+        """
+        line = json.dumps({"time": time.time(), "subscription": subscription, "uri": event.uri, "type": event.type, "data": event.data},
+                          separators=(",", ":"))
+        with self.__lock:
+            try:
+                self.__file.write(line + "\n")
+                if time.monotonic() - self.__last_flush >= self.FLUSH_INTERVAL:
+                    self.__file.flush()
+                    self.__last_flush = time.monotonic()
+            except (OSError, ValueError) as e:
+                print("Failed to record LCU event !\n", e)
+
+    def wrap(self, subscription: str, handler: Callable[[Connection, WebsocketEventResponse], Awaitable[None]]) \
+            -> Callable[[Connection, WebsocketEventResponse], Awaitable[None]]:
+        """
+        :param subscription: URI of the subscription.
+        :param handler: handler of the events of the subscription.
+        :return: a handler recording the events before handling them.
+        """
+        async def recorded_handler(connection: Connection, event: WebsocketEventResponse) -> None:
+            self.record(subscription, event)
+            await handler(connection, event)
+        return recorded_handler
+
+    def close(self) -> None:
+        """
+        Flushes and closes the log.
+        """
+        with self.__lock:
+            self.__file.close()
@@ -0,0 +1,116 @@
+"""Module containing the EventReplayer class."""
+import asyncio
+import gzip
+import json
+import time
+from typing import Awaitable, Callable, Iterator
+
+from lcu_driver.events.responses import WebsocketEventResponse
+
+from AutoSummoner.LcuInterface.Replay.FakeConnection import FakeConnection
+
+
+class EventReplayer:
+    """
+    Class feeding the events of an LCU event log back into the event handlers, against a FakeConnection.
+    Events are replayed at the recorded pace divided by the speed factor, or as fast as possible with a speed of 0.
+    Like the lcu_driver connector, every handler call runs in its own task, so events keep being dispatched while
+    previous handlers are waiting for their requests.
+    """
+
+    def __init__(self, handlers: dict[str, Callable[[FakeConnection, WebsocketEventResponse], Awaitable[None]]],
+                 connection: FakeConnection, speed: float = 1.0):
+        """
+        Initializes the replayer.
+        :param handlers: handlers of the events, by subscribed URI.
+        :param connection: fake connection given to the handlers.
+        :param speed: replay speed factor, 0 to replay as fast as possible.
+        """
+        self.__handlers = handlers
+        self.__connection = connection
+        self.__speed = speed
+
+    @staticmethod
+    def read_events(path: str) -> Iterator[dict]:
+        """
+        Reads an event log, a log truncated by a crash of the recording process is read up to its last complete event.
+        :param path: path of the log.
+        :return: the recorded events, in order.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as log_file:
+            try:
+                for line in log_file:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        return
+            except EOFError:
+                return
+
+    async def replay(self, events: Iterator[dict]) -> dict[str, float]:
+        """
+        Replays events, the replay is over once every handler call returned.
+        :param events: recorded events.
+        :return: number of events replayed, number of events without handler, replay duration and total duration of
+        the handler calls (in seconds), number of events per second and number of requests sent by the handlers.
+        """
+        replayed = 0
+        skipped = 0
+        handling_durations = []
+        handler_tasks = []
+        first_event_time = None
+        start = time.perf_counter()
+        for event_dict in events:
+            handler = self.__handlers.get(event_dict.get("subscription", event_dict["uri"]))
+            if handler is None:
+                skipped += 1
+                continue
+
+            if first_event_time is None:
+                first_event_time = event_dict["time"]
+            if self.__speed > 0:
+                delay = (event_dict["time"] - first_event_time) / self.__speed - (time.perf_counter() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            event = WebsocketEventResponse(event_type=event_dict["type"], uri=event_dict["uri"],
+                                           data=self.__shift_timer(event_dict["data"]))
+            self.__connection.apply_event(event)
+            handler_tasks.append(asyncio.create_task(self.__handle(handler, event, handling_durations)))
+            replayed += 1
+            # Lets the handlers run before the next event, like the connector waiting for the next websocket message
+            await asyncio.sleep(0)
+
+        await asyncio.gather(*handler_tasks)
+        duration = time.perf_counter() - start
+        return {"events": replayed,
+                "skipped": skipped,
+                "duration": duration,
+                "handling_duration": sum(handling_durations),
+                "events_per_second": replayed / duration if duration > 0 else 0.0,
+                "requests": len(self.__connection.get_requests())}
+
+    async def __handle(self, handler: Callable[[FakeConnection, WebsocketEventResponse], Awaitable[None]],
+                       event: WebsocketEventResponse, handling_durations: list[float]) -> None:
+        """
+        Calls a handler, a failing handler does not stop the replay.
+        :param handler: handler of the event.
+        :param event: replayed event.
+        :param handling_durations: list the duration (in seconds) of the call is added to.
+        """
+        handling_start = time.perf_counter()
+        try:
+            await handler(self.__connection, event)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            print(f"Failed to replay {event.type} event of {event.uri} !\n", e)
+        handling_durations.append(time.perf_counter() - handling_start)
+
+    @staticmethod
+    def __shift_timer(data):
+        """
+        :param data: payload of a recorded event.
+        :return: the payload, with the champion select timer moved to the replay clock so that deadlines are not already over.
+        """
+        if isinstance(data, dict) and isinstance(data.get("timer"), dict) and "internalNowInEpochMs" in data["timer"]:
+            data = dict(data, timer=dict(data["timer"], internalNowInEpochMs=int(time.time() * 1000)))
+        return data
@@ -0,0 +1,57 @@
+"""Module containing the FakeConnection class."""
+import asyncio
+import time
+from typing import Any
+
+from lcu_driver.events.responses import WebsocketEventResponse
+
+from AutoSummoner.LcuInterface.Replay.FakeResponse import FakeResponse
+
+
+class FakeConnection:
+    """
+    Class standing for the LCU connection while replaying events.
+    GET requests are answered with the last replayed payload of the resource, other requests succeed without content.
+    Every request is recorded with the time at which it was sent.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        """
+        Initializes the fake connection.
+        :param latency: time (in seconds) taken by every request.
+        """
+        self.__latency = latency
+        self.__resources: dict[str, Any] = {}
+        self.__requests: list[tuple[float, str, str, Any]] = []
+
+    def apply_event(self, event: WebsocketEventResponse) -> None:
+        """
+        Updates the resources with a replayed event.
+        :param event: LCU websocket event.
+        """
+        if event.type.upper() == "DELETE":
+            self.__resources.pop(event.uri, None)
+        else:
+            self.__resources[event.uri] = event.data
+
+    async def request(self, method: str, endpoint: str, **kwargs) -> FakeResponse:
+        """
+        :param method: HTTP method.
+        :param endpoint: LCU endpoint.
+        :param kwargs: other arguments of the request, "data" is recorded.
+        :return: the fake response.
+        """
+        self.__requests.append((time.perf_counter(), method.lower(), endpoint, kwargs.get("data")))
+        if self.__latency > 0:
+            await asyncio.sleep(self.__latency)
+        if method.lower() != "get":
+            return FakeResponse(204)
+        if endpoint not in self.__resources:
+            return FakeResponse(404, {"errorCode": "RPC_ERROR", "httpStatus": 404, "message": "No resource replayed"})
+        return FakeResponse(200, self.__resources[endpoint])
+
+    def get_requests(self) -> list[tuple[float, str, str, Any]]:
+        """
+        :return: the requests sent (time.perf_counter() time, method, endpoint, data), in order.
+        """
+        return list(self.__requests)
@@ -0,0 +1,29 @@
+"""Module containing the FakeResponse class."""
+from typing import Any
+
+
+class FakeResponse:
+    """Class of the responses of the FakeConnection, mimicking the aiohttp responses used by the LCU worker."""
+
+    def __init__(self, status: int, data: Any = None):
+        """
+        Initializes the response.
+        :param status: HTTP status.
+        :param data: JSON payload, or None for an empty response.
+        """
+        self.status = status
+        self.__data = data
+        self.content_type = "application/json" if data is not None else "application/octet-stream"
+
+    @property
+    def ok(self) -> bool:  # pylint: disable=invalid-name
+        """
+        :return: True if the status is not an error status, False otherwise.
+        """
+        return self.status < 400
+
+    async def json(self) -> Any:
+        """
+        :return: the JSON payload.
+        """
+        return self.__data
@@ -0,0 +1,9 @@
+"""Module containing the RequestLane Enum"""
+from enum import Enum
+
+
+class RequestLane(Enum):
+    """Enum of the priority lanes of the LCU requests, from the highest to the lowest priority."""
+    CRITICAL = "critical"
+    STATE = "state"
+    BACKGROUND = "background"
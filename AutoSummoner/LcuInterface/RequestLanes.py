@@ -0,0 +1,123 @@
+"""Module containing the RequestLanes class."""
+import asyncio
+import time
+from collections import deque
+
+from aiohttp import ClientResponse
+from lcu_driver.connection import Connection
+
+from AutoSummoner.LcuInterface.ActionTrace import ActionTrace
+from AutoSummoner.LcuInterface.RequestLane import RequestLane
+
+
+class RequestLanes:
+    """
+    Class sending the LCU requests through priority lanes.
+    Each lane has its own concurrency cap. Critical requests (ready check accept, champion select actions, matchmaking)
+    are never queued behind the other lanes, state and background requests share a common cap
+    and a freed slot is always given to the waiting request of the highest priority lane.
+    """
+
+    LANE_LIMITS = {RequestLane.CRITICAL: 4,
+                   RequestLane.STATE: 4,
+                   RequestLane.BACKGROUND: 2}
+    SHARED_LIMIT = 4
+
+    def __init__(self):
+        """
+        Initializes the request lanes.
+        """
+        self.__active = {lane: 0 for lane in RequestLane}
+        self.__waiting: dict[RequestLane, deque[asyncio.Future]] = {lane: deque() for lane in RequestLane}
+        self.__statistics = {lane: {"requests": 0, "queued": 0, "total_wait_ms": 0.0, "max_wait_ms": 0.0} for lane in RequestLane}
+
+    async def request(self, connection: Connection, lane: RequestLane, method: str, endpoint: str,
+                      trace: ActionTrace = None, **kwargs) -> ClientResponse:
+        """
+        Sends a request once its lane has a free slot, must be called from the event loop thread.
+        :param connection: LCU connection.
+        :param lane: priority lane of the request.
+        :param method: HTTP method.
+        :param endpoint: LCU endpoint.
+        :param trace: trace of the action sending the request, or None.
+        :param kwargs: other arguments of the request (data, params...).
+        :return: the LCU response.
+        """
+        await self.__acquire(lane)
+        try:
+            if trace is not None:
+                trace.on_request_sent()
+            response = await connection.request(method, endpoint, **kwargs)
+            if trace is not None:
+                trace.on_response_received()
+            return response
+        finally:
+            self.__release(lane)
+
+    def get_statistics(self) -> dict[str, dict[str, float]]:
+        """
+        :return: for each lane, number of requests, number of requests which waited for a slot,
+        total and maximum waiting time (in milliseconds) and number of outstanding requests.
+        """
+        return {lane.value: dict(self.__statistics[lane], in_flight=self.__active[lane]) for lane in RequestLane}
+
+    async def __acquire(self, lane: RequestLane) -> None:
+        """
+        Waits for a free slot in the lane.
+        :param lane: priority lane of the request.
+        """
+        statistics = self.__statistics[lane]
+        statistics["requests"] += 1
+        if self.__can_start(lane) and not self.__has_waiting_requests(lane):
+            self.__active[lane] += 1
+            return
+
+        statistics["queued"] += 1
+        start = time.perf_counter()
+        slot = asyncio.get_running_loop().create_future()
+        self.__waiting[lane].append(slot)
+        try:
+            await slot
+        except asyncio.CancelledError:
+            if slot.done() and not slot.cancelled():
+                # The slot was given to this request right before it was cancelled
+                self.__release(lane)
+            else:
+                self.__waiting[lane].remove(slot)
+            raise
+        wait = (time.perf_counter() - start) * 1000
+        statistics["total_wait_ms"] += wait
+        statistics["max_wait_ms"] = max(statistics["max_wait_ms"], wait)
+
+    def __release(self, lane: RequestLane) -> None:
+        """
+        Frees a slot of the lane and gives the free slots to the waiting requests, the highest priority lane first.
+        :param lane: priority lane of the finished request.
+        """
+        self.__active[lane] -= 1
+        for waiting_lane in RequestLane:
+            waiting = self.__waiting[waiting_lane]
+            while waiting and self.__can_start(waiting_lane):
+                self.__active[waiting_lane] += 1
+                waiting.popleft().set_result(None)
+
+    def __can_start(self, lane: RequestLane) -> bool:
+        """
+        :param lane: priority lane of the request.
+        :return: True if a request of the lane can be sent right now, False otherwise.
+        """
+        if self.__active[lane] >= self.LANE_LIMITS[lane]:
+            return False
+        if lane is RequestLane.CRITICAL:
+            return True
+        return sum(self.__active[shared_lane] for shared_lane in RequestLane if shared_lane is not RequestLane.CRITICAL) < self.SHARED_LIMIT
+
+    def __has_waiting_requests(self, lane: RequestLane) -> bool:
+        """
+        :param lane: priority lane of the request.
+        :return: True if requests competing for the same slots with the same or a higher priority are waiting, False otherwise.
+        """
+        if lane is RequestLane.CRITICAL:
+            return len(self.__waiting[RequestLane.CRITICAL]) > 0
+        lanes = [shared_lane for shared_lane in RequestLane if shared_lane is not RequestLane.CRITICAL]
+        return any(self.__waiting[shared_lane] for shared_lane in lanes[:lanes.index(lane) + 1])
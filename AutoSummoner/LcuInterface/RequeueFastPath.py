@@ -0,0 +1,123 @@
+"""Module containing the RequeueFastPath class."""
+import asyncio
+import time
+from typing import Callable
+
+from lcu_driver.connection import Connection
+
+from AutoSummoner.Config.Configuration import Configuration
+from AutoSummoner.Config.MainFeatures import MainFeatures
+from AutoSummoner.LcuInterface.InFlightRegistry import InFlightRegistry
+from AutoSummoner.LcuInterface.RequestLane import RequestLane
+from AutoSummoner.LcuInterface.RequestLanes import RequestLanes
+
+
+class RequeueFastPath:
+    """
+    Class starting the next game as soon as a game ends.
+    Instead of waiting for the gameflow to go back to "None" and for the lobby events, the lobby is created,
+    the roles are selected and the matchmaking is started one right after the other from the end of game screens.
+    The lobby events still handle everything the fast path could not do.
+    """
+
+    MAX_LATENCIES = 20
+
+    def __init__(self, config: Configuration, requests: InFlightRegistry, request_lanes: RequestLanes,
+                 update_status: Callable[[str], None]):
+        """
+        Initializes the requeue fast path.
+        :param config: the Configuration object.
+        :param requests: registry deduplicating the requests also sent by the lobby events.
+        :param request_lanes: lanes through which the requests are sent.
+        :param update_status: function reporting the current action.
+        """
+        self.__config = config
+        self.__requests = requests
+        self.__request_lanes = request_lanes
+        self.__update_status = update_status
+        self.__game_end_time: float | None = None
+        self.__lobby_created = False
+        self.__latencies: list[float] = []
+
+    def reset(self) -> None:
+        """
+        Forgets the current game, called when a game starts or when the LCU connection is (re)established.
+        """
+        self.__game_end_time = None
+        self.__lobby_created = False
+
+    async def on_game_end(self, connection: Connection, gameflow: dict) -> None:
+        """
+        Called when an end of game phase is entered, creates the next lobby unless it was already created.
+        :param connection: LCU connection.
+        :param gameflow: current League gameflow dictionary.
+        """
+        if self.__game_end_time is None:
+            self.__game_end_time = time.perf_counter()
+        if self.__lobby_created:
+            return
+
+        config_auto_lobby = self.__config.get_snapshot().get_feature_configuration(MainFeatures.AUTO_LOBBY)
+        auto_select_queue_id = config_auto_lobby.get_auto_select_queue_id()
+        if not (config_auto_lobby.is_enabled() and config_auto_lobby.is_auto_select_queue_enabled() and auto_select_queue_id > 0):
+            return
+
+        # The statistics screen is dismissed on a best-effort basis, it must not delay the next lobby
+        results = await asyncio.gather(self.__request_lanes.request(connection, RequestLane.BACKGROUND, 'post',
+                                                                    '/lol-end-of-game/v1/state/dismiss-stats'),
+                                       self.__requeue(connection, gameflow, auto_select_queue_id),
+                                       return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                print("Failed to requeue after the end of the game !\n", result)
+
+    def on_matchmaking_started(self) -> None:
+        """
+        Called when the matchmaking phase is entered, records the time elapsed since the end of the game.
+        """
+        if self.__game_end_time is not None:
+            self.__latencies.append((time.perf_counter() - self.__game_end_time) * 1000)
+            del self.__latencies[:-self.MAX_LATENCIES]
+        self.reset()
+
+    def get_latencies(self) -> list[float]:
+        """
+        :return: the last durations (in milliseconds) between the end of a game and the start of the next matchmaking.
+        """
+        return list(self.__latencies)
+
+    async def __requeue(self, connection: Connection, gameflow: dict, queue_id: int) -> None:
+        """
+        Creates the lobby, selects the roles and starts the matchmaking without waiting for the lobby events.
+        :param connection: LCU connection.
+        :param gameflow: current League gameflow dictionary.
+        :param queue_id: id of the queue of the lobby to create.
+        """
+        response = None
+        played_queue_id = gameflow.get("gameData", {}).get("queue", {}).get("id")
+        if played_queue_id == queue_id:
+            # Playing again keeps the party together
+            response = await self.__request_lanes.request(connection, RequestLane.STATE, 'post', '/lol-lobby/v2/play-again')
+        if response is None or not response.ok:
+            response = await self.__request_lanes.request(connection, RequestLane.STATE, 'post', '/lol-lobby/v2/lobby', data={"queueId": queue_id})
+        if not response.ok:
+            return
+        self.__lobby_created = True
+        self.__update_status("game ended, creating lobby")
+
+        # Roles only exist in the queues where the created lobby has position preferences
+        lobby = await response.json() if response.content_type == "application/json" else None
+        has_positions = isinstance(lobby, dict) and lobby.get("localMember", {}).get("firstPositionPreference", "") != ""
+        config = self.__config.get_snapshot()
+        config_auto_lobby = config.get_feature_configuration(MainFeatures.AUTO_LOBBY)
+        if has_positions and config_auto_lobby.is_auto_select_roles_enabled():
+            positions = config_auto_lobby.get_auto_select_roles()
+            await self.__request_lanes.request(connection, RequestLane.STATE, 'put', '/lol-lobby/v2/lobby/members/localMember/position-preferences',
+                                               data={"firstPreference": positions[0].get_league_position_str(),
+                                                     "secondPreference": positions[1].get_league_position_str()})
+
+        if config.get_feature_configuration(MainFeatures.AUTO_QUEUE).is_auto_start_queue_enabled():
+            self.__update_status("starting matchmaking")
+            await self.__requests.request(
+                ("lobby", "search"),
+                lambda: self.__request_lanes.request(connection, RequestLane.CRITICAL, 'post', '/lol-lobby/v2/lobby/matchmaking/search'))
@@ -0,0 +1,82 @@
+"""Module containing the StatusReporter class."""
+import asyncio
+import time
+from typing import Callable
+
+from AutoSummoner.LcuInterface.WorkerStatus import WorkerStatus
+
+
+class StatusReporter:
+    """
+    Class sending the status of the LCU worker to the UI at a bounded rate.
+    Statuses reported less than MIN_INTERVAL after the last sent status replace each other, only the latest one is sent
+    once the interval is over. A status identical to the status shown is not sent again.
+    """
+    # pylint: disable=too-many-instance-attributes
+    # The pending, shown and timing states are needed together to decide when a status is sent
+
+    MIN_INTERVAL = 0.1
+
+    def __init__(self, emit: Callable[[WorkerStatus], None], get_phase: Callable[[], str | None], min_interval: float = MIN_INTERVAL):
+        """
+        Initializes the status reporter.
+        :param emit: function sending a status to the UI.
+        :param get_phase: function returning the current gameflow phase.
+        :param min_interval: minimum time (in seconds) between two statuses sent.
+        """
+        self.__emit = emit
+        self.__get_phase = get_phase
+        self.__min_interval = min_interval
+        self.__pending: tuple[str | None, str] | None = None
+        self.__pending_coalesced = 0
+        self.__shown: tuple[str | None, str] | None = None
+        self.__last_emit_time = float("-inf")
+        self.__flush_handle: asyncio.TimerHandle | None = None
+        self.__statistics = {"reported": 0, "emitted": 0, "coalesced": 0, "deduplicated": 0}
+
+    def report(self, action: str) -> None:
+        """
+        Reports what the worker is doing, must be called from the event loop thread.
+        :param action: the current action, e.g. "banning champion".
+        """
+        self.__statistics["reported"] += 1
+        status = (self.__get_phase(), action)
+        if self.__pending is None and status == self.__shown:
+            self.__statistics["deduplicated"] += 1
+            return
+        if self.__pending is not None:
+            self.__statistics["coalesced"] += 1
+            self.__pending_coalesced += 1
+        self.__pending = status
+
+        if self.__flush_handle is None:
+            delay = self.__last_emit_time + self.__min_interval - time.monotonic()
+            if delay <= 0:
+                self.__flush()
+            else:
+                self.__flush_handle = asyncio.get_running_loop().call_later(delay, self.__flush)
+
+    def get_statistics(self) -> dict[str, int]:
+        """
+        :return: number of statuses reported, sent, replaced by a more recent status and not sent as they were already shown.
+        """
+        return dict(self.__statistics)
+
+    def __flush(self) -> None:
+        """
+        Sends the pending status, unless it is already shown.
+        """
+        self.__flush_handle = None
+        status, coalesced = self.__pending, self.__pending_coalesced
+        self.__pending = None
+        self.__pending_coalesced = 0
+        if status is None:
+            return
+        if status == self.__shown:
+            self.__statistics["deduplicated"] += 1
+            return
+
+        self.__shown = status
+        self.__last_emit_time = time.monotonic()
+        self.__statistics["emitted"] += 1
+        self.__emit(WorkerStatus(status[0], status[1], time.time(), coalesced))
@@ -0,0 +1,27 @@
+"""Module containing the WorkerStatus class."""
+import time
+from typing import NamedTuple
+
+
+class WorkerStatus(NamedTuple):
+    """
+    Class describing what the LCU worker is doing, sent to the UI.
+    """
+    phase: str | None
+    action: str
+    timestamp: float
+    coalesced: int = 0
+
+    def get_message(self) -> str:
+        """
+        :return: the status message shown to the user.
+        """
+        return f"Connected to League Client, {self.action}..."
+
+    def get_details(self) -> str:
+        """
+        :return: the gameflow phase, the time of the status and the number of statuses replaced by this one.
+        """
+        return (f"Gameflow phase : {self.phase if self.phase is not None else 'unknown'}\n"
+                f"Updated at {time.strftime('%H:%M:%S', time.localtime(self.timestamp))}"
+                + (f" ({self.coalesced} intermediate statuses skipped)" if self.coalesced > 0 else ""))
@@ -1,9 +1,10 @@
 """Module containing the auto champion select configuration widget."""
 from PyQt5 import uic
-from PyQt5.QtCore import pyqtSignal, pyqtSlot, Qt, QFile
+from PyQt5.QtCore import pyqtSlot, Qt, QFile
 from PyQt5.QtWidgets import QWidget, QPushButton, QListWidget, QInputDialog, QListWidgetItem, QComboBox, QCheckBox, \
     QMessageBox
 
+from AutoSummoner.Config.ConfigChange import ConfigChange
 from AutoSummoner.Config.Configuration import Configuration
 from AutoSummoner.Config.MainFeatures import MainFeatures
 from AutoSummoner.Config.Features.ConfigAutoChampionSelect import ConfigAutoChampionSelect
@@ -20,7 +21,6 @@ class AutoChampionSelectWidget(QWidget):
 
     # pylint: disable=too-many-instance-attributes
     __config = Configuration()
-    configUpdatedSignal = pyqtSignal()
 
     __champions_dict: dict[int:Champion] = {}
     __summoner_spells_dict: dict[int: Spell] = {}
@@ -66,21 +66,39 @@ class AutoChampionSelectWidget(QWidget):
         self.auto_champion_select_champion_rune_combobox: QComboBox = self.findChild(QComboBox, 'auto_champion_select_champion_rune_combobox')
         self.auto_champion_select_champion_rune_unique_checkbox: QCheckBox = self.findChild(QCheckBox, 'auto_champion_select_champion_rune_unique_checkbox')
 
+        self.__config.add_listener(self.on_config_changed)
+
     @pyqtSlot()
     def load_config(self) -> None:
         """
         Loads the user configuration and updates the UI accordingly.
         """
-        self.__config.load_config()
-
         config_auto_champion_select: ConfigAutoChampionSelect = self.__config.get_feature_configuration(MainFeatures.AUTO_CHAMPION_SELECT)
-        previous_profile = self.__get_current_profile()
+        previous_profile_id = self.auto_champion_select_champion_profile_combobox.currentData(Qt.ItemDataRole.UserRole)
         self.auto_champion_select_champion_profile_combobox.clear()
         for index, profile in enumerate(config_auto_champion_select.get_all_profiles()):
             self.auto_champion_select_champion_profile_combobox.addItem(profile.get_name(), profile.get_id())
-            if previous_profile is not None and profile == previous_profile:
+            if previous_profile_id is not None and profile.get_id() == previous_profile_id:
                 self.auto_champion_select_champion_profile_combobox.setCurrentIndex(index)
 
+    def on_config_changed(self, changes: list[ConfigChange]) -> None:
+        """
+        Called by the configuration when it changes.
+        Changes made by this widget are already shown, only profiles modified outside AutoSummoner are updated.
+        :param changes: list of configuration changes.
+        """
+        profile_changes = [change for change in changes
+                           if change.external and change.section.startswith(ConfigAutoChampionSelect.SECTION + ".")]
+        if len(profile_changes) == 0:
+            return
+
+        if any(change.key in (None, "name") for change in profile_changes):
+            self.load_config()
+
+        current_profile = self.__get_current_profile()
+        if current_profile is not None and any(change.section == current_profile.section for change in profile_changes):
+            self.on_auto_champion_select_champion_profile_combobox_currentIndexChanged()
+
     @pyqtSlot(list)
     def on_lcuWorker_updateQueues(self, queue_list: list[Queue]) -> None:
         """
@@ -136,16 +154,16 @@ class AutoChampionSelectWidget(QWidget):
         else:
             profile = self.__config.get_feature_configuration(MainFeatures.AUTO_CHAMPION_SELECT).get_config_for_profile(profile_id)
 
-        profile.set_name(profile_name)
-        profile.set_queues_id(edit_profile_dialog.get_profile_queues_id())
-        profile.set_positions(edit_profile_dialog.get_profile_positions())
+        with self.__config.batch():
+            profile.set_name(profile_name)
+            profile.set_queues_id(edit_profile_dialog.get_profile_queues_id())
+            profile.set_positions(edit_profile_dialog.get_profile_positions())
 
         if edit_profile_dialog.get_existing_profile_id() is None:
             self.auto_champion_select_champion_profile_combobox.addItem(profile.get_name(), profile.get_id())
             self.auto_champion_select_champion_profile_combobox.setCurrentIndex(self.auto_champion_select_champion_profile_combobox.count()-1)
         else:
             self.auto_champion_select_champion_profile_combobox.setItemText(self.auto_champion_select_champion_profile_combobox.currentIndex(), profile_name)
-        self.configUpdatedSignal.emit()
 
     @pyqtSlot()
     def on_auto_champion_select_champion_profile_remove_button_clicked(self) -> None:
@@ -159,7 +177,6 @@ class AutoChampionSelectWidget(QWidget):
         profile_id = self.auto_champion_select_champion_profile_combobox.itemData(index, Qt.ItemDataRole.UserRole)
         self.__config.get_feature_configuration(MainFeatures.AUTO_CHAMPION_SELECT).remove_profile(profile_id)
         self.auto_champion_select_champion_profile_combobox.removeItem(index)
-        self.configUpdatedSignal.emit()
 
     def __get_current_profile(self) -> ConfigAutoChampionSelectProfile | None:
         """
@@ -303,7 +320,6 @@ class AutoChampionSelectWidget(QWidget):
     @pyqtSlot()
     def __save_champions_ban_config(self) -> None:
         self.__get_current_profile().set_champions_ban_id(self.__get_champions_ban_id_list())
-        self.configUpdatedSignal.emit()
 
     @pyqtSlot()
     def on_auto_champion_select_champion_pick_add_button_clicked(self) -> None:
@@ -353,7 +369,6 @@ class AutoChampionSelectWidget(QWidget):
         Saves the champions pick configuration.
         """
         self.__get_current_profile().set_champions_pick_id(self.__get_champions_pick_id_list())
-        self.configUpdatedSignal.emit()
 
     def __update_summoner_spells_comboboxes(self) -> None:
         """
@@ -415,7 +430,6 @@ class AutoChampionSelectWidget(QWidget):
         # pylint: disable=invalid-name
         self.__get_current_profile().set_using_individual_summoner_spell(state == Qt.CheckState.Checked)
         self.__update_summoner_spells_comboboxes()
-        self.configUpdatedSignal.emit()
 
     @pyqtSlot(int)
     def on_auto_champion_select_champion_summoner_spell_combobox_1_currentIndexChanged(self, index: int) -> None:
@@ -466,8 +480,6 @@ class AutoChampionSelectWidget(QWidget):
         else:
             self.__get_current_profile().set_summoner_spells_id_global(summoner_spell_1_id, summoner_spell_2_id)
 
-        self.configUpdatedSignal.emit()
-
     def __update_runes_combobox(self) -> None:
         """
         Update the runes combobox and show the list of runes that are available, select the one requested by the user.
@@ -508,7 +520,6 @@ class AutoChampionSelectWidget(QWidget):
         # pylint: disable=invalid-name
         self.__get_current_profile().set_using_individual_rune(state == Qt.CheckState.Checked)
         self.__update_runes_combobox()
-        self.configUpdatedSignal.emit()
 
     @pyqtSlot(int)
     def on_auto_champion_select_champion_rune_combobox_currentIndexChanged(self, index: int) -> None:
@@ -529,5 +540,3 @@ class AutoChampionSelectWidget(QWidget):
                                                                       rune_id)
         else:
             self.__get_current_profile().set_rune_id_global(rune_id)
-
-        self.configUpdatedSignal.emit()
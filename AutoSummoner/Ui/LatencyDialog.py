@@ -0,0 +1,81 @@
+"""Module containing the latency dialog."""
+from typing import Callable
+
+from PyQt5.QtCore import QTimer, pyqtSlot
+from PyQt5.QtWidgets import QDialog, QFileDialog, QHBoxLayout, QHeaderView, QPushButton, QTableWidget, QTableWidgetItem, QVBoxLayout
+
+
+class LatencyDialog(QDialog):
+    """
+    Dialog showing the latency histograms of the actions sent to the League client.
+    The dialog is built in code as the Qt resources are not regenerated.
+    """
+
+    COLUMNS = ("Action", "Stage", "Count", "p50 (ms)", "p90 (ms)", "p99 (ms)", "Max (ms)")
+    REFRESH_INTERVAL_MS = 1000
+
+    def __init__(self, get_latencies: Callable[[], dict[str, dict[str, dict]]], dump_latencies: Callable[[str], None], parent=None) -> None:
+        """
+        Initializes the latency dialog.
+        :param get_latencies: function returning the latency histograms, per action and stage.
+        :param dump_latencies: function writing the latency histograms to a file.
+        :param parent: parent widget.
+        """
+        super().__init__(parent)
+        self.__get_latencies = get_latencies
+        self.__dump_latencies = dump_latencies
+
+        self.setWindowTitle("Action latencies")
+        self.resize(640, 360)
+
+        self.latency_table = QTableWidget(0, len(self.COLUMNS), self)
+        self.latency_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.latency_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.latency_table.verticalHeader().setVisible(False)
+        self.latency_table.setEditTriggers(QTableWidget.NoEditTriggers)
+
+        self.latency_save_button = QPushButton("Save to file...", self)
+        self.latency_save_button.clicked.connect(self.on_latency_save_button_clicked)
+        self.latency_close_button = QPushButton("Close", self)
+        self.latency_close_button.clicked.connect(self.accept)
+
+        buttons_layout = QHBoxLayout()
+        buttons_layout.addStretch()
+        buttons_layout.addWidget(self.latency_save_button)
+        buttons_layout.addWidget(self.latency_close_button)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.latency_table)
+        layout.addLayout(buttons_layout)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start(self.REFRESH_INTERVAL_MS)
+        self.refresh()
+
+    @pyqtSlot()
+    def refresh(self) -> None:
+        """
+        Updates the table with the current latency histograms.
+        """
+        rows = [(action, stage, histogram)
+                for action, stages in sorted(self.__get_latencies().items())
+                for stage, histogram in stages.items()]
+        self.latency_table.setRowCount(len(rows))
+        for row, (action, stage, histogram) in enumerate(rows):
+            values = (action, stage, str(histogram["count"]),
+                      f"{histogram['p50_ms']:.0f}", f"{histogram['p90_ms']:.0f}", f"{histogram['p99_ms']:.0f}", f"{histogram['max_ms']:.1f}")
+            for column, value in enumerate(values):
+                self.latency_table.setItem(row, column, QTableWidgetItem(value))
+
+    @pyqtSlot()
+    def on_latency_save_button_clicked(self) -> None:
+        """
+        Called when the "Save to file..." button is clicked, writes the latency histograms to the selected file.
+        """
+        path, _ = QFileDialog.getSaveFileName(self, "Save action latencies", "latencies.json", "JSON files (*.json)")
+        if not path:
+            return
+        try:
+            self.__dump_latencies(path)
+        except OSError as e:
+            print("Failed to save action latencies !\n", e)
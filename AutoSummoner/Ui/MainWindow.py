@@ -1,8 +1,9 @@
 """Module containing the main window of AutoSummoner."""
 from PyQt5 import uic
-from PyQt5.QtCore import QThread, pyqtSlot, QFile
-from PyQt5.QtWidgets import QMainWindow, QLabel, QCheckBox, QComboBox
+from PyQt5.QtCore import QThread, pyqtSignal, pyqtSlot, QFile
+from PyQt5.QtWidgets import QMainWindow, QLabel, QCheckBox, QComboBox, QHBoxLayout, QPushButton
 
+from AutoSummoner.Config.ConfigChange import ConfigChange
 from AutoSummoner.Config.Configuration import Configuration
 from AutoSummoner.Config.MainFeatures import MainFeatures
 from AutoSummoner.Config.Features.ConfigAutoChampionSelect import ConfigAutoChampionSelect
@@ -10,9 +11,11 @@ from AutoSummoner.Config.Features.ConfigAutoLobby import ConfigAutoLobby
 from AutoSummoner.Config.Features.ConfigAutoQueue import ConfigAutoQueue
 from AutoSummoner.LcuInterface.LcuWorker import LcuWorker
 from AutoSummoner.LcuInterface.Position import Position
+from AutoSummoner.LcuInterface.WorkerStatus import WorkerStatus
 from AutoSummoner.LcuInterface.Assets.AssetsWorker import AssetsWorker
 from AutoSummoner.LcuInterface.Assets.Queue import Queue
 from AutoSummoner.Ui.AutoChampionSelectWidget import AutoChampionSelectWidget
+from AutoSummoner.Ui.LatencyDialog import LatencyDialog
 
 
 class MainWindow(QMainWindow):
@@ -26,9 +29,16 @@ class MainWindow(QMainWindow):
     assertsThread = QThread()
 
     config = Configuration()
+    config_file_watcher = None
+
+    # Signals
+    config_file_changed = pyqtSignal(object, object)
+    config_write_error = pyqtSignal(object)
 
     last_first_preference = None
     last_second_preference = None
+    last_lcu_worker_status: WorkerStatus | None = None
+    last_config_write_error: Exception | None = None
 
     def __init__(self) -> None:
         """
@@ -59,7 +69,11 @@ class MainWindow(QMainWindow):
         self.main_autoqueue_auto_accept_match_checkbox: QCheckBox = self.findChild(QCheckBox,'main_autoqueue_auto_accept_match_checkbox')
 
         self.main_autochampionselect_profile_widget: AutoChampionSelectWidget = self.findChild(AutoChampionSelectWidget, "main_autochampionselect_profile_widget")
-        self.main_autochampionselect_profile_widget.configUpdatedSignal.connect(self.on_main_autochampionselect_profile_widget_config_updated)
+
+        # The latency button is not part of mainwindow.ui as the Qt resources are not regenerated
+        self.main_status_latencies_button = QPushButton("Latencies...", self)
+        self.main_status_latencies_button.clicked.connect(self.on_main_status_latencies_button_clicked)
+        self.findChild(QHBoxLayout, "horizontalLayout_2").addWidget(self.main_status_latencies_button)
 
         # Init UI
         for position in Position.get_all_positions():
@@ -68,11 +82,21 @@ class MainWindow(QMainWindow):
 
         self.load_config()
         self.main_autochampionselect_profile_widget.load_config()
+        self.config.add_listener(self.on_config_changed)
+
+        # Watch external modifications of the configuration file
+        self.config_file_changed.connect(self.on_config_file_changed)
+        self.config_file_watcher = self.config.create_file_watcher(self.config_file_changed.emit)
+        if self.config_file_watcher is not None:
+            self.config_file_watcher.start()
+
+        # Show the configuration write failures in the status
+        self.config_write_error.connect(self.on_config_write_error)
+        self.config.set_write_error_listener(self.config_write_error.emit)
 
         # Init LCU
         self.lcuWorker.moveToThread(self.lcuThread)
 
-        self.main_autochampionselect_profile_widget.configUpdatedSignal.connect(self.lcuWorker.load_config)
         self.lcuThread.started.connect(self.lcuWorker.run)
         self.lcuWorker.update_status.connect(self.on_lcu_worker_update_status)
         self.lcuWorker.update_queues.connect(self.on_lcuWorker_updateQueues)
@@ -91,16 +115,40 @@ class MainWindow(QMainWindow):
 
     def load_config(self) -> None:
         """
-        Loads the user configuration and updates the UI accordingly.
+        Updates the whole UI with the user configuration.
         """
-        self.config.load_config()
-        config_auto_lobby: ConfigAutoLobby = self.config.get_feature_configuration(MainFeatures.AUTO_LOBBY)
-        config_auto_queue: ConfigAutoQueue = self.config.get_feature_configuration(MainFeatures.AUTO_QUEUE)
-        config_auto_champion_select: ConfigAutoChampionSelect = self.config.get_feature_configuration(MainFeatures.AUTO_CHAMPION_SELECT)
+        self.__update_auto_lobby_ui()
+        self.__update_auto_queue_ui()
+        self.__update_auto_champion_select_ui()
+
+    def on_config_changed(self, changes: list[ConfigChange]) -> None:
+        """
+        Called by the configuration when it changes, updates only the UI elements of the changed sections.
+        :param changes: list of configuration changes.
+        """
+        sections = {change.section for change in changes}
+        if not sections.isdisjoint(ConfigAutoLobby.SECTIONS):
+            self.__update_auto_lobby_ui()
+        if ConfigAutoQueue.SECTION in sections:
+            self.__update_auto_queue_ui()
+        if ConfigAutoChampionSelect.SECTION in sections:
+            self.__update_auto_champion_select_ui()
 
+    @pyqtSlot(object, object)
+    def on_config_file_changed(self, content: dict[str, dict[str, str]], changes: list[ConfigChange]) -> None:
+        """
+        Called by the configuration file watcher when the configuration file is modified outside AutoSummoner.
+        :param content: new content of the configuration file, by section and key.
+        :param changes: sections and keys modified in the configuration file.
+        """
+        self.config.apply_external_changes(content, changes)
+
+    def __update_auto_lobby_ui(self) -> None:
+        """
+        Updates the UI elements of the auto lobby feature with the user configuration.
+        """
+        config_auto_lobby: ConfigAutoLobby = self.config.get_feature_configuration(MainFeatures.AUTO_LOBBY)
         self.main_mainfeatures_autolobby_checkbox.setChecked(config_auto_lobby.is_enabled())
-        self.main_mainfeatures_autoqueue_checkbox.setChecked(config_auto_queue.is_enabled())
-        self.main_mainfeatures_autochampionselect_checkbox.setChecked(config_auto_champion_select.is_enabled())
 
         self.main_autolobby_autoselectqueue_checkbox.setChecked(config_auto_lobby.is_auto_select_queue_enabled())
 
@@ -111,24 +159,21 @@ class MainWindow(QMainWindow):
         self.last_first_preference = config_auto_select_roles_positions[0]
         self.last_second_preference = config_auto_select_roles_positions[1]
 
-        self.main_autoqueue_auto_start_queue_checkbox.setChecked(config_auto_queue.is_auto_start_queue_enabled())
-        self.main_autoqueue_auto_accept_match_checkbox.setChecked(config_auto_queue.is_auto_accept_match_enabled())
-
-    def propagate_updated_config(self) -> None:
+    def __update_auto_queue_ui(self) -> None:
         """
-        Called when the user changes the configuration in the main window.
-        Propagates the updated configuration to other parts of the application.
+        Updates the UI elements of the auto queue feature with the user configuration.
         """
-        self.main_autochampionselect_profile_widget.load_config()
-        self.lcuWorker.load_config()
+        config_auto_queue: ConfigAutoQueue = self.config.get_feature_configuration(MainFeatures.AUTO_QUEUE)
+        self.main_mainfeatures_autoqueue_checkbox.setChecked(config_auto_queue.is_enabled())
+        self.main_autoqueue_auto_start_queue_checkbox.setChecked(config_auto_queue.is_auto_start_queue_enabled())
+        self.main_autoqueue_auto_accept_match_checkbox.setChecked(config_auto_queue.is_auto_accept_match_enabled())
 
-    @pyqtSlot()
-    def on_main_autochampionselect_profile_widget_config_updated(self) -> None:
+    def __update_auto_champion_select_ui(self) -> None:
         """
-        Called by the auto champion select profile widget when the user changes its configuration.
+        Updates the UI elements of the auto champion select feature with the user configuration.
         """
-        self.load_config()
-        self.lcuWorker.load_config()
+        config_auto_champion_select: ConfigAutoChampionSelect = self.config.get_feature_configuration(MainFeatures.AUTO_CHAMPION_SELECT)
+        self.main_mainfeatures_autochampionselect_checkbox.setChecked(config_auto_champion_select.is_enabled())
 
     @pyqtSlot(bool)
     def on_main_mainfeatures_autolobby_checkbox_clicked(self, checked: bool) -> None:
@@ -137,7 +182,6 @@ class MainWindow(QMainWindow):
         :param checked: true if the checkbox is checked, false if the checkbox is unchecked.
         """
         self.config.get_feature_configuration(MainFeatures.AUTO_LOBBY).set_enabled(checked)
-        self.propagate_updated_config()
 
     @pyqtSlot(bool)
     def on_main_mainfeatures_autoqueue_checkbox_clicked(self, checked: bool) -> None:
@@ -146,7 +190,6 @@ class MainWindow(QMainWindow):
         :param checked: true if the checkbox is checked, false if the checkbox is unchecked.
         """
         self.config.get_feature_configuration(MainFeatures.AUTO_QUEUE).set_enabled(checked)
-        self.propagate_updated_config()
 
     @pyqtSlot(bool)
     def on_main_mainfeatures_autochampionselect_checkbox_clicked(self, checked: bool) -> None:
@@ -155,7 +198,6 @@ class MainWindow(QMainWindow):
         :param checked: true if the checkbox is checked, false if the checkbox is unchecked.
         """
         self.config.get_feature_configuration(MainFeatures.AUTO_CHAMPION_SELECT).set_enabled(checked)
-        self.propagate_updated_config()
 
     @pyqtSlot(bool)
     def on_main_autolobby_autoselectqueue_checkbox_clicked(self, checked: bool) -> None:
@@ -167,15 +209,42 @@ class MainWindow(QMainWindow):
         if selected_queue_id is None:
             selected_queue_id = 0
         self.config.get_feature_configuration(MainFeatures.AUTO_LOBBY).set_auto_select_queue(selected_queue_id, checked)
-        self.propagate_updated_config()
 
-    @pyqtSlot(str)
-    def on_lcu_worker_update_status(self, status: str) -> None:
+    @pyqtSlot(object)
+    def on_lcu_worker_update_status(self, status: WorkerStatus) -> None:
         """
         Called by the LCU worker thread to update the status text in the UI.
-        :param status: The new status string to display in the main window.
+        :param status: The new status of the LCU worker to display in the main window.
+        """
+        self.last_lcu_worker_status = status
+        self.__update_status_label()
+
+    @pyqtSlot(object)
+    def on_config_write_error(self, error: Exception | None) -> None:
+        """
+        Called by the configuration writer thread when the configuration could not be saved, or when it is saved again.
+        :param error: the exception raised while saving the configuration, or None once it is saved again.
+        """
+        self.last_config_write_error = error
+        self.__update_status_label()
+
+    def __update_status_label(self) -> None:
+        """
+        Updates the status text in the UI, a configuration which could not be saved is shown before the LCU worker status.
+        """
+        if self.last_config_write_error is not None:
+            self.main_status_label.setText("Failed to save configuration, retrying...")
+            self.main_status_label.setToolTip(str(self.last_config_write_error))
+        elif self.last_lcu_worker_status is not None:
+            self.main_status_label.setText(self.last_lcu_worker_status.get_message())
+            self.main_status_label.setToolTip(self.last_lcu_worker_status.get_details())
+
+    @pyqtSlot()
+    def on_main_status_latencies_button_clicked(self) -> None:
+        """
+        Called when the "Latencies..." button is clicked, shows the latencies of the actions sent to the League client.
         """
-        self.main_status_label.setText(status)
+        LatencyDialog(self.lcuWorker.get_action_latencies, self.lcuWorker.dump_action_latencies, self).exec()
 
     @pyqtSlot(list)
     def on_lcuWorker_updateQueues(self, queue_list: list[Queue]) -> None:
@@ -209,7 +278,6 @@ class MainWindow(QMainWindow):
             (self.config.get_feature_configuration(MainFeatures.AUTO_LOBBY)
              .set_auto_select_queue(self.main_autolobby_autoselectqueue_combobox.itemData(index),
                                     self.main_autolobby_autoselectqueue_checkbox.isChecked()))
-            self.propagate_updated_config()
 
     @pyqtSlot(bool)
     def on_main_autolobby_autoselectroles_checkbox_clicked(self, checked: bool) -> None:
@@ -218,7 +286,6 @@ class MainWindow(QMainWindow):
         :param checked: true if the checkbox is checked, false if the checkbox is unchecked.
         """
         self.config.get_feature_configuration(MainFeatures.AUTO_LOBBY).set_auto_select_roles_enabled(checked)
-        self.propagate_updated_config()
 
     @pyqtSlot(int)
     def on_main_autolobby_autoselectroles_firstpreference_combobox_currentIndexChanged(self, index: int) -> None:
@@ -238,8 +305,7 @@ class MainWindow(QMainWindow):
             second_preference = Position.from_index(second_preference_index)
             (self.config.get_feature_configuration(MainFeatures.AUTO_LOBBY)
              .set_auto_select_roles_preferences(first_preference, second_preference))
-            self.propagate_updated_config()
-        self.last_first_preference = first_preference
+            self.last_first_preference = first_preference
 
     @pyqtSlot(int)
     def on_main_autolobby_autoselectroles_secondpreference_combobox_currentIndexChanged(self, index: int) -> None:
@@ -259,8 +325,7 @@ class MainWindow(QMainWindow):
             first_preference = Position.from_index(first_preference_index)
             (self.config.get_feature_configuration(MainFeatures.AUTO_LOBBY)
              .set_auto_select_roles_preferences(first_preference, second_preference))
-            self.propagate_updated_config()
-        self.last_second_preference = second_preference
+            self.last_second_preference = second_preference
 
     @pyqtSlot(bool)
     def on_main_autoqueue_auto_start_queue_checkbox_clicked(self, checked: bool) -> None:
@@ -269,7 +334,6 @@ class MainWindow(QMainWindow):
         :param checked: true if the checkbox is checked, false if the checkbox is unchecked.
         """
         self.config.get_feature_configuration(MainFeatures.AUTO_QUEUE).set_auto_start_queue_enabled(checked)
-        self.propagate_updated_config()
 
     @pyqtSlot(bool)
     def on_main_autoqueue_auto_accept_match_checkbox_clicked(self, checked: bool) -> None:
@@ -278,4 +342,3 @@ class MainWindow(QMainWindow):
         :param checked: true if the checkbox is checked, false if the checkbox is unchecked.
         """
         self.config.get_feature_configuration(MainFeatures.AUTO_QUEUE).set_auto_accept_match_enabled(checked)
-        self.propagate_updated_config()
@@ -0,0 +1,36 @@
+"""
+Helpers shared by the benchmarks to save their results and compare them with the results of a previous run.
+"""
+import json
+import sys
+from typing import Callable
+
+
+def save_results(results: dict, path: str | None) -> None:
+    """
+    Writes the results to a JSON file.
+    :param results: results of the benchmark.
+    :param path: path of the JSON file, or None to not save the results.
+    """
+    if path is None:
+        return
+    with open(path, "w", encoding="utf-8") as results_file:
+        json.dump(results, results_file, indent=2)
+
+
+def check_regressions(results: dict, baseline_path: str | None, compare_results: Callable[[dict, dict, float], list[str]],
+                      tolerance: float) -> None:
+    """
+    Compares the results with the results of a previous run, prints the regressions and exits with 1 if there are any.
+    :param results: results of the benchmark.
+    :param baseline_path: path of the JSON file of the previous results, or None to not compare.
+    :param compare_results: function returning the regressions, called with the previous results, the results and the tolerance.
+    :param tolerance: allowed relative slowdown.
+    """
+    if baseline_path is None:
+        return
+    with open(baseline_path, encoding="utf-8") as baseline_file:
+        regressions = compare_results(json.load(baseline_file), results, tolerance)
+    if len(regressions) > 0:
+        print("\nRegressions :\n" + "\n".join(regressions))
+        sys.exit(1)
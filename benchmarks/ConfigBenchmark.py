@@ -0,0 +1,219 @@
+"""
+Micro-benchmarks of the AutoSummoner configuration, runnable headless (no Qt, no League client needed).
+
+Usage, from the repository root :
+    python -m benchmarks.ConfigBenchmark
+    python -m benchmarks.ConfigBenchmark --sizes 1 100 --backend sqlite --json results.json
+    python -m benchmarks.ConfigBenchmark --compare results.json
+
+Every profile count is measured in its own process and temporary directory, as the configuration state is shared
+by all Configuration instances of a process.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable
+
+from benchmarks.BenchmarkResults import check_regressions, save_results
+
+REPOSITORY_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SIZES = [1, 100, 10000]
+DEFAULT_OVERRIDES = 170
+DEFAULT_ITERATIONS = 200
+QUEUE_IDS = [400, 420, 430, 440, 450, 490, 700, 900]
+
+
+def write_config_file(path: str, profiles_count: int, overrides_count: int) -> None:
+    """
+    Writes an INI configuration file with the given number of profiles, each of them with per-champion overrides.
+    :param path: path of the INI file.
+    :param profiles_count: number of auto champion select profiles.
+    :param overrides_count: number of champions with individual summoner spells and rune in every profile.
+    """
+    with open(path, "w", encoding="utf-8") as config_file:
+        config_file.write("[AutoLobby]\n\n[AutoLobby.AutoSelectQueue]\n\n[AutoLobby.AutoSelectRoles]\n\n")
+        config_file.write("[AutoQueue]\nenabled = True\n\n[AutoChampionSelect]\nenabled = True\n\n")
+        for profile_id in range(profiles_count):
+            config_file.write(f"[AutoChampionSelect.{profile_id}]\n")
+            config_file.write(f"name = Profile {profile_id}\n")
+            config_file.write(f"queues = {QUEUE_IDS[profile_id % len(QUEUE_IDS)]}\n")
+            config_file.write(f"positions = {profile_id % 5}\n")
+            config_file.write("champions_ban = 1,2,3\nchampions_pick = 4,5,6,7,8\n")
+            config_file.write("summoner_spell_1_global = 4\nsummoner_spell_2_global = 14\n")
+            config_file.write("summoner_spells_unique_per_champion = True\nrune_global = 1\nrunes_unique_per_champion = True\n")
+            for champion_id in range(1, overrides_count + 1):
+                config_file.write(f"summoner_spell_1_{champion_id} = 4\nsummoner_spell_2_{champion_id} = 7\n")
+                config_file.write(f"rune_{champion_id} = {champion_id % 10}\n")
+            config_file.write("\n")
+
+
+def measure(function: Callable[[int], object], iterations: int) -> dict[str, float]:
+    """
+    :param function: function to measure, called with the iteration number.
+    :param iterations: number of calls.
+    :return: latency percentiles of the function, in microseconds.
+    """
+    durations = []
+    for iteration in range(iterations):
+        start = time.perf_counter_ns()
+        function(iteration)
+        durations.append((time.perf_counter_ns() - start) / 1000)
+    durations.sort()
+    percentiles = statistics.quantiles(durations, n=100, method="inclusive") if len(durations) > 1 else durations * 99
+    return {"p50": percentiles[49], "p90": percentiles[89], "p99": percentiles[98], "max": durations[-1]}
+
+
+def run_worker(profiles_count: int, overrides_count: int, iterations: int) -> dict:
+    """
+    Runs all the benchmarks for one profile count, in the current directory.
+    :param profiles_count: number of auto champion select profiles.
+    :param overrides_count: number of per-champion overrides of every profile.
+    :param iterations: number of measured calls of every benchmark.
+    :return: the results of the benchmarks, by name.
+    """
+    # pylint: disable=import-outside-toplevel
+    from AutoSummoner.Config.Configuration import Configuration
+    from AutoSummoner.Config.MainFeatures import MainFeatures
+
+    write_config_file(Configuration.INI_PATH, profiles_count, overrides_count)
+    if os.environ.get(Configuration.BACKEND_ENVIRONMENT_VARIABLE, "").lower() == "sqlite":
+        from AutoSummoner.Config.Backends.SqliteConfigBackend import SqliteConfigBackend
+        SqliteConfigBackend(Configuration.SQLITE_PATH).import_ini(Configuration.INI_PATH)
+
+    results = {}
+    start = time.perf_counter()
+    config = Configuration()
+    results["load_ms"] = (time.perf_counter() - start) * 1000
+
+    config_auto_champion_select = config.get_feature_configuration(MainFeatures.AUTO_CHAMPION_SELECT)
+    profiles = config_auto_champion_select.get_all_profiles()
+    profile = profiles[-1]
+
+    results["get_champions_pick_id"] = measure(lambda i: profile.get_champions_pick_id(), iterations)
+    results["get_summoner_spells_id_per_champion_id"] = measure(
+        lambda i: profile.get_summoner_spells_id_per_champion_id(i % overrides_count + 1), iterations)
+    results["get_rune_id_per_champion"] = measure(lambda i: profile.get_rune_id_per_champion(i % overrides_count + 1), iterations)
+    results["get_all_summoner_spells_id_per_champion_id"] = measure(
+        lambda i: profile.get_all_summoner_spells_id_per_champion_id(), iterations)
+
+    results["find_profile_config"] = measure(
+        lambda i: config_auto_champion_select.find_profile_config(QUEUE_IDS[i % len(QUEUE_IDS)], "TOP"), iterations)
+    snapshot = config.get_snapshot().get_feature_configuration(MainFeatures.AUTO_CHAMPION_SELECT)
+    results["snapshot_find_profile_config"] = measure(
+        lambda i: snapshot.find_profile_config(QUEUE_IDS[i % len(QUEUE_IDS)], "TOP"), iterations)
+
+    # Setters save the configuration, the storage is written later in the background
+    results["set_rune_id_per_champion"] = measure(
+        lambda i: profile.set_rune_id_per_champion(i % overrides_count + 1, i), iterations)
+    config.flush()
+
+    results.update(measure_saves(config, profile, max(1, iterations // 10)))
+    results["storage_bytes"] = sum(os.path.getsize(path) for path in os.listdir(".") if path.startswith("config."))
+    return results
+
+
+def measure_saves(config, profile, iterations: int) -> dict:
+    """
+    Measures saving a profile modification and waiting for it to be written.
+    :param config: the Configuration object.
+    :param profile: the auto champion select profile to modify.
+    :param iterations: number of measured saves.
+    :return: the latency percentiles of the saves and the number of bytes per write.
+    """
+    write_statistics_before = config.get_write_statistics()
+
+    def save_and_flush(iteration: int) -> None:
+        profile.set_champions_pick_id([4, 5, 6, 7, iteration])
+        config.flush()
+
+    save_config_flush = measure(save_and_flush, iterations)
+    write_statistics_after = config.get_write_statistics()
+    writes = write_statistics_after["writes"] - write_statistics_before["writes"]
+    return {"save_config_flush": save_config_flush,
+            "bytes_per_write": (write_statistics_after["bytes"] - write_statistics_before["bytes"]) / max(1, writes)}
+
+
+def run(profiles_count: int, overrides_count: int, iterations: int, backend: str) -> dict:
+    """
+    Runs the benchmarks for one profile count in a new process and a temporary directory.
+    :param profiles_count: number of auto champion select profiles.
+    :param overrides_count: number of per-champion overrides of every profile.
+    :param iterations: number of measured calls of every benchmark.
+    :param backend: configuration backend, "ini" or "sqlite".
+    :return: the results of the benchmarks, by name.
+    """
+    environment = dict(os.environ, PYTHONPATH=REPOSITORY_PATH, AUTOSUMMONER_CONFIG_BACKEND=backend)
+    with tempfile.TemporaryDirectory() as directory:
+        output = subprocess.run([sys.executable, "-m", "benchmarks.ConfigBenchmark", "--worker",
+                                 "--sizes", str(profiles_count), "--overrides", str(overrides_count),
+                                 "--iterations", str(iterations)],
+                                cwd=directory, env=environment, check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def print_results(all_results: dict[str, dict]) -> None:
+    """
+    Prints the results of the benchmarks as a table.
+    :param all_results: results of the benchmarks, by profile count.
+    """
+    for profiles_count, results in all_results.items():
+        print(f"\n{profiles_count} profiles : load {results['load_ms']:.1f} ms, "
+              f"{results['bytes_per_write']:.0f} bytes per write, {results['storage_bytes']} bytes stored")
+        print(f"  {'benchmark (us)':<44}{'p50':>12}{'p90':>12}{'p99':>12}{'max':>12}")
+        for name, result in results.items():
+            if isinstance(result, dict):
+                print(f"  {name:<44}" + "".join(f"{result[key]:>12.1f}" for key in ("p50", "p90", "p99", "max")))
+
+
+def compare_results(baseline: dict[str, dict], all_results: dict[str, dict], tolerance: float) -> list[str]:
+    """
+    :param baseline: results of a previous run, by profile count.
+    :param all_results: results of this run, by profile count.
+    :param tolerance: allowed relative slowdown of the median latency and of the bytes written.
+    :return: the list of regressions.
+    """
+    regressions = []
+    for profiles_count, results in all_results.items():
+        for name, result in results.items():
+            previous_result = baseline.get(profiles_count, {}).get(name)
+            if previous_result is None:
+                continue
+            value = result["p50"] if isinstance(result, dict) else result
+            previous_value = previous_result["p50"] if isinstance(previous_result, dict) else previous_result
+            if previous_value > 0 and value > previous_value * (1 + tolerance):
+                regressions.append(f"{profiles_count} profiles, {name} : {previous_value:.1f} -> {value:.1f}")
+    return regressions
+
+
+def main() -> None:
+    """
+    Command line interface of the benchmarks.
+    """
+    argument_parser = argparse.ArgumentParser(description="Runs the AutoSummoner configuration benchmarks.")
+    argument_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="numbers of profiles")
+    argument_parser.add_argument("--overrides", type=int, default=DEFAULT_OVERRIDES, help="per-champion overrides of every profile")
+    argument_parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="measured calls of every benchmark")
+    argument_parser.add_argument("--backend", choices=["ini", "sqlite"], default="ini", help="configuration backend")
+    argument_parser.add_argument("--json", help="file the results are written to")
+    argument_parser.add_argument("--compare", help="results of a previous run to compare with, exits with 1 on regressions")
+    argument_parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown when comparing")
+    argument_parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    arguments = argument_parser.parse_args()
+
+    if arguments.worker:
+        print(json.dumps(run_worker(arguments.sizes[0], arguments.overrides, arguments.iterations)))
+        return
+
+    all_results = {str(size): run(size, arguments.overrides, arguments.iterations, arguments.backend) for size in arguments.sizes}
+    print_results(all_results)
+    save_results(all_results, arguments.json)
+    check_regressions(all_results, arguments.compare, compare_results, arguments.tolerance)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""
+Load and integration test of the LCU worker against a local mock of the League client (no League client needed).
+
+The worker takes its decisions with the configuration of the current directory and stores its League client cache there,
+like AutoSummoner.
+Scenarios :
+    game     the mock creates a lobby and starts the matchmaking, the worker is expected to accept the ready check,
+             ban and pick, then to requeue if auto lobby is configured (games are played until the duration is over)
+    storm    champion select updates are sent at the given rate
+    <file>   a JSON list of steps ({"delay", "uri", "type", "data"}) or an event log recorded with AUTOSUMMONER_EVENT_LOG
+
+Usage, from the repository root :
+    python -m benchmarks.LcuLoadTest --scenario game --duration 10 --latency 5
+    python -m benchmarks.LcuLoadTest --scenario storm --rate 5000 --duration 5 --json results.json
+    python -m benchmarks.LcuLoadTest --scenario session.jsonl.gz
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from AutoSummoner.LcuInterface.LcuWorker import LcuWorker
+from AutoSummoner.LcuInterface.Mock.MockLcuConnection import MockLcuConnection
+from AutoSummoner.LcuInterface.Mock.MockLcuServer import MockLcuServer
+from AutoSummoner.LcuInterface.Mock.MockLcuSettings import MockLcuSettings
+from AutoSummoner.LcuInterface.Replay.EventReplayer import EventReplayer
+from benchmarks.BenchmarkResults import save_results
+
+DEFAULT_QUEUE_ID = 420
+
+
+def load_steps(path: str) -> list[dict]:
+    """
+    :param path: path of a JSON list of steps or of a recorded event log (.gz).
+    :return: the steps of the scenario.
+    """
+    if not path.endswith(".gz"):
+        with open(path, encoding="utf-8") as steps_file:
+            return json.load(steps_file)
+
+    steps = []
+    previous_time = None
+    for event in EventReplayer.read_events(path):
+        steps.append({"delay": event["time"] - previous_time if previous_time is not None else 0,
+                      "uri": event["uri"], "type": event["type"], "data": event["data"]})
+        previous_time = event["time"]
+    return steps
+
+
+async def run(scenario: str, rate: float, duration: float, settings: MockLcuSettings) -> dict:
+    """
+    :param scenario: "game", "storm" or the path of a scenario file.
+    :param rate: champion select updates per second of the storm scenario.
+    :param duration: duration (in seconds) of the game and storm scenarios.
+    :param settings: timings and behavior of the mock League client.
+    :return: the statistics of the mock, of the connection and of the worker.
+    """
+    server = MockLcuServer(settings)
+    await server.start()
+    connection = MockLcuConnection(server.get_url())
+    await connection.open()
+    listen_task = None
+    try:
+        worker = LcuWorker()
+        worker.setup_event_processing()
+        subscribed = asyncio.Event()
+        listen_task = asyncio.ensure_future(connection.listen(worker.get_event_handlers(), subscribed))
+        await subscribed.wait()
+        await worker.connect(connection)
+
+        start = time.perf_counter()
+        if scenario == "game":
+            await server.start_game(DEFAULT_QUEUE_ID)
+            await asyncio.sleep(duration)
+        elif scenario == "storm":
+            await server.champion_select_storm(DEFAULT_QUEUE_ID, rate, duration)
+        else:
+            await server.play(load_steps(scenario))
+        scenario_duration = time.perf_counter() - start
+    finally:
+        await server.stop()
+        if listen_task is not None:
+            await asyncio.gather(listen_task, return_exceptions=True)
+        await connection.close()
+
+    return {"duration": scenario_duration,
+            "events_received": connection.get_events_received(),
+            "events_per_second": connection.get_events_received() / scenario_duration if scenario_duration > 0 else 0.0,
+            "server": server.get_statistics(),
+            "champion_select": worker.get_champion_select_statistics(),
+            "gameflow": worker.get_gameflow_statistics(),
+            "request_lanes": worker.get_request_lane_statistics(),
+            "action_scheduler": worker.get_action_scheduler_statistics(),
+            "single_commit_supported": worker.is_single_commit_supported(),
+            "requeue_latencies_ms": worker.get_requeue_latencies(),
+            "status": worker.get_status_statistics(),
+            "action_latencies": {action: stages["total"] for action, stages in worker.get_action_latencies().items()}}
+
+
+def print_results(results: dict) -> None:
+    """
+    :param results: results of the load test.
+    """
+    print(f"{results['events_received']} events received in {results['duration']:.3f} s, {results['events_per_second']:.0f} events/s")
+    print(f"champion select : {results['champion_select']}")
+    print(f"action scheduler : {results['action_scheduler']}, single commit supported : {results['single_commit_supported']}")
+    print(f"status : {results['status']}")
+    print("requests :")
+    for request, count in sorted(results["server"]["requests"].items()):
+        print(f"  {count:>6}  {request}")
+    print("gameflow transitions :")
+    for transition, entry in results["gameflow"]["transitions"].items():
+        print(f"  {transition:<36} {entry['count']:>6} x, last {entry['last_ms']:.1f} ms")
+    for lane, statistics in results["request_lanes"].items():
+        print(f"lane {lane:<10} {statistics['requests']:>6} requests, {statistics['queued']:>6} queued, max wait {statistics['max_wait_ms']:.1f} ms")
+    for action, histogram in sorted(results["action_latencies"].items()):
+        print(f"  {action:<20} {histogram['count']:>6} x, total p50 {histogram['p50_ms']:.0f} ms, p99 {histogram['p99_ms']:.0f} ms, "
+              f"max {histogram['max_ms']:.1f} ms")
+    if results["requeue_latencies_ms"]:
+        print(f"requeue latencies (ms) : {', '.join(f'{latency:.0f}' for latency in results['requeue_latencies_ms'])}")
+
+
+def main() -> None:
+    """
+    Command line interface of the load test.
+    """
+    argument_parser = argparse.ArgumentParser(description="Runs the LCU worker against a mock League client.")
+    argument_parser.add_argument("--scenario", default="game", help="game, storm or the path of a scenario file")
+    argument_parser.add_argument("--rate", type=float, default=1000, help="champion select updates per second of the storm scenario")
+    argument_parser.add_argument("--duration", type=float, default=5, help="duration of the game and storm scenarios, in seconds")
+    argument_parser.add_argument("--latency", type=float, default=0, help="latency of the mock League client, in milliseconds")
+    argument_parser.add_argument("--jitter", type=float, default=0, help="maximum random latency added to the latency, in milliseconds")
+    argument_parser.add_argument("--two-step-commit", action="store_true", help="the mock does not complete actions with a single PATCH")
+    argument_parser.add_argument("--json", help="file the results are written to")
+    arguments = argument_parser.parse_args()
+
+    settings = MockLcuSettings(latency=arguments.latency / 1000, jitter=arguments.jitter / 1000, single_commit=not arguments.two_step_commit)
+    results = asyncio.run(run(arguments.scenario, arguments.rate, arguments.duration, settings))
+    print_results(results)
+    save_results(results, arguments.json)
+
+
+if __name__ == '__main__':
+    main()
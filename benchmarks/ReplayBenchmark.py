@@ -0,0 +1,104 @@
+"""
+Replays recorded League client event logs into the LCU worker, against a fake connection (no League client needed).
+
+Event logs are recorded by running AutoSummoner with the AUTOSUMMONER_EVENT_LOG environment variable set to the path
+of the log (gzip compressed JSON lines). The configuration of the current directory is used to take the decisions.
+
+Usage, from the repository root :
+    python -m benchmarks.ReplayBenchmark session.jsonl.gz
+    python -m benchmarks.ReplayBenchmark session.jsonl.gz --speed 10 --latency 5 --json results.json
+    python -m benchmarks.ReplayBenchmark session.jsonl.gz --compare results.json
+"""
+import argparse
+import asyncio
+from collections import Counter
+
+from AutoSummoner.LcuInterface.LcuWorker import LcuWorker
+from AutoSummoner.LcuInterface.Replay.EventReplayer import EventReplayer
+from AutoSummoner.LcuInterface.Replay.FakeConnection import FakeConnection
+from benchmarks.BenchmarkResults import check_regressions, save_results
+
+DEFAULT_DRAIN = 1.0
+
+
+async def replay(path: str, speed: float, latency: float, drain: float) -> dict:
+    """
+    :param path: path of the event log.
+    :param speed: replay speed factor, 0 to replay as fast as possible.
+    :param latency: latency (in seconds) of the fake connection.
+    :param drain: time (in seconds) given to the scheduled actions once every event was replayed.
+    :return: the replay statistics, the requests sent by the worker and the statistics of the worker.
+    """
+    worker = LcuWorker()
+    worker.setup_event_processing()
+    connection = FakeConnection(latency)
+    results = await EventReplayer(worker.get_event_handlers(), connection, speed).replay(EventReplayer.read_events(path))
+    await asyncio.sleep(drain)
+
+    requests = connection.get_requests()
+    results["requests"] = len(requests)
+    results["requests_per_endpoint"] = dict(Counter(f"{method} {endpoint}" for _, method, endpoint, _ in requests))
+    results["champion_select"] = worker.get_champion_select_statistics()
+    results["action_scheduler"] = worker.get_action_scheduler_statistics()
+    results["status"] = worker.get_status_statistics()
+    results["action_latencies"] = {action: stages["total"] for action, stages in worker.get_action_latencies().items()}
+    return results
+
+
+def print_results(results: dict) -> None:
+    """
+    :param results: results of the replay.
+    """
+    print(f"{results['events']} events replayed ({results['skipped']} without handler) in {results['duration']:.3f} s, "
+          f"{results['events_per_second']:.0f} events/s, "
+          f"{results['handling_duration'] * 1e6 / max(results['events'], 1):.1f} us per event in the handlers")
+    print(f"{results['requests']} requests sent :")
+    for request, count in sorted(results["requests_per_endpoint"].items()):
+        print(f"  {count:>6}  {request}")
+    print(f"champion select : {results['champion_select']}")
+    print(f"action scheduler : {results['action_scheduler']}")
+    print(f"status : {results['status']}")
+    for action, histogram in sorted(results["action_latencies"].items()):
+        print(f"  {action:<20} total p50 {histogram['p50_ms']:.0f} ms, p99 {histogram['p99_ms']:.0f} ms, max {histogram['max_ms']:.1f} ms")
+
+
+def compare_results(baseline: dict, results: dict, tolerance: float) -> list[str]:
+    """
+    :param baseline: results of a previous replay of the same log.
+    :param results: results of this replay.
+    :param tolerance: allowed relative slowdown of the event throughput.
+    :return: the list of regressions, including the changes of the requests sent.
+    """
+    regressions = []
+    if results["events_per_second"] < baseline["events_per_second"] / (1 + tolerance):
+        regressions.append(f"events per second : {baseline['events_per_second']:.0f} -> {results['events_per_second']:.0f}")
+    for request in sorted(set(baseline["requests_per_endpoint"]) | set(results["requests_per_endpoint"])):
+        previous_count = baseline["requests_per_endpoint"].get(request, 0)
+        count = results["requests_per_endpoint"].get(request, 0)
+        if count != previous_count:
+            regressions.append(f"{request} : {previous_count} -> {count} requests")
+    return regressions
+
+
+def main() -> None:
+    """
+    Command line interface of the replay benchmark.
+    """
+    argument_parser = argparse.ArgumentParser(description="Replays a League client event log into the LCU worker.")
+    argument_parser.add_argument("log", help="event log recorded with AUTOSUMMONER_EVENT_LOG")
+    argument_parser.add_argument("--speed", type=float, default=0, help="replay speed factor, 0 to replay as fast as possible")
+    argument_parser.add_argument("--latency", type=float, default=0, help="latency of the fake League client, in milliseconds")
+    argument_parser.add_argument("--drain", type=float, default=DEFAULT_DRAIN, help="seconds given to the scheduled actions after the replay")
+    argument_parser.add_argument("--json", help="file the results are written to")
+    argument_parser.add_argument("--compare", help="results of a previous replay to compare with, exits with 1 on regressions")
+    argument_parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown when comparing")
+    arguments = argument_parser.parse_args()
+
+    results = asyncio.run(replay(arguments.log, arguments.speed, arguments.latency / 1000, arguments.drain))
+    print_results(results)
+    save_results(results, arguments.json)
+    check_regressions(results, arguments.compare, compare_results, arguments.tolerance)
+
+
+if __name__ == '__main__':
+    main()